@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 from core.security import verify_token  #
 from models.user import UserCreate, UserLogin, Token, UserResponse
@@ -7,17 +7,19 @@ from crud.user import get_user_by_email, create_user, authenticate_user
 from core.security import create_access_token , get_current_user
 from core.config import settings
 from utils.response import standardize_response
+from core.responses import CompactResponse, CompactRoute
 from database import get_db
 from fastapi.security import OAuth2PasswordBearer
 from models.models import User
+from core.logger import logger
 
-router = APIRouter()
+router = APIRouter(route_class=CompactRoute, default_response_class=CompactResponse)
 
 
 @router.post("/register")
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     # Check if user already exists
-    existing_user = get_user_by_email(db, user_data.email)
+    existing_user = await get_user_by_email(db, user_data.email)
     if existing_user:
         return standardize_response(
             success=False,
@@ -26,7 +28,7 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
 
     # Create new user
-    user = create_user(
+    user = await create_user(
         db=db,
         name=user_data.name,
         email=user_data.email,
@@ -53,16 +55,16 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
 
 @router.get("/me")
-def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: User = Depends(get_current_user)):
     return {
         "name": current_user.name,
         "email": current_user.email
     }
 
 @router.post("/login")
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
     # Authenticate user
-    user = authenticate_user(db, user_data.email, user_data.password)
+    user = await authenticate_user(db, user_data.email, user_data.password)
     if not user:
         return standardize_response(
             success=False,
@@ -92,7 +94,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
 @router.post("/logout")
-def logout(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def logout(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
     """
     Logout endpoint (stateless):
     - Client should delete the access token locally
@@ -109,7 +111,7 @@ def logout(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
             )
 
         # Optional: log or track logout event here
-        print(f"[Logout] User {user_email} has logged out")
+        logger.info("User %s has logged out", user_email)
 
         return standardize_response(
             success=True,
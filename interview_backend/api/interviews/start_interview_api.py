@@ -1,77 +1,121 @@
 import asyncio
-import traceback
+import contextlib
+import json
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from models.interview import UnifiedInterviewRequest, InterviewResponse, InterviewModel
+from models.interview import (
+    UnifiedInterviewRequest, InterviewResponse, InterviewModel, InterviewState,
+    InterviewTurnRequest, InterviewTurnResponse, PerformanceStats, UserStatsResponse
+)
 from models.pdf_feedback import InterviewPDFFeedback
-from models.models import User
+from models.models import User, SessionType, DifficultyLevel
 
 from graph import InterviewEngine
-from database import get_db
+from database import get_db, AsyncSessionLocal
 from core.security import get_current_user
-from core.pdf_render import render_feedback_html
 from core.email_sender import send_email_with_pdf
-from core.pdf_gen import html_to_pdf
-from nodes.feedback_nodes import generate_unified_pdf_feedback
-from services.ai.base import LLMBase
+from core.mail_outbox import outbox_worker
+from core.pdf_pool import pdf_pool, PDFQueueFull
+from core.responses import CompactResponse, CompactRoute
+from crud.performance import get_rollups, summarize
+from nodes.feedback_nodes import generate_unified_pdf_feedback, evaluations_for
+from services.ai.client import llm_clients
+from services.feedback_cache import feedback_cache, feedback_key
+from services.session_service import SessionService, session_lock
+from core.logger import get_logger
 
+log = get_logger("api.interview")
 
-router = APIRouter()
+
+router = APIRouter(route_class=CompactRoute, default_response_class=CompactResponse)
 interview_engine = InterviewEngine()
 
 
+def _new_session_state(user_id: int, session_type, level) -> InterviewModel:
+    return InterviewModel(
+        session_id=str(uuid4()),
+        user_id=user_id,
+        session_type=session_type,
+        level=level,
+        current_question_index=0,
+        total_questions=0,
+        session_status="not_done",
+        q_a_pair=[],
+        asked_question_ids=[],
+        asked_llm_questions=[],
+        current_question=None,
+        feedback=None,
+        latest_answer=None
+    )
+
+
+def _completion_message(state: InterviewModel) -> str:
+    feedback_dict = state.feedback if isinstance(state.feedback, dict) else {}
+    return feedback_dict.get("summary", "Interview completed")
+
+
+def _caller_id(claimed_user_id: Optional[int], current_user: User) -> int:
+    """The authenticated user; a user_id in the body is only accepted if it is the same user."""
+    if claimed_user_id is not None and claimed_user_id != current_user.id:
+        raise HTTPException(403, "user_id does not match the signed-in user")
+    return current_user.id
+
+
+async def _load_for_turn(sessions: SessionService, session_id: str, user_id: int,
+                         version: Optional[int] = None) -> InterviewModel:
+    """
+    The stored state of a session that is about to take a turn; call it with
+    session_lock(session_id) held. user_id is the authenticated caller, who
+    must own the session. The client only ever supplies the answer, never
+    the state the turn runs on.
+    """
+    state = await sessions.load_state(session_id)
+    if state is None:
+        raise HTTPException(404, "Session not found")
+    if state.user_id != user_id:
+        raise HTTPException(403, "Session belongs to another user")
+    if state.session_status == "done":
+        raise HTTPException(409, "Interview already completed")
+    if version is not None and version != state.version:
+        raise HTTPException(409, "Stale session version")
+    return state
+
+
+async def _persist(sessions: SessionService, state: InterviewModel) -> InterviewModel:
+    state.version += 1
+    await sessions.save_state(state)
+    return state
+
+
 @router.post("/interview", response_model=InterviewResponse)
 async def unified_interview(
     request: UnifiedInterviewRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
 ):
     try:
-        print("\n🌐 === UNIFIED INTERVIEW API START ===")
+        sessions = SessionService(db)
 
-        # Convert dict to InterviewModel if needed
-        state = InterviewModel(**request.state) if isinstance(request.state, dict) else request.state
-        print(f"🔍 Received state: {state}  ")
-        print(type(state))
+        state = request.state
+        user_id = _caller_id(state.user_id, current_user)
 
         if not state.session_id:
-            print("🆕 Starting new interview…")
+            if not state.session_type or not state.level:
+                raise HTTPException(400, "Missing session_type or level")
 
-            if not state.user_id or not state.session_type or not state.level:
-                raise HTTPException(400, "Missing user_id, session_type, or level")
+            initial_state = _new_session_state(user_id, state.session_type, state.level)
 
-            user_exists = await asyncio.to_thread(
-                lambda: db.query(User).filter(User.id == state.user_id).first()
-            )
-            if not user_exists:
-                raise HTTPException(404, "User not found")
-
-            initial_state = InterviewModel(
-                session_id=str(uuid4()),
-                user_id=state.user_id,
-                session_type=state.session_type,
-                level=state.level,
-                current_question_index=0,
-                total_questions=0,
-                session_status="not_done",
-                q_a_pair=[],
-                asked_question_ids=[],
-                asked_llm_questions=[],
-                current_question=None,
-                feedback=None,
-                latest_answer=None
-            )
-
-            print(f"🟢 Initialized session_id: {initial_state.session_id}")
-            print("⚙️ Running init step…")
+            log.info("Starting interview session_id=%s", initial_state.session_id)
 
             # Await async run_step directly
             new_state = await interview_engine.run_step(initial_state, db=db, first_call=True)
+            await _persist(sessions, new_state)
 
             return InterviewResponse(
                 message=new_state.current_question or "Interview started",
@@ -79,14 +123,15 @@ async def unified_interview(
                 state=new_state
             )
 
-        print(f"🔁 Continuing interview with session_id: {state.session_id}")
-
-        new_state = await interview_engine.run_step(state, db=db, first_call=False)
+        # the stored session is authoritative; the client's copy only contributes its answer
+        async with session_lock(state.session_id):
+            stored = await _load_for_turn(sessions, state.session_id, user_id, state.version)
+            stored.latest_answer = state.latest_answer
+            new_state = await interview_engine.run_step(stored, db=db, first_call=False)
+            await _persist(sessions, new_state)
 
         if new_state.session_status == "done":
-            feedback_dict = new_state.feedback if isinstance(new_state.feedback, dict) else {}
-            msg = feedback_dict.get("summary", "Interview completed")
-            return InterviewResponse(message=msg, done=True, state=new_state)
+            return InterviewResponse(message=_completion_message(new_state), done=True, state=new_state)
 
         return InterviewResponse(
             message=new_state.current_question or "Next question",
@@ -94,76 +139,263 @@ async def unified_interview(
             state=new_state
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ Error: {e}")
+        log.exception("Interview step failed: %s", e)
         raise HTTPException(500, "Internal error during interview step.")
-    
+
+
+@router.post("/turn", response_model=InterviewTurnResponse)
+async def interview_turn(
+    request: InterviewTurnRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Delta variant of /interview: the state lives server-side in
+    InterviewSession.state, so each turn only carries session_id,
+    the last seen version and the latest answer.
+    """
+    sessions = SessionService(db)
+    try:
+        user_id = _caller_id(request.user_id, current_user)
+        if not request.session_id:
+            if not request.session_type or not request.level:
+                raise HTTPException(400, "Missing session_type or level")
+
+            initial_state = _new_session_state(user_id, request.session_type, request.level)
+            new_state = await interview_engine.run_step(initial_state, db=db, first_call=True)
+            await _persist(sessions, new_state)
+        else:
+            async with session_lock(request.session_id):
+                state = await _load_for_turn(sessions, request.session_id, user_id, request.version)
+                state.latest_answer = request.latest_answer
+                new_state = await interview_engine.run_step(state, db=db, first_call=False)
+                await _persist(sessions, new_state)
+
+        done = new_state.session_status == "done"
+        return InterviewTurnResponse(
+            session_id=new_state.session_id,
+            version=new_state.version,
+            message=_completion_message(new_state) if done else (new_state.current_question or "Next question"),
+            done=done,
+            question_index=new_state.current_question_index,
+            total_questions=new_state.total_questions,
+            feedback=new_state.feedback if done else None
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        log.exception("Interview step failed: %s", e)
+        raise HTTPException(500, "Internal error during interview step.")
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/interview/stream")
+async def unified_interview_stream(
+    request: UnifiedInterviewRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Server-Sent Events variant of /interview for time-to-first-byte.
+
+    Events:
+    - token: {"text": ...} chunks of an LLM-generated question as they arrive
+    - feedback: partial feedback while the final evaluation is generated
+    - done: the complete InterviewResponse (same shape as /interview); always authoritative,
+      since a streamed question can still be rejected as a duplicate and replaced
+    - error: {"detail": ...} if the step failed after streaming started
+    """
+    state = request.state
+    user_id = _caller_id(state.user_id, current_user)
+    first_call = not state.session_id
+    if first_call:
+        if not state.session_type or not state.level:
+            raise HTTPException(400, "Missing session_type or level")
+        state = _new_session_state(user_id, state.session_type, state.level)
+    else:
+        # fail fast with a proper status code; the stream checks again under the session lock
+        async with session_lock(state.session_id):
+            await _load_for_turn(SessionService(db), state.session_id, user_id, state.version)
+
+    async def event_stream():
+        # The request-scoped session is released once the handler returns,
+        # so the stream runs on its own session
+        async with AsyncSessionLocal() as stream_db:
+            sessions = SessionService(stream_db)
+            try:
+                async with contextlib.nullcontext() if first_call else session_lock(state.session_id):
+                    step_state = state
+                    if not first_call:
+                        step_state = await _load_for_turn(sessions, state.session_id, user_id, state.version)
+                        step_state.latest_answer = state.latest_answer
+
+                    new_state = None
+                    async for kind, payload in interview_engine.run_step_stream(
+                        step_state, db=stream_db, first_call=first_call
+                    ):
+                        if kind == "token":
+                            yield _sse("token", {"text": payload})
+                        elif kind == "feedback":
+                            yield _sse("feedback", payload)
+                        else:
+                            new_state = payload
+
+                    await _persist(sessions, new_state)
+                done = new_state.session_status == "done"
+                response = InterviewResponse(
+                    message=_completion_message(new_state) if done else (new_state.current_question or "Next question"),
+                    done=done,
+                    state=new_state
+                )
+                yield _sse("done", response.model_dump(mode="json"))
+            except HTTPException as e:
+                yield _sse("error", {"detail": e.detail})
+            except Exception as e:
+                log.exception("Streaming interview step failed: %s", e)
+                yield _sse("error", {"detail": "Internal error during interview step."})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/stats", response_model=UserStatsResponse)
+async def user_stats(
+    session_type: Optional[SessionType] = None,
+    level: Optional[DifficultyLevel] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Progress of the current user, served from the PerformanceRollup rows that
+    generate_feedback_node keeps up to date; no session history is read.
+    """
+    rows = await get_rollups(db, current_user.id, session_type, level)
+    breakdown = [
+        PerformanceStats(
+            session_type=row.session_type,
+            level=row.level,
+            sessions=row.sessions,
+            best_score=row.best_score,
+            last_session_at=row.last_session_at,
+            **summarize(row.sessions, row.score_sum, row.score_sq_sum)
+        )
+        for row in rows
+    ]
+    # sums combine exactly across rows, so the totals need no extra query
+    overall = PerformanceStats(
+        sessions=sum(row.sessions for row in rows),
+        best_score=max((row.best_score for row in rows if row.best_score is not None), default=None),
+        last_session_at=max((row.last_session_at for row in rows if row.last_session_at), default=None),
+        **summarize(
+            sum(row.sessions for row in rows),
+            sum(row.score_sum for row in rows),
+            sum(row.score_sq_sum for row in rows)
+        )
+    )
+    return UserStatsResponse(user_id=current_user.id, overall=overall, breakdown=breakdown)
+
+
 @router.post("/send_feedback_email")
 async def send_feedback_email(
-    state: InterviewModel,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    state: InterviewState,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     try:
-        print("📥 Received state:", state.dict() if hasattr(state, "dict") else state)
-
-        # 1️⃣ Ensure q_a_pair is safe
-        safe_qa_list = [
-            {"question": qa.get("question", "N/A"), "answer": qa.get("answer", "N/A")}
-            for qa in state.q_a_pair
-        ]
-        print("✅ Safe QA List prepared:", safe_qa_list)
-
-        # 2️⃣ Get current user info
-        interviewer_name = current_user.name
-        user_email = current_user.email
-        print(f"👤 Sending feedback to: {user_email} (Interviewer: {interviewer_name})")
-
-        # 3️⃣ Current date & time
-        current_date = datetime.now().strftime("%d-%m-%Y")
-        current_time = datetime.now().strftime("%H:%M:%S")
-        print(f"📅 Date: {current_date}, 🕒 Time: {current_time}")
-
-        # 4️⃣ Initialize LLM
-        llm_base = LLMBase()
-        print("⚙️ LLM initialization status:", llm_base.is_ready())
-        if not llm_base.is_ready():
-            raise HTTPException(status_code=503, detail="AI service not available")
-
-        # 5️⃣ Generate structured feedback
-        print("🤖 Generating feedback...")
-        feedback: InterviewPDFFeedback = await generate_unified_pdf_feedback(
-            experience=state.level or "N/A",
-            qa_list=safe_qa_list,
-            llm=llm_base.llm
-        )
-        print("✅ Feedback generated:", feedback)
+        if not state.session_id:
+            return await _send_feedback_report(state, db, current_user, sessions=None)
+        # serialise reports for one session so a repeated request reuses the first one's results
+        async with session_lock(state.session_id):
+            return await _send_feedback_report(state, db, current_user, sessions=SessionService(db))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        log.exception("Error generating or sending feedback: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error generating or sending feedback: {str(e)}")
+
+
+async def _send_feedback_report(state: InterviewState, db: AsyncSession, current_user: User, sessions):
+    # The persisted session is authoritative: it carries the evaluations and
+    # cached feedback from the interview itself. A transcript that is not a
+    # stored session of this user starts without any evaluations.
+    stored = await sessions.load_state(state.session_id) if sessions else None
+    if stored is not None and stored.user_id == current_user.id:
+        state = stored
+    else:
+        stored = None
+        state = InterviewModel(**state.model_dump())
+
+    # 1️⃣ Ensure q_a_pair is safe
+    safe_qa_list = [
+        {"question": qa.get("question", "N/A"), "answer": qa.get("answer", "N/A")}
+        for qa in state.q_a_pair
+    ]
+
+    # 2️⃣ Get current user info
+    interviewer_name = current_user.name
+    user_email = current_user.email
+    log.info("Preparing feedback report for %s (%d Q&A pairs)", user_email, len(safe_qa_list))
 
-        # 6️⃣ Render HTML -> PDF
-        print("📝 Rendering HTML for PDF...")
-        html_content = render_feedback_html(
-            feedback=feedback,          # now defined
+    # 3️⃣ Current date & time
+    current_date = datetime.now().strftime("%d-%m-%Y")
+    current_time = datetime.now().strftime("%H:%M:%S")
+
+    # 4️⃣ Reuse what the session already paid for; otherwise the shared LLM client is needed
+    key = feedback_key(state.level, safe_qa_list)
+    cached = feedback_cache.get(state, key) or {}
+    evaluations = evaluations_for(safe_qa_list, state.evaluations) or evaluations_for(safe_qa_list, cached.get("evaluations"))
+    reusable = cached.get("summary") and evaluations
+    if not reusable and not llm_clients.is_ready():
+        raise HTTPException(status_code=503, detail="AI service not available")
+
+    # 5️⃣ Generate structured feedback
+    feedback: InterviewPDFFeedback = await generate_unified_pdf_feedback(
+        experience=state.level or "N/A",
+        qa_list=safe_qa_list,
+        llm=llm_clients.llm,
+        evaluations=evaluations or state.evaluations,
+        summary=cached.get("summary") if reusable else None
+    )
+    if not reusable:
+        # keep this report's results so the next one for the same transcript needs no LLM call
+        # detailed_feedback follows qa_list order; pin it to the exact Q&A text so it can be matched later
+        state.evaluations = [item.model_dump() for item in feedback.detailed_feedback]
+        if len(state.evaluations) == len(safe_qa_list):
+            state.evaluations = [{**item, **qa} for item, qa in zip(state.evaluations, safe_qa_list)]
+        feedback_cache.put(state, key, evaluations=state.evaluations, summary={
+            "feedback": feedback.summary,
+            "strengths": feedback.strengths,
+            "areas_for_improvement": feedback.improvements,
+        })
+        if stored is not None:
+            await sessions.save_state(state)
+
+    # 6️⃣ Render HTML -> PDF (in the worker pool, bytes stay in memory)
+    try:
+        pdf_data = await pdf_pool.render(
+            feedback=feedback.model_dump(),
             qa_list=safe_qa_list,       # actual Q&A
             interviewer_name=interviewer_name,
             current_date=current_date,
             current_time=current_time
         )
+    except PDFQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    log.debug("PDF generated (%d bytes)", len(pdf_data))
 
-        pdf_file = f"/tmp/feedback_{uuid4()}.pdf"
-        print("📄 PDF will be saved to:", pdf_file)
-        if not html_to_pdf(html_content, pdf_file):
-            raise HTTPException(status_code=500, detail="PDF generation failed")
-        print("✅ PDF generated successfully.")
+    # 7️⃣ Queue email in the outbox; the delivery worker sends it
+    if not await send_email_with_pdf(db, user_email, pdf_data):
+        raise HTTPException(status_code=400, detail="Invalid recipient email")
+    outbox_worker.wake()
 
-        # 7️⃣ Send email in background
-        print("📧 Scheduling email send...")
-        background_tasks.add_task(send_email_with_pdf, user_email, pdf_file)
-        print("✅ Email task added to background queue.")
-
-        return {"message": "Feedback report is being generated and will be emailed shortly."}
-
-    except Exception as e:
-        traceback.print_exc()
-        print("❌ ERROR:", str(e))
-        raise HTTPException(status_code=500, detail=f"Error generating or sending feedback: {str(e)}")
+    return {"message": "Feedback report is being generated and will be emailed shortly."}
@@ -11,7 +11,17 @@ class Settings:
     PROJECT_NAME: str = os.getenv("PROJECT_NAME", "Interview Coach API")
     
     # Database Settings
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./interview.db")
+    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./interview.db")  # sqlite:///:memory: = shared in-memory DB
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", 30))
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", 1800))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+    DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
     
     # CORS Settings
     BACKEND_CORS_ORIGINS: list = os.getenv("BACKEND_CORS_ORIGINS", "*").split(",")
@@ -21,14 +31,61 @@ class Settings:
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60 * 24))
     
+    USER_CACHE_TTL_SECONDS: float = float(os.getenv("USER_CACHE_TTL_SECONDS", 300))
+    USER_CACHE_MAX_SIZE: int = int(os.getenv("USER_CACHE_MAX_SIZE", 10000))
+    
+    # Password Hashing Settings (first scheme is used for new hashes)
+    PASSWORD_SCHEMES: list = os.getenv("PASSWORD_SCHEMES", "bcrypt").split(",")
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", 12))
+    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST", 3))
+    ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST", 65536))
+    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_PARALLELISM", 1))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+    PASSWORD_HASH_MAX_QUEUE: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 64))
+    
     # AI Settings
     GOOGLE_API_KEY: Optional[str] = os.getenv("GOOGLE_API_KEY")
+    LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "gemini")  # gemini | fake
+    LLM_MODEL: str = os.getenv("LLM_MODEL", "gemini-1.5-flash")
+    LLM_TEMPERATURE: float = float(os.getenv("LLM_TEMPERATURE", 0.7))
+    LLM_MAX_TOKENS: int = int(os.getenv("LLM_MAX_TOKENS", 1000))
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", 16))
+    LLM_BACKGROUND_CONCURRENCY: int = int(os.getenv("LLM_BACKGROUND_CONCURRENCY", 4))  # of those, for scoring/prefetch/pool refills
+    LLM_TIMEOUT_SECONDS: float = float(os.getenv("LLM_TIMEOUT_SECONDS", 20))
+    LLM_STREAM_TIMEOUT_SECONDS: float = float(os.getenv("LLM_STREAM_TIMEOUT_SECONDS", 60))
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", 2))
+    LLM_RETRY_BASE_SECONDS: float = float(os.getenv("LLM_RETRY_BASE_SECONDS", 0.5))
+    LLM_HEDGE_ENABLED: bool = os.getenv("LLM_HEDGE_ENABLED", "false").lower() == "true"
+    LLM_HEDGE_PERCENTILE: float = float(os.getenv("LLM_HEDGE_PERCENTILE", 95))
+    LLM_HEDGE_MIN_SAMPLES: int = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", 20))
+    
+    # Fake LLM provider (LLM_PROVIDER=fake, for offline load tests)
+    LLM_FAKE_LATENCY_MS: float = float(os.getenv("LLM_FAKE_LATENCY_MS", 300))
+    LLM_FAKE_LATENCY_SIGMA: float = float(os.getenv("LLM_FAKE_LATENCY_SIGMA", 0.5))
+    LLM_FAKE_FAILURE_RATE: float = float(os.getenv("LLM_FAKE_FAILURE_RATE", 0.0))
+    LLM_FAKE_SEED: int = int(os.getenv("LLM_FAKE_SEED", 0))
     
     # Interview Settings
     MIN_QUESTIONS_PER_SESSION: int = int(os.getenv("MIN_QUESTIONS_PER_SESSION", 5))
     MAX_QUESTIONS_PER_SESSION: int = int(os.getenv("MAX_QUESTIONS_PER_SESSION", 10))
     DB_QUESTION_RATIO: float = float(os.getenv("DB_QUESTION_RATIO", 0.6))
     LLM_QUESTION_RATIO: float = float(os.getenv("LLM_QUESTION_RATIO", 0.4))
+    ENGINE_MODE: str = os.getenv("ENGINE_MODE", "direct")  # direct | langgraph
+    QUESTION_PREFETCH_ENABLED: bool = os.getenv("QUESTION_PREFETCH_ENABLED", "true").lower() == "true"
+    ANSWER_EVAL_ENABLED: bool = os.getenv("ANSWER_EVAL_ENABLED", "true").lower() == "true"
+    FEEDBACK_CACHE_MAX_SIZE: int = int(os.getenv("FEEDBACK_CACHE_MAX_SIZE", 1000))
+    FEEDBACK_CACHE_TTL_SECONDS: float = float(os.getenv("FEEDBACK_CACHE_TTL_SECONDS", 24 * 3600))
+    ATTEMPT_LOG_ENABLED: bool = os.getenv("ATTEMPT_LOG_ENABLED", "true").lower() == "true"
+    ATTEMPT_BATCH_SIZE: int = int(os.getenv("ATTEMPT_BATCH_SIZE", 200))
+    ATTEMPT_FLUSH_SECONDS: float = float(os.getenv("ATTEMPT_FLUSH_SECONDS", 2))
+    ATTEMPT_MAX_BUFFERED: int = int(os.getenv("ATTEMPT_MAX_BUFFERED", 10000))
+    QUESTION_INDEX_REFRESH_SECONDS: float = float(os.getenv("QUESTION_INDEX_REFRESH_SECONDS", 60))
+    
+    # LLM Question Pool Settings
+    LLM_POOL_ENABLED: bool = os.getenv("LLM_POOL_ENABLED", "true").lower() == "true"
+    LLM_POOL_LOW_WATERMARK: int = int(os.getenv("LLM_POOL_LOW_WATERMARK", 3))
+    LLM_POOL_HIGH_WATERMARK: int = int(os.getenv("LLM_POOL_HIGH_WATERMARK", 10))
+    LLM_POOL_MAX_AGE_SECONDS: float = float(os.getenv("LLM_POOL_MAX_AGE_SECONDS", 3600))
     
     # Session Settings
     SESSION_TIMEOUT_MINUTES: int = int(os.getenv("SESSION_TIMEOUT_MINUTES", 30))
@@ -38,9 +95,30 @@ class Settings:
     SMTP_PORT: int = int(os.getenv("SMTP_PORT", 587))
     SMTP_USER: str = os.getenv("SMTP_USER", "")
     SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", "")
+    SMTP_FROM: str = os.getenv("SMTP_FROM", SMTP_USER)
+    SMTP_STARTTLS: bool = os.getenv("SMTP_STARTTLS", "true").lower() == "true"
+    SMTP_POOL_SIZE: int = int(os.getenv("SMTP_POOL_SIZE", 3))
+    
+    # Email Outbox Settings
+    OUTBOX_BATCH_SIZE: int = int(os.getenv("OUTBOX_BATCH_SIZE", 20))
+    OUTBOX_POLL_SECONDS: float = float(os.getenv("OUTBOX_POLL_SECONDS", 5))
+    OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 5))
+    OUTBOX_RETRY_BASE_SECONDS: float = float(os.getenv("OUTBOX_RETRY_BASE_SECONDS", 30))
+    
+    # Response encoding
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))  # bytes; smaller bodies are sent as-is
+    GZIP_LEVEL: int = int(os.getenv("GZIP_LEVEL", 6))
+    BROTLI_QUALITY: int = int(os.getenv("BROTLI_QUALITY", 5))
+    
+    # PDF Rendering
+    PDF_WORKERS: int = int(os.getenv("PDF_WORKERS", 2))
+    PDF_MAX_QUEUE: int = int(os.getenv("PDF_MAX_QUEUE", 16))
     
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "")  # per module or prefix, e.g. "nodes=DEBUG,graph=WARNING"
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")  # text | json
+    LOG_DEBUG_SAMPLE_RATE: float = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", 1.0))
     
     # Environment
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
@@ -1,68 +1,73 @@
-import smtplib
 from email.message import EmailMessage
-from pathlib import Path
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.config import settings  
-from core.logger import logger
+from core.logger import get_logger
+from models.models import EmailOutbox
 
-def send_email_with_pdf(
-    to_email: str,
-    pdf_path: str,
-    subject: str = "Interview Feedback Report",
-    body_text: str = None
-) -> bool:
-    """
-    Sends an email with a PDF attachment.
-    """
-    if not to_email or "@" not in to_email:
-        logger.warning(f"Invalid recipient email: {to_email}")
-        return False
+log = get_logger("email_sender")
 
-    if not Path(pdf_path).exists():
-        logger.error(f"PDF file not found: {pdf_path}")
-        return False
+DEFAULT_SUBJECT = "Interview Feedback Report"
+DEFAULT_BODY = (
+    "Dear candidate,\n\n"
+    "Please find attached your detailed interview feedback report.\n\n"
+    "Best regards,\nInterview Team"
+)
 
-    if not body_text:
-        body_text = (
-            "Dear candidate,\n\n"
-            "Please find attached your detailed interview feedback report.\n\n"
-            "Best regards,\nInterview Team"
-        )
-
-    try:
-        logger.info(f"📧 Preparing email to {to_email} with attachment {pdf_path}")
 
-        msg = EmailMessage()
-        msg["Subject"] = subject
-        msg["From"] = settings.SMTP_USER
-        msg["To"] = to_email
-        msg.set_content(body_text)
-
-        with open(pdf_path, "rb") as f:
-            pdf_data = f.read()
-            logger.debug(f"Read {len(pdf_data)} bytes from PDF file")
+def build_email_message(
+    to_email: str,
+    subject: str,
+    body_text: str,
+    attachment: Optional[bytes] = None,
+    attachment_name: Optional[str] = None
+) -> EmailMessage:
+    """
+    Builds the MIME message for an outbox row.
+    """
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = settings.SMTP_FROM
+    msg["To"] = to_email
+    msg.set_content(body_text)
 
+    if attachment:
         msg.add_attachment(
-            pdf_data,
+            attachment,
             maintype="application",
             subtype="pdf",
-            filename="Interview_Feedback.pdf"
+            filename=attachment_name or "Interview_Feedback.pdf"
         )
-        logger.debug("PDF attached to email")
+    return msg
 
-        with smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT) as smtp:
-            logger.info(f"Connecting to SMTP server {settings.SMTP_SERVER}:{settings.SMTP_PORT}")
-            smtp.starttls()
-            logger.debug("Started TLS encryption for SMTP connection")
-            smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            logger.info("SMTP login successful")
-            smtp.send_message(msg)
 
-        logger.info(f"✅ Email sent successfully to {to_email}")
-        return True
+async def send_email_with_pdf(
+    db: AsyncSession,
+    to_email: str,
+    pdf_data: bytes,
+    subject: str = DEFAULT_SUBJECT,
+    body_text: str = None
+) -> Optional[EmailOutbox]:
+    """
+    Queues an email with a PDF attachment in the durable outbox.
+    Delivery, pooling and retries are handled by core.mail_outbox.
+    """
+    if not to_email or "@" not in to_email:
+        log.warning("Invalid recipient email: %s", to_email)
+        return None
+
+    if not pdf_data:
+        log.error("Empty PDF attachment")
+        return None
 
-    except smtplib.SMTPException as e:
-        logger.error(f"❌ SMTP error while sending email to {to_email}: {e}")
-        return False
-    except Exception as e:
-        logger.exception(f"⚠️ Unexpected error while sending email to {to_email}: {e}")
-        return False
+    row = EmailOutbox(
+        to_email=to_email,
+        subject=subject,
+        body=body_text or DEFAULT_BODY,
+        attachment=pdf_data,
+        attachment_name="Interview_Feedback.pdf"
+    )
+    db.add(row)
+    await db.commit()
+    log.info("📧 Queued email %s to %s with %d byte attachment", row.id, to_email, len(pdf_data))
+    return row
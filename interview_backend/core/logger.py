@@ -1,20 +1,133 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
+import random
 import sys
 
+from core.config import settings
+
 # Configure root logger
-logger = logging.getLogger("INTERVIEW_BACKEND")  
-logger.setLevel(logging.INFO)
+logger = logging.getLogger("INTERVIEW_BACKEND")
+logger.setLevel(getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO))
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps only a fraction of DEBUG records so high-volume trace lines can stay
+    enabled in production. INFO and above always pass.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate >= 1:
+            return True
+        return random.random() < self.rate
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line; key/value pairs passed as extra={"fields": {...}} are merged in."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class KeyValueFormatter(logging.Formatter):
+    """Plain text line with extra={"fields": {...}} appended as key=value pairs."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            line += " " + " ".join(f"{k}={v}" for k, v in fields.items())
+        return line
+
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues records for the listener thread without formatting them.
 
-# Console handler
+    The stock prepare() runs the handler's formatter on the caller and then
+    drops exc_info, so formatters on the listener side (JSONFormatter's "exc")
+    never see the traceback. Only the message arguments are merged here, since
+    they may be mutated after the call returns; the record stays in-process,
+    so exc_info is kept for the listener to format.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+# Console handler (runs on the listener thread, never on the event loop)
 console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setLevel(logging.INFO)
 
 # Formatter
-formatter = logging.Formatter(
-    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+if settings.LOG_FORMAT == "json":
+    formatter = JSONFormatter()
+else:
+    formatter = KeyValueFormatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
 console_handler.setFormatter(formatter)
 
+# Callers only enqueue records; a background thread does formatting and I/O,
+# so a slow stdout pipe can no longer stall request handling
+log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+queue_handler = RecordQueueHandler(log_queue)
+queue_handler.addFilter(SamplingFilter(settings.LOG_DEBUG_SAMPLE_RATE))
+listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread; safe to call more than once."""
+    if listener._thread is not None:
+        listener.stop()
+
+
 # Avoid duplicate handlers
 if not logger.hasHandlers():
-    logger.addHandler(console_handler)
+    logger.addHandler(queue_handler)
+    listener.start()
+    atexit.register(stop_logging)
+
+
+def _parse_levels(spec: str) -> dict:
+    """'nodes.question=DEBUG,graph=WARNING' -> {'nodes.question': 'DEBUG', 'graph': 'WARNING'}"""
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, level = item.partition("=")
+        if level:
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+# Levels are set on the named loggers themselves, so "nodes=DEBUG" also
+# covers nodes.question and nodes.feedback unless those have their own entry.
+for _name, _level in _parse_levels(settings.LOG_LEVELS).items():
+    logger.getChild(_name).setLevel(_level)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Child of the backend logger for one module, e.g. get_logger("nodes.question").
+    Its level can be overridden through LOG_LEVELS, per module or per prefix.
+    """
+    return logger.getChild(name)
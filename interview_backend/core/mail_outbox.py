@@ -0,0 +1,293 @@
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+import aiosmtplib
+from sqlalchemy import or_, select, update
+
+from core.config import settings
+from core.email_sender import build_email_message
+from core.logger import get_logger
+from core.metrics import observe, SMTP_SEND_SECONDS, ERRORS
+from database import AsyncSessionLocal
+from models.models import EmailOutbox
+
+log = get_logger("mail_outbox")
+
+
+class SMTPConnectionPool:
+    """
+    Small pool of connected, authenticated SMTP clients.
+
+    Connection setup (TCP, STARTTLS, AUTH) is paid once per connection and the
+    connection is then reused for many messages instead of once per email.
+    """
+
+    def __init__(self, host: str, port: int, username: str, password: str,
+                 start_tls: bool = True, size: int = 3, timeout: float = 30):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.size = size
+        self.timeout = timeout
+        self._idle: List[aiosmtplib.SMTP] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.connects = 0
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            start_tls=self.start_tls,
+            timeout=self.timeout
+        )
+        await client.connect()
+        if self.username:
+            await client.login(self.username, self.password)
+        self.connects += 1
+        return client
+
+    @staticmethod
+    def _connection_lost(error: Exception) -> bool:
+        """Disconnects, connect/read timeouts and 421 (service closing) leave the connection unusable."""
+        if isinstance(error, (OSError, asyncio.TimeoutError)):
+            return True
+        return isinstance(error, aiosmtplib.SMTPResponseException) and error.code == 421
+
+    @asynccontextmanager
+    async def connection(self):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        async with self._slots:
+            client = self._idle.pop() if self._idle else None
+            if client is None or not client.is_connected:
+                client = await self._connect()
+            try:
+                yield client
+            except Exception as e:
+                if self._connection_lost(e):
+                    client.close()
+                else:
+                    # the server refused this message (sender, recipients, data) and
+                    # aiosmtplib already reset the envelope: the connection is still good
+                    self._idle.append(client)
+                raise
+            except BaseException:
+                client.close()
+                raise
+            self._idle.append(client)
+
+    async def send(self, message) -> None:
+        async with self.connection() as client:
+            try:
+                await client.send_message(message)
+            except aiosmtplib.SMTPServerDisconnected:
+                # idle connection was dropped by the server: reconnect once
+                await client.connect()
+                if self.username:
+                    await client.login(self.username, self.password)
+                await client.send_message(message)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for client in idle:
+            try:
+                await client.quit()
+            except Exception:
+                client.close()
+
+
+class OutboxWorker:
+    """
+    Delivers queued EmailOutbox rows over a shared SMTPConnectionPool.
+
+    Rows are claimed atomically (pending -> sending) so several app processes
+    can share one outbox. A claim is a lease: only rows whose claim is older
+    than lease_seconds (by default the SMTP timeout per row of a batch) are
+    taken back from a worker that died, so one process starting up never
+    requeues mail another is still sending. Failed deliveries are retried
+    with jittered exponential backoff and marked failed after max_attempts.
+    """
+
+    def __init__(self, pool: SMTPConnectionPool, session_factory=AsyncSessionLocal,
+                 batch_size: int = 20, poll_interval: float = 5,
+                 max_attempts: int = 5, retry_base: float = 30,
+                 lease_seconds: Optional[float] = None):
+        self.pool = pool
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.lease_seconds = lease_seconds or pool.timeout * batch_size
+        self._next_requeue = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+    def _backoff(self, attempts: int) -> timedelta:
+        delay = self.retry_base * (2 ** (attempts - 1)) * random.uniform(0.5, 1.5)
+        return timedelta(seconds=min(delay, 3600))
+
+    async def requeue_expired(self) -> int:
+        """
+        Return 'sending' rows whose lease ran out (their worker died mid-batch)
+        to pending; returns how many. Rows without a claim time were claimed
+        before leases existed.
+        """
+        cutoff = self._now() - timedelta(seconds=self.lease_seconds)
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(EmailOutbox)
+                .where(
+                    EmailOutbox.status == "sending",
+                    or_(EmailOutbox.claimed_at.is_(None), EmailOutbox.claimed_at < cutoff)
+                )
+                .values(status="pending", claimed_at=None)
+            )
+            await db.commit()
+        self._next_requeue = time.monotonic() + self.lease_seconds
+        if result.rowcount:
+            log.warning("Requeued %d emails whose delivery lease expired", result.rowcount)
+        return result.rowcount
+
+    async def prepare(self) -> None:
+        """Requeue rows left 'sending' by a worker that died. The table itself comes from the migrations."""
+        await self.requeue_expired()
+
+    async def _claim(self):
+        async with self.session_factory() as db:
+            due = (
+                select(EmailOutbox.id)
+                .where(EmailOutbox.status == "pending", EmailOutbox.next_attempt_at <= self._now())
+                .order_by(EmailOutbox.id)
+                .limit(self.batch_size)
+                .scalar_subquery()
+            )
+            result = await db.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.id.in_(due), EmailOutbox.status == "pending")
+                .values(status="sending", claimed_at=self._now())
+                .returning(
+                    EmailOutbox.id, EmailOutbox.to_email, EmailOutbox.subject, EmailOutbox.body,
+                    EmailOutbox.attachment, EmailOutbox.attachment_name, EmailOutbox.attempts
+                )
+                .execution_options(synchronize_session=False)
+            )
+            rows = result.all()
+            await db.commit()
+            return rows
+
+    async def _deliver(self, row) -> Tuple[int, int, Optional[str]]:
+        message = build_email_message(row.to_email, row.subject, row.body, row.attachment, row.attachment_name)
+        try:
+            with observe(SMTP_SEND_SECONDS):
+                await self.pool.send(message)
+            return row.id, row.attempts, None
+        except Exception as e:
+            return row.id, row.attempts, str(e) or e.__class__.__name__
+
+    async def _record(self, results) -> None:
+        now = self._now()
+        async with self.session_factory() as db:
+            sent_ids = [row_id for row_id, _, error in results if error is None]
+            if sent_ids:
+                await db.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id.in_(sent_ids))
+                    .values(status="sent", sent_at=now, attempts=EmailOutbox.attempts + 1, last_error=None)
+                )
+                self.sent += len(sent_ids)
+
+            for row_id, attempts, error in results:
+                if error is None:
+                    continue
+                if attempts + 1 >= self.max_attempts:
+                    values = {"status": "failed", "attempts": attempts + 1, "last_error": error}
+                    self.failed += 1
+                    ERRORS.labels(component="email", kind="failed").inc()
+                    log.error("❌ Giving up on email %s after %d attempts: %s", row_id, attempts + 1, error)
+                else:
+                    values = {
+                        "status": "pending",
+                        "attempts": attempts + 1,
+                        "last_error": error,
+                        "next_attempt_at": now + self._backoff(attempts + 1),
+                    }
+                    self.retried += 1
+                    ERRORS.labels(component="email", kind="retry").inc()
+                    log.warning("Email %s failed (attempt %d), retrying: %s", row_id, attempts + 1, error)
+                await db.execute(update(EmailOutbox).where(EmailOutbox.id == row_id).values(**values))
+            await db.commit()
+
+    async def run_once(self) -> int:
+        """Claim and deliver one batch; returns how many rows were processed."""
+        rows = await self._claim()
+        if not rows:
+            return 0
+        results = await asyncio.gather(*(self._deliver(row) for row in rows))
+        await self._record(results)
+        return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if time.monotonic() >= self._next_requeue:
+                    await self.requeue_expired()
+                processed = await self.run_once()
+            except Exception as e:
+                log.exception("⚠️ Outbox worker error: %s", e)
+                processed = 0
+
+            if processed == 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def wake(self) -> None:
+        """Signal that new mail was queued so it goes out without waiting for the next poll."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        await self.prepare()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.pool.close()
+
+
+outbox_worker = OutboxWorker(
+    pool=SMTPConnectionPool(
+        host=settings.SMTP_SERVER,
+        port=settings.SMTP_PORT,
+        username=settings.SMTP_USER,
+        password=settings.SMTP_PASSWORD,
+        start_tls=settings.SMTP_STARTTLS,
+        size=settings.SMTP_POOL_SIZE
+    ),
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    poll_interval=settings.OUTBOX_POLL_SECONDS,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    retry_base=settings.OUTBOX_RETRY_BASE_SECONDS
+)
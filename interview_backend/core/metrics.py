@@ -0,0 +1,115 @@
+import functools
+import time
+from contextlib import contextmanager
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import event
+
+# Buckets cover sub-millisecond node bookkeeping up to multi-second LLM calls
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "interview_http_request_seconds", "HTTP request latency by route",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS
+)
+GRAPH_NODE_SECONDS = Histogram(
+    "interview_graph_node_seconds", "LangGraph node execution time",
+    ["node"], buckets=LATENCY_BUCKETS
+)
+LLM_CALL_SECONDS = Histogram(
+    "interview_llm_call_seconds", "LLM call latency",
+    ["call", "outcome"], buckets=LATENCY_BUCKETS
+)
+DB_QUERY_SECONDS = Histogram(
+    "interview_db_query_seconds", "Database statement latency",
+    ["statement"], buckets=DB_BUCKETS
+)
+PDF_RENDER_SECONDS = Histogram(
+    "interview_pdf_render_seconds", "Feedback PDF render time, including queueing",
+    ["outcome"], buckets=LATENCY_BUCKETS
+)
+SMTP_SEND_SECONDS = Histogram(
+    "interview_smtp_send_seconds", "SMTP send latency per message",
+    ["outcome"], buckets=LATENCY_BUCKETS
+)
+LLM_ATTEMPTS = Counter(
+    "interview_llm_attempts_total", "Model requests sent, by kind (primary, retry, hedge)",
+    ["call", "kind"]
+)
+LLM_HEDGE_WINS = Counter(
+    "interview_llm_hedge_wins_total", "Hedged calls by which request answered first",
+    ["call", "winner"]
+)
+QUESTIONS_SERVED = Counter(
+    "interview_questions_total", "Questions served by source (llm_pool, llm, db, fallback)",
+    ["session_type", "source"]
+)
+ERRORS = Counter(
+    "interview_errors_total", "Errors and degraded paths by component",
+    ["component", "kind"]
+)
+
+
+# histograms observe() labels with outcome=ok/error
+_OUTCOME_HISTOGRAMS = {LLM_CALL_SECONDS, PDF_RENDER_SECONDS, SMTP_SEND_SECONDS}
+
+
+@contextmanager
+def observe(histogram: Histogram, **labels):
+    """
+    Time the block into histogram, labelled outcome=ok/error for the histograms
+    in _OUTCOME_HISTOGRAMS. Cancelled blocks (e.g. a losing hedge) are not recorded.
+    """
+    if histogram in _OUTCOME_HISTOGRAMS:
+        labels["outcome"] = "ok"
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        if "outcome" in labels:
+            labels["outcome"] = "error"
+        histogram.labels(**labels).observe(time.perf_counter() - start)
+        raise
+    else:
+        histogram.labels(**labels).observe(time.perf_counter() - start)
+
+
+def timed_node(name: str):
+    """Decorator recording an async graph node's run time under GRAPH_NODE_SECONDS{node=name}."""
+    child = GRAPH_NODE_SECONDS.labels(node=name)
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def instrument_engine(engine) -> None:
+    """Record every statement executed on a (sync or async) SQLAlchemy engine."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start")
+        if starts:
+            verb = statement.lstrip().split(None, 1)[0].upper() if statement else "OTHER"
+            DB_QUERY_SECONDS.labels(statement=verb).observe(time.perf_counter() - starts.pop())
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(context):
+        starts = context.connection.info.get("query_start") if context.connection is not None else None
+        if starts:
+            starts.pop()
+        ERRORS.labels(component="db", kind=type(context.original_exception).__name__).inc()
+
@@ -32,3 +32,22 @@ def html_to_pdf(html_content: str, output_path: str) -> bool:
     except Exception as e:
         logger.error(f"Error generating PDF: {e}", exc_info=True)
         return False
+
+
+def html_to_pdf_bytes(html_content: str, url_fetcher=None, font_config=None) -> bytes:
+    """
+    Convert HTML content to PDF bytes in memory.
+
+    Args:
+        html_content (str): The HTML string to convert.
+        url_fetcher (callable, optional): WeasyPrint URL fetcher, e.g. a caching one.
+        font_config (FontConfiguration, optional): Font configuration to reuse across calls.
+
+    Returns:
+        bytes: The rendered PDF document.
+    """
+    if not html_content or not html_content.strip():
+        raise ValueError("Empty HTML content provided for PDF generation.")
+
+    kwargs = {"url_fetcher": url_fetcher} if url_fetcher else {}
+    return HTML(string=html_content, **kwargs).write_pdf(font_config=font_config)
@@ -0,0 +1,173 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional
+
+from core.config import settings
+from core.logger import get_logger
+from core.metrics import observe, PDF_RENDER_SECONDS, ERRORS
+
+log = get_logger("pdf_pool")
+
+# ---- Worker process side -------------------------------------------------
+# The font configuration, compiled template and fetched resources are set up
+# once per worker process and reused for every report that worker renders.
+
+_font_config = None
+_url_cache: Dict[str, dict] = {}
+
+
+def _cached_url_fetcher(url, *args, **kwargs):
+    """
+    WeasyPrint URL fetcher that keeps external resources (the Google Fonts
+    stylesheet and font files the template links to) in worker memory,
+    so they are downloaded once per worker instead of once per report.
+    """
+    from weasyprint import default_url_fetcher
+
+    cached = _url_cache.get(url)
+    if cached is None:
+        result = default_url_fetcher(url, *args, **kwargs)
+        file_obj = result.pop("file_obj", None)
+        if file_obj is not None:
+            try:
+                result["string"] = file_obj.read()
+            finally:
+                file_obj.close()
+        cached = _url_cache[url] = result
+    return dict(cached)
+
+
+def _render_report(context: dict) -> bytes:
+    from core.pdf_gen import html_to_pdf_bytes
+    from core.pdf_render import render_feedback_html
+
+    html_content = render_feedback_html(**context)
+    return html_to_pdf_bytes(html_content, url_fetcher=_cached_url_fetcher, font_config=_font_config)
+
+
+def _init_worker() -> None:
+    global _font_config
+    from weasyprint.text.fonts import FontConfiguration
+    from core.pdf_render import get_feedback_template
+
+    _font_config = FontConfiguration()
+    get_feedback_template()
+
+
+def _warm_worker() -> int:
+    """Render a tiny report so fonts and linked stylesheets are fetched before real traffic."""
+    try:
+        _render_report({
+            "feedback": {"overall_score": 0, "summary": "", "strengths": [], "improvements": [], "detailed_feedback": []},
+            "qa_list": [],
+            "interviewer_name": "",
+            "current_date": "",
+            "current_time": "",
+        })
+    except Exception as e:
+        log.warning("PDF worker warm-up failed: %s", e)
+    return multiprocessing.current_process().pid
+
+
+# ---- Application side ----------------------------------------------------
+
+class PDFQueueFull(Exception):
+    """Raised when more reports are waiting than the renderer accepts."""
+
+
+class PDFRenderPool:
+    """
+    Renders feedback reports in a pool of warm worker processes so WeasyPrint's
+    CPU-heavy layout never runs on the event loop. Returns PDF bytes directly.
+
+    At most max_workers reports render at once and at most max_queue more may
+    wait; beyond that render() raises PDFQueueFull instead of piling up work.
+
+    A worker that dies (or an initializer that fails) breaks the whole
+    ProcessPoolExecutor; the pool is then rebuilt and the report retried once.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        # one warm-up task per worker so every process is spawned and primed
+        for _ in range(self.max_workers):
+            executor.submit(_warm_worker)
+        return executor
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        self._executor = self._new_executor()
+        self._slots = asyncio.Semaphore(self.max_workers)
+
+    def _rebuild(self, broken: ProcessPoolExecutor) -> None:
+        # several renders can fail on the same broken pool; replace it only once
+        if self._executor is not broken:
+            return
+        log.warning("PDF render pool is broken, starting new workers")
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._new_executor()
+
+    async def _run(self, context: dict) -> bytes:
+        loop = asyncio.get_running_loop()
+        executor = self._executor
+        try:
+            return await loop.run_in_executor(executor, _render_report, context)
+        except BrokenProcessPool:
+            ERRORS.labels(component="pdf", kind="pool_broken").inc()
+            self._rebuild(executor)
+            return await loop.run_in_executor(self._executor, _render_report, context)
+
+    async def render(
+        self,
+        feedback: dict,
+        qa_list: List[Dict[str, str]],
+        interviewer_name: str,
+        current_date: str,
+        current_time: str
+    ) -> bytes:
+        if self._executor is None:
+            self.start()
+        if self._pending >= self.max_workers + self.max_queue:
+            ERRORS.labels(component="pdf", kind="queue_full").inc()
+            raise PDFQueueFull("PDF renderer is busy, please retry shortly")
+
+        context = {
+            "feedback": feedback,
+            "qa_list": qa_list,
+            "interviewer_name": interviewer_name,
+            "current_date": current_date,
+            "current_time": current_time,
+        }
+        self._pending += 1
+        try:
+            with observe(PDF_RENDER_SECONDS):
+                async with self._slots:
+                    return await self._run(context)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+pdf_pool = PDFRenderPool(max_workers=settings.PDF_WORKERS, max_queue=settings.PDF_MAX_QUEUE)
@@ -1,12 +1,29 @@
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from models.pdf_feedback import InterviewPDFFeedback
-from typing import List , Dict
+from typing import List , Dict, Optional
+
+# Load templates from the correct folder (resolved from this file, not the CWD,
+# so pool workers find it too)
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templete"  # folder name exactly
+TEMPLATE_NAME = "pdf_templete.html"
+
+env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
+_template: Optional[Template] = None
+
+
+def get_feedback_template() -> Template:
+    """Compile the feedback template once per process."""
+    global _template
+    if _template is None:
+        if not (TEMPLATE_DIR / TEMPLATE_NAME).exists():
+            raise FileNotFoundError(f"PDF template not found at {TEMPLATE_DIR / TEMPLATE_NAME}")
+        _template = env.get_template(TEMPLATE_NAME)
+    return _template
+
 
-# Load templates from the correct folder
-env = Environment(loader=FileSystemLoader("templete"))  # folder name exactly
 def render_feedback_html(
-    feedback: InterviewPDFFeedback, 
+    feedback: InterviewPDFFeedback | dict,
     qa_list: List[Dict[str, str]],  # <-- add this
     interviewer_name: str, 
     current_date: str, 
@@ -16,14 +33,10 @@ def render_feedback_html(
     Render InterviewPDFFeedback into HTML using Jinja2 template,
     including interviewer name, current date, current time, and Q&A.
     """
-    template_path = Path("templete/pdf_templete.html")
-    if not template_path.exists():
-        raise FileNotFoundError(f"PDF template not found at {template_path}")
-    
-    template = env.get_template("pdf_templete.html")
+    template = get_feedback_template()
     
     return template.render(
-        feedback=feedback.dict(),
+        feedback=feedback if isinstance(feedback, dict) else feedback.model_dump(),
         qa_list=qa_list,  # <-- pass Q&A list to template
         interviewer_name=interviewer_name,
         current_date=current_date,
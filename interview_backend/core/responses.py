@@ -0,0 +1,85 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict
+
+import orjson
+import ormsgpack
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+# wire format of the request being handled; set by CompactRoute
+_wire_format: ContextVar[str] = ContextVar("wire_format", default=JSON_MEDIA_TYPE)
+
+
+def quality_values(header: str) -> Dict[str, float]:
+    """{token: q} from an Accept-style header, e.g. "br;q=1.0, gzip;q=0.5" -> {"br": 1.0, "gzip": 0.5}."""
+    qualities = {}
+    for item in header.split(","):
+        token, *params = [part.strip() for part in item.split(";")]
+        if not token:
+            continue
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        qualities[token.lower()] = max(quality, qualities.get(token.lower(), 0.0))
+    return qualities
+
+
+def negotiate(accept: str) -> str:
+    """
+    msgpack when the Accept header lists a msgpack type at least as preferred
+    as JSON, JSON otherwise (including */* and a missing header).
+    """
+    qualities = quality_values(accept)
+    best_msgpack = max((qualities.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES), default=0.0)
+    best_json = max(qualities.get(media_type, 0.0) for media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"))
+    return MSGPACK_MEDIA_TYPE if best_msgpack > 0 and best_msgpack >= best_json else JSON_MEDIA_TYPE
+
+
+@contextmanager
+def wire_format(media_type: str):
+    """Encode CompactResponse bodies created inside the block as media_type."""
+    token = _wire_format.set(media_type)
+    try:
+        yield
+    finally:
+        _wire_format.reset(token)
+
+
+class CompactResponse(JSONResponse):
+    """
+    JSONResponse encoded with orjson instead of json.dumps, or as msgpack
+    when the route negotiated it (see CompactRoute). Same content either way.
+    """
+
+    def __init__(self, content: Any, *args, **kwargs):
+        super().__init__(content, *args, **kwargs)
+        self.headers.add_vary_header("Accept")
+
+    def render(self, content: Any) -> bytes:
+        if _wire_format.get() == MSGPACK_MEDIA_TYPE:
+            self.media_type = MSGPACK_MEDIA_TYPE
+            return ormsgpack.packb(content, option=ormsgpack.OPT_NON_STR_KEYS)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class CompactRoute(APIRoute):
+    """Route that serves CompactResponse bodies in the format the client's Accept header asks for."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def negotiated_handler(request: Request) -> Response:
+            with wire_format(negotiate(request.headers.get("accept", ""))):
+                return await handler(request)
+
+        return negotiated_handler
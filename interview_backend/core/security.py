@@ -2,7 +2,7 @@ from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import jwt
 from jwt.exceptions import DecodeError, ExpiredSignatureError, InvalidTokenError
 
@@ -10,7 +10,32 @@ from core.config import settings
 from database import get_db
 from models.models import User 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def build_pwd_context(
+    schemes: list = None,
+    bcrypt_rounds: int = None,
+    argon2_time_cost: int = None,
+    argon2_memory_cost: int = None,
+    argon2_parallelism: int = None
+) -> CryptContext:
+    """
+    The first scheme hashes new passwords; the others still verify but are
+    flagged for rehash, as are hashes made with different cost parameters.
+    """
+    schemes = schemes or settings.PASSWORD_SCHEMES
+    options = {}
+    if "bcrypt" in schemes:
+        rounds = bcrypt_rounds or settings.BCRYPT_ROUNDS
+        options.update(bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds, bcrypt__max_rounds=rounds)
+    if "argon2" in schemes:
+        options.update(
+            argon2__time_cost=argon2_time_cost or settings.ARGON2_TIME_COST,
+            argon2__memory_cost=argon2_memory_cost or settings.ARGON2_MEMORY_COST,
+            argon2__parallelism=argon2_parallelism or settings.ARGON2_PARALLELISM
+        )
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+pwd_context = build_pwd_context()
 
 # Password hashing
 def get_password_hash(password: str):
@@ -45,12 +70,12 @@ def verify_token(token: str) -> dict:
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
 from database import get_db
 from crud.user import get_user_by_email    
 from core.security import verify_token     
+from core.user_cache import user_cache
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
     """
     Extracts token via oauth2_scheme, verifies it, and returns DB User object.
     Raises 401 if invalid/expired or user not found.
@@ -72,7 +97,11 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = get_user_by_email(db, email)
+    user = user_cache.get(email)
+    if user is not None:
+        return user
+
+    user = await get_user_by_email(db, email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -80,4 +109,5 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    user_cache.put(email, user, token_exp=payload.get("exp"))
     return user
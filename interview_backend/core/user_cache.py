@@ -0,0 +1,83 @@
+import time
+from typing import Optional
+
+from cachetools import TLRUCache
+from sqlalchemy import event, inspect
+
+from core.config import settings
+from models.models import User
+
+
+def _snapshot(user: User) -> User:
+    """Detached copy of the loaded columns, safe to share across requests and sessions."""
+    return User(
+        id=user.id,
+        name=user.name,
+        email=user.email,
+        password_hash=user.password_hash,
+        level=user.level,
+        created_at=user.created_at
+    )
+
+
+class UserCache:
+    """
+    Bounded token-subject -> User cache for get_current_user.
+
+    An entry lives for at most ttl seconds and never past the expiry of the
+    token that loaded it, so a hit never outlives the credential it came from.
+    Least recently used entries are dropped once maxsize is reached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.ttl = ttl
+        # values are (user, expires_at); ttu returns each entry's own expiry
+        self._cache = TLRUCache(maxsize=maxsize, ttu=lambda _key, value, _now: value[1], timer=time.time)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, subject: str) -> Optional[User]:
+        entry = self._cache.get(subject)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def put(self, subject: str, user: User, token_exp: Optional[float] = None) -> None:
+        expires_at = time.time() + self.ttl
+        if token_exp is not None:
+            expires_at = min(expires_at, float(token_exp))
+        self._cache[subject] = (_snapshot(user), expires_at)
+
+    def invalidate(self, subject: str) -> None:
+        if self._cache.pop(subject, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "invalidations": self.invalidations,
+        }
+
+
+user_cache = UserCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+
+# Invalidation hooks: any flushed change to a user drops its cached copy,
+# under both the old and the new email if the email itself changed.
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target: User) -> None:
+    history = inspect(target).attrs.email.history
+    for email in {target.email, *(history.deleted or ())}:
+        if email:
+            user_cache.invalidate(email)
@@ -0,0 +1,108 @@
+import math
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import case, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.models import InterviewSession, PerformanceRollup
+
+ROLLUP_KEY = ["user_id", "session_type", "level"]
+
+
+def _upsert(dialect: str, values: dict):
+    """
+    One statement that creates the rollup row or folds one more session into
+    it, so concurrent completions never read-modify-write the same row.
+    """
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as dialect_insert
+        stmt = dialect_insert(PerformanceRollup).values(**values)
+        return stmt.on_duplicate_key_update(**_fold(stmt.inserted))
+    else:
+        raise ValueError(f"Performance rollups do not support the '{dialect}' dialect")
+    stmt = dialect_insert(PerformanceRollup).values(**values)
+    return stmt.on_conflict_do_update(index_elements=ROLLUP_KEY, set_=_fold(stmt.excluded))
+
+
+def _fold(new) -> dict:
+    row = PerformanceRollup
+    return {
+        "sessions": row.sessions + new.sessions,
+        "score_sum": row.score_sum + new.score_sum,
+        "score_sq_sum": row.score_sq_sum + new.score_sq_sum,
+        "best_score": case(
+            (row.best_score.is_(None), new.best_score),
+            (new.best_score > row.best_score, new.best_score),
+            else_=row.best_score,
+        ),
+        "last_session_at": new.last_session_at,
+    }
+
+
+async def record_session_score(db: AsyncSession, user_id: int, session_type, level, score: float,
+                               completed_at: Optional[datetime] = None) -> None:
+    """Add one completed session to its rollup row. Not committed here: it lands with the session state."""
+    score = float(score)
+    values = {
+        "user_id": user_id,
+        "session_type": session_type,
+        "level": level,
+        "sessions": 1,
+        "score_sum": score,
+        "score_sq_sum": score * score,
+        "best_score": score,
+        "last_session_at": completed_at or datetime.now(timezone.utc),
+    }
+    await db.execute(_upsert(db.bind.dialect.name, values))
+
+
+async def record_completed_session(db: AsyncSession, session_id: str, session_type, level, score: float) -> bool:
+    """
+    Add a completed session to its owner's rollup exactly once; False if it
+    was already counted or is not stored. The conditional update of
+    InterviewSession.rollup_recorded_at is the claim, so replaying the final
+    turn cannot count a session twice, and the owner comes from the stored
+    row. Not committed here: claim and upsert land with the session state.
+    """
+    completed_at = datetime.now(timezone.utc)
+    claimed = await db.execute(
+        update(InterviewSession)
+        .where(InterviewSession.session_id == session_id, InterviewSession.rollup_recorded_at.is_(None))
+        .values(rollup_recorded_at=completed_at)
+    )
+    if claimed.rowcount != 1:
+        return False
+    user_id = await db.scalar(select(InterviewSession.user_id).where(InterviewSession.session_id == session_id))
+    try:
+        await record_session_score(db, user_id, session_type, level, score, completed_at)
+    except Exception:
+        # leave the session uncounted rather than marked without its score
+        await db.execute(
+            update(InterviewSession).where(InterviewSession.session_id == session_id).values(rollup_recorded_at=None)
+        )
+        raise
+    return True
+
+
+def summarize(sessions: int, score_sum: float, score_sq_sum: float) -> dict:
+    """Mean and population standard deviation from the running sums."""
+    if not sessions:
+        return {"average_score": None, "score_stddev": None}
+    mean = score_sum / sessions
+    variance = max(score_sq_sum / sessions - mean * mean, 0.0)
+    return {"average_score": round(mean, 2), "score_stddev": round(math.sqrt(variance), 2)}
+
+
+async def get_rollups(db: AsyncSession, user_id: int, session_type=None, level=None) -> List[PerformanceRollup]:
+    stmt = select(PerformanceRollup).where(PerformanceRollup.user_id == user_id)
+    if session_type is not None:
+        stmt = stmt.where(PerformanceRollup.session_type == session_type)
+    if level is not None:
+        stmt = stmt.where(PerformanceRollup.level == level)
+    result = await db.execute(stmt)
+    return list(result.scalars())
@@ -1,20 +1,30 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.models import User, DifficultyLevel
-from core.security import pwd_context
+from core.password_hashing import password_hasher
 
-def get_user_by_email(db: Session, email: str):
-    return db.query(User).filter(User.email == email).first()
+async def get_user_by_email(db: AsyncSession, email: str):
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalars().first()
 
-def create_user(db: Session, name: str, email: str, password: str, level: DifficultyLevel):
-    hashed_password = pwd_context.hash(password)
+async def create_user(db: AsyncSession, name: str, email: str, password: str, level: DifficultyLevel):
+    # bcrypt/argon2 are deliberately slow; keep them off the event loop
+    hashed_password = await password_hasher.hash(password)
     user = User(name=name, email=email, password_hash=hashed_password, level=level)
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
-def authenticate_user(db: Session, email: str, password: str):
-    user = get_user_by_email(db, email)
-    if user and user.verify_password(password):
-        return user
-    return None
+async def authenticate_user(db: AsyncSession, email: str, password: str):
+    user = await get_user_by_email(db, email)
+    if not user:
+        return None
+    valid, new_hash = await password_hasher.verify_and_update(password, user.password_hash)
+    if not valid:
+        return None
+    # Hashing scheme or cost changed since this hash was made: upgrade it transparently
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
+    return user
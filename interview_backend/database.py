@@ -1,11 +1,161 @@
-from sqlalchemy import create_engine
+import sqlite3
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from core.config import settings
+from core.metrics import instrument_engine
+
+# Database URL (sync form; the async engine derives its driver from it)
+DATABASE_URL = settings.DATABASE_URL
+
+# Async drivers used when the URL does not name one explicitly
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+
+# Name of the shared in-memory SQLite database used for sqlite:///:memory:
+MEMORY_DB_NAME = "interview_memdb"
+
+
+def to_async_url(url: str) -> str:
+    """
+    Map a sync database URL to its async counterpart,
+    e.g. sqlite:///interview.db -> sqlite+aiosqlite:///interview.db.
+    URLs that already name a driver (postgresql+asyncpg://...) are kept as-is.
+    """
+    parsed = make_url(url)
+    if parsed.drivername in ASYNC_DRIVERS:
+        parsed = parsed.set(drivername=f"{parsed.drivername}+{ASYNC_DRIVERS[parsed.drivername]}")
+    return parsed.render_as_string(hide_password=False)
+
+
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def is_sqlite_memory(url: str) -> bool:
+    parsed = make_url(url)
+    return is_sqlite(url) and (parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory")
+
+
+def shared_memory_url(url: str) -> str:
+    """
+    sqlite:///:memory: gives every connection its own empty database. Map it
+    to a named shared-cache in-memory database instead, so the sync and async
+    engines and all pooled connections of this process see the same tables.
+    """
+    parsed = make_url(url)
+    if not is_sqlite(url) or parsed.database not in (None, "", ":memory:"):
+        return url
+    return parsed.set(
+        database=f"file:{MEMORY_DB_NAME}",
+        query={**parsed.query, "mode": "memory", "cache": "shared", "uri": "true"}
+    ).render_as_string(hide_password=False)
+
+
+def _sqlite_pragmas(memory: bool) -> list:
+    pragmas = [f"PRAGMA busy_timeout = {int(settings.SQLITE_BUSY_TIMEOUT_MS)}"]
+    if not memory:
+        # NORMAL sync is durable across application crashes in WAL mode and
+        # avoids an fsync per commit
+        pragmas += [
+            f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}",
+            f"PRAGMA mmap_size = {int(settings.SQLITE_MMAP_SIZE)}",
+        ]
+    return pragmas
 
-# Database file name
-DATABASE_URL = "sqlite:///interview.db"
 
-# Create the engine
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+def _install_sqlite_pragmas(engine: Engine, memory: bool) -> None:
+    pragmas = _sqlite_pragmas(memory)
+    journal_mode = settings.SQLITE_JOURNAL_MODE.lower()
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            # WAL lets readers run alongside the single writer. The mode is stored
+            # in the file and switching it needs a lock, so only set it when it differs
+            if not memory:
+                cursor.execute("PRAGMA journal_mode")
+                if cursor.fetchone()[0].lower() != journal_mode:
+                    cursor.execute(f"PRAGMA journal_mode = {journal_mode}")
+        except Exception:
+            # the pool does not close a connection whose connect handler failed
+            dbapi_connection.close()
+            raise
+        finally:
+            cursor.close()
+
+
+def _engine_options(url: str) -> dict:
+    # An explicit queue pool everywhere: the SQLite dialects otherwise default to
+    # NullPool (aiosqlite, a new connection and thread per checkout) or
+    # SingletonThreadPool (in-memory), which ignore the pool settings
+    options = {
+        "echo": settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+    }
+    if not is_sqlite(url):
+        # SQLite files never time out idle connections; servers do
+        options["pool_recycle"] = settings.DB_POOL_RECYCLE_SECONDS
+    return options
+
+
+# The shared in-memory database lives as long as one connection to it is open
+_memory_keepalive = []
+
+
+def _keep_memory_db_alive(url: str) -> None:
+    if not _memory_keepalive:
+        database = make_url(url).database
+        _memory_keepalive.append(
+            sqlite3.connect(f"{database}?mode=memory&cache=shared", uri=True, check_same_thread=False)
+        )
+
+
+def make_engine(url: str = None) -> Engine:
+    """Sync engine for scripts and tooling, configured from settings."""
+    url = shared_memory_url(url or DATABASE_URL)
+    options = _engine_options(url)
+    if is_sqlite(url):
+        options["connect_args"] = {"check_same_thread": False}
+    sync_engine = create_engine(url, poolclass=QueuePool, **options)
+    if is_sqlite(url):
+        if is_sqlite_memory(url):
+            _keep_memory_db_alive(url)
+        _install_sqlite_pragmas(sync_engine, is_sqlite_memory(url))
+    return sync_engine
+
+
+def make_async_engine(url: str = None) -> AsyncEngine:
+    """Async engine for request handlers and graph nodes, configured from settings."""
+    url = shared_memory_url(url or DATABASE_URL)
+    async_url = to_async_url(url)
+    new_engine = create_async_engine(async_url, poolclass=AsyncAdaptedQueuePool, **_engine_options(url))
+    if is_sqlite(url):
+        if is_sqlite_memory(url):
+            _keep_memory_db_alive(url)
+        _install_sqlite_pragmas(new_engine.sync_engine, is_sqlite_memory(url))
+    return new_engine
+
+
+# Create the engine (sync: scripts and tooling)
+engine = make_engine()
+
+# Create the async engine (request handlers and graph nodes)
+async_engine = make_async_engine()
+instrument_engine(async_engine)
 
 # Base class for models
 Base = declarative_base()
@@ -13,10 +163,16 @@ Base = declarative_base()
 # Create session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async session; objects stay usable after commit since handlers
+# serialize them once the transaction is done
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,8 +1,8 @@
 import asyncio
 from langchain_core.runnables import RunnableLambda
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from langgraph.graph import StateGraph, END
-from services import ai_factory
+from services.ai.client import llm_clients
 from core.config import settings
 import random
 from sqlalchemy.sql import func
@@ -10,19 +10,59 @@ from nodes.session_nodes import initialize_session, check_if_done
 from nodes.question_nodes import ask_question, store_answer
 from nodes.feedback_nodes import  generate_feedback_node
 from models.interview import InterviewModel
+from core.logger import get_logger
+from core.metrics import timed_node
+
+log = get_logger("graph")
+
+
+# Nodes that end a turn: the engine returns once one of them has run
+STOP_NODES = ("ask_question", "generate_feedback")
+
+
+def route_after_check(state) -> str:
+    return "generate_feedback" if state.session_status == "done" else "ask_question"
 
 
 class InterviewEngine:
-    def __init__(self):
-        print("🔧 Initializing InterviewEngine...")
+    """
+    Runs one interview turn at a time.
+
+    The flow is a fixed cycle (store_answer -> check_if_done -> ask_question |
+    generate_feedback), so by default ("direct" mode) a turn is executed from
+    the TRANSITIONS table below without LangGraph's streaming machinery.
+    mode="langgraph" (ENGINE_MODE) runs the same nodes through the compiled graphs.
+    """
+
+    # After each node: the next node, a router picking it from the state,
+    # or None when the turn is complete
+    TRANSITIONS = {
+        "initialize_session": "ask_question",
+        "store_answer": "check_if_done",
+        "check_if_done": route_after_check,
+        "ask_question": None,
+        "generate_feedback": None,
+    }
+
+    def __init__(self, mode: str = settings.ENGINE_MODE):
+        if mode not in ("direct", "langgraph"):
+            raise ValueError(f"Unknown engine mode '{mode}' (expected 'direct' or 'langgraph')")
+        self.mode = mode
+        self.nodes = {
+            "initialize_session": timed_node("initialize_session")(initialize_session),
+            "store_answer": timed_node("store_answer")(store_answer),
+            "check_if_done": timed_node("check_if_done")(check_if_done),
+            "ask_question": timed_node("ask_question")(ask_question),
+            "generate_feedback": timed_node("generate_feedback")(generate_feedback_node),
+        }
         self.initial_graph = self._build_initial_graph()
         self.main_graph = self._build_main_graph()
-        print("✅ InterviewEngine initialized successfully")
+        log.info("InterviewEngine initialized (mode=%s)", mode)
 
     def _build_initial_graph(self) -> StateGraph:
         workflow = StateGraph(InterviewModel)
-        workflow.add_node("initialize_session", RunnableLambda(initialize_session))
-        workflow.add_node("ask_question", RunnableLambda(ask_question))
+        workflow.add_node("initialize_session", RunnableLambda(self.nodes["initialize_session"]))
+        workflow.add_node("ask_question", RunnableLambda(self.nodes["ask_question"]))
         workflow.set_entry_point("initialize_session")
         workflow.add_edge("initialize_session", "ask_question")
         workflow.add_edge("ask_question", END)
@@ -30,34 +70,42 @@ class InterviewEngine:
 
     def _build_main_graph(self) -> StateGraph:
         workflow = StateGraph(InterviewModel)
-        workflow.add_node("store_answer", RunnableLambda(store_answer))
-        workflow.add_node("check_if_done", RunnableLambda(check_if_done))
-        workflow.add_node("ask_question", RunnableLambda(ask_question))
-        workflow.add_node("generate_feedback", RunnableLambda(generate_feedback_node))
+        workflow.add_node("store_answer", RunnableLambda(self.nodes["store_answer"]))
+        workflow.add_node("check_if_done", RunnableLambda(self.nodes["check_if_done"]))
+        workflow.add_node("ask_question", RunnableLambda(self.nodes["ask_question"]))
+        workflow.add_node("generate_feedback", RunnableLambda(self.nodes["generate_feedback"]))
 
         workflow.set_entry_point("store_answer")
         workflow.add_edge("store_answer", "check_if_done")
         workflow.add_conditional_edges(
             "check_if_done",
-            lambda state: state.session_status,
+            route_after_check,
             {
-                "not_done": "ask_question",
-                "done": "generate_feedback"
+                "ask_question": "ask_question",
+                "generate_feedback": "generate_feedback"
             }
         )
         workflow.add_edge("ask_question", "store_answer")
         workflow.add_edge("generate_feedback", END)
         return workflow.compile()
 
-    async def run_step(self, state: InterviewModel, db: Session, first_call: bool = False) -> InterviewModel:
-        print("🚀 === INTERVIEW ENGINE RUN_STEP START ===")
-        print(f"🔍 latest_answer: {state.latest_answer}")
-        print(f"🔍 current_question: {state.current_question}")
-        print(f"🔍 q_a_pair: {state.q_a_pair}")
+    async def _run_direct(self, state: InterviewModel, config: dict, first_call: bool) -> InterviewModel:
+        """Execute one turn from TRANSITIONS; nodes advance the state in place."""
+        node = "initialize_session" if first_call else "store_answer"
+        while node is not None:
+            state = await self.nodes[node](state, config)
+            log.debug("Node executed: %s", node)
+            following = self.TRANSITIONS[node]
+            node = following(state) if callable(following) else following
+        return state
 
-        graph = self.initial_graph if first_call else self.main_graph
+    async def run_step(self, state: InterviewModel, db: AsyncSession, first_call: bool = False) -> InterviewModel:
+        config = {"configurable": {"db": db, "llm": llm_clients.llm}}
+
+        if self.mode == "direct":
+            return await self._run_direct(state, config, first_call)
 
-        config = {"configurable": {"db": db, "llm": ai_factory.hr_ai.llm}}
+        graph = self.initial_graph if first_call else self.main_graph
 
         last_state = None
         async for step in graph.astream(state, config=config):
@@ -68,12 +116,75 @@ class InterviewEngine:
                 node_state = InterviewModel(**node_state)
 
             last_state = node_state
-            print(f"🔁 Node executed: {node}")
+            log.debug("Node executed: %s", node)
 
-            if node in ("ask_question", "generate_feedback"):
-                print(f"✅ Stopping at node: {node}")
+            if node in STOP_NODES:
                 return node_state
 
-        print("⚠️ No stop node found, returning last state")
+        log.warning("No stop node found, returning last state")
         return last_state
 
+    @staticmethod
+    def _custom_event(chunk: dict):
+        if chunk.get("event") == "token":
+            return "token", chunk["text"]
+        if chunk.get("event") == "feedback":
+            return "feedback", chunk["data"]
+        return None
+
+    async def _stream_direct(self, state: InterviewModel, db: AsyncSession, first_call: bool):
+        events: asyncio.Queue = asyncio.Queue()
+        config = {"configurable": {"db": db, "llm": llm_clients.llm, "stream": True, "writer": events.put_nowait}}
+        turn = asyncio.create_task(self._run_direct(state, config, first_call))
+        try:
+            while True:
+                next_event = asyncio.ensure_future(events.get())
+                await asyncio.wait({next_event, turn}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_event.done():
+                    next_event.cancel()
+                    break
+                event = self._custom_event(next_event.result())
+                if event:
+                    yield event
+            while not events.empty():
+                event = self._custom_event(events.get_nowait())
+                if event:
+                    yield event
+            yield "state", turn.result()
+        finally:
+            turn.cancel()
+
+    async def run_step_stream(self, state: InterviewModel, db: AsyncSession, first_call: bool = False):
+        """
+        Streaming variant of run_step. Yields ("token", text) for LLM question
+        tokens, ("feedback", partial_dict) while the final feedback is generated,
+        and finally ("state", InterviewModel) once the step is complete.
+        """
+        if self.mode == "direct":
+            async for event in self._stream_direct(state, db, first_call):
+                yield event
+            return
+
+        graph = self.initial_graph if first_call else self.main_graph
+
+        config = {"configurable": {"db": db, "llm": llm_clients.llm, "stream": True}}
+
+        last_state = None
+        async for mode, chunk in graph.astream(state, config=config, stream_mode=["custom", "updates"]):
+            if mode == "custom":
+                event = self._custom_event(chunk)
+                if event:
+                    yield event
+                continue
+
+            node = list(chunk.keys())[0]
+            node_state = list(chunk.values())[0]
+
+            if isinstance(node_state, dict):
+                node_state = InterviewModel(**node_state)
+
+            last_state = node_state
+            if node in STOP_NODES:
+                break
+
+        yield "state", last_state
@@ -1,17 +1,67 @@
 
-from fastapi import FastAPI
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from api.interviews import start_interview_api
 from api.auth import auth
+from database import AsyncSessionLocal, async_engine
+from services.question_index import question_index
+from services.question_prefetch import question_prefetcher
+from services.question_pool import llm_question_pool
+from services.answer_evaluator import answer_evaluator
+from services.feedback_cache import feedback_cache
+from services.attempt_recorder import attempt_recorder
+from services.session_service import active_session_count
+from core.pdf_pool import pdf_pool
+from core.mail_outbox import outbox_worker
+from core.password_hashing import password_hasher
+from core.user_cache import user_cache
+from core.metrics import HTTP_REQUEST_SECONDS
+from core.compression import CompressionMiddleware
+from core.config import settings
+from services.ai.client import llm_clients
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the in-memory question index before serving traffic
+    async with AsyncSessionLocal() as db:
+        await question_index.arefresh(db)
+    llm_clients.start()
+    llm_question_pool.start()
+    pdf_pool.start()
+    attempt_recorder.start()
+    await outbox_worker.start()
+    yield
+    # flush buffered history first, while nothing else is tearing down connections
+    await attempt_recorder.stop()
+    await outbox_worker.stop()
+    pdf_pool.shutdown()
+    await llm_question_pool.stop()
+    await question_prefetcher.shutdown()
+    await answer_evaluator.shutdown()
+    # pooled aiosqlite connections run on non-daemon threads that would block exit
+    await async_engine.dispose()
 
 
 app = FastAPI(
     title="Interview Coach API",
     description="AI-powered Interview Coaching Platform",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 
+# Interview payloads grow with every answer; compress the large ones
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    gzip_level=settings.GZIP_LEVEL,
+    brotli_quality=settings.BROTLI_QUALITY,
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"], 
@@ -21,6 +71,20 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    # label by route template, not raw path, to keep cardinality bounded
+    route = request.scope.get("route")
+    HTTP_REQUEST_SECONDS.labels(
+        method=request.method,
+        route=route.path if route is not None else "unmatched",
+        status=response.status_code
+    ).observe(time.perf_counter() - start)
+    return response
+
+
 app.include_router(start_interview_api.router, prefix="/api/interview", tags=["Interview"])
 app.include_router(auth.router, prefix="/api/auth", tags=["Auth"])
 
@@ -47,5 +111,18 @@ async def health_check():
         "version": "1.0.0",
         "uptime": time.time(),
         "memory_usage": psutil.virtual_memory().percent if hasattr(psutil, 'virtual_memory') else "N/A",
-        "active_sessions": 0  # Stateless approach - no active sessions stored
+        "active_sessions": active_session_count(),  # turns in progress; session state lives in InterviewSession
+        "llm_clients": llm_clients.stats(),
+        "llm_question_pool": llm_question_pool.stats(),
+        "answer_evaluator": answer_evaluator.stats(),
+        "feedback_cache": feedback_cache.stats(),
+        "attempt_recorder": attempt_recorder.stats(),
+        "password_hashing": password_hasher.stats(),
+        "user_cache": user_cache.stats()
     }
+
+
+# Prometheus scrape endpoint
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,100 @@
+"""baseline: schema as created by Base.metadata.create_all before migrations
+
+Databases created earlier with script/init_db.py already have these tables;
+mark them with `alembic stamp 0001` instead of upgrading through this revision.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+difficulty_level = sa.Enum("easy", "medium", "hard", name="difficultylevel")
+session_type = sa.Enum("hr", "technical", name="sessiontype")
+question_type = sa.Enum("coding", "sql", "conceptual", "hr", name="questiontype")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("password_hash", sa.String(), nullable=False),
+        sa.Column("level", difficulty_level, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "question_bank",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("type", question_type, nullable=False),
+        sa.Column("difficulty", difficulty_level, nullable=False),
+        sa.Column("question_data", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_question_bank_id", "question_bank", ["id"])
+
+    op.create_table(
+        "interview_sessions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("session_id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("session_type", session_type, nullable=False),
+        sa.Column("level", difficulty_level, nullable=False),
+        sa.Column("total_questions", sa.Integer(), nullable=False),
+        sa.Column("state", sa.JSON(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    )
+    op.create_index("ix_interview_sessions_id", "interview_sessions", ["id"])
+    op.create_index("ix_interview_sessions_session_id", "interview_sessions", ["session_id"], unique=True)
+
+    op.create_table(
+        "question_attempts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("session_id", sa.Integer(), sa.ForeignKey("interview_sessions.id"), nullable=False),
+        sa.Column("question_id", sa.Integer(), sa.ForeignKey("question_bank.id"), nullable=True),
+        sa.Column("user_answer", sa.String(), nullable=True),
+        sa.Column("is_correct", sa.Boolean(), nullable=True),
+        sa.Column("feedback", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("to_email", sa.String(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("body", sa.String(), nullable=False),
+        sa.Column("attachment", sa.LargeBinary(), nullable=True),
+        sa.Column("attachment_name", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_email_outbox_status_next_attempt", "email_outbox", ["status", "next_attempt_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("email_outbox")
+    op.drop_table("question_attempts")
+    op.drop_table("interview_sessions")
+    op.drop_table("question_bank")
+    op.drop_table("users")
+    bind = op.get_bind()
+    for enum in (question_type, session_type, difficulty_level):
+        enum.drop(bind, checkfirst=True)
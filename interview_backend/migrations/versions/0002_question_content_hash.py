@@ -0,0 +1,59 @@
+"""question_bank.content_hash for idempotent bulk imports
+
+Adds the unique sha256 column used by script/import_questions.py and hashes
+existing questions. Rows whose text duplicates an earlier question keep a
+NULL hash.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def content_hash(question_text: str) -> str:
+    """
+    Frozen copy of script.import_questions.content_hash as of this revision:
+    the migration must keep hashing the same way if the importer changes.
+    """
+    normalised = " ".join(question_text.split()).casefold()
+    return hashlib.sha256(normalised.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("question_bank") as batch:
+        batch.add_column(sa.Column("content_hash", sa.String(64), nullable=True))
+
+    question_bank = sa.table(
+        "question_bank",
+        sa.column("id", sa.Integer),
+        sa.column("question_data", sa.JSON),
+        sa.column("content_hash", sa.String),
+    )
+    bind = op.get_bind()
+    seen = set()
+    for row_id, question_data in bind.execute(sa.select(question_bank.c.id, question_bank.c.question_data)):
+        digest = content_hash((question_data or {}).get("question_text") or "")
+        if digest in seen:
+            continue
+        seen.add(digest)
+        bind.execute(
+            question_bank.update().where(question_bank.c.id == row_id).values(content_hash=digest)
+        )
+
+    op.create_index("ix_question_bank_content_hash", "question_bank", ["content_hash"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_question_bank_content_hash", table_name="question_bank")
+    with op.batch_alter_table("question_bank") as batch:
+        batch.drop_column("content_hash")
@@ -0,0 +1,32 @@
+"""composite indexes for the hot query patterns
+
+- question_bank (type, difficulty, id): question selection by type and level
+- question_attempts (session_id, created_at): attempts of a session in order
+- interview_sessions (user_id, started_at): per-user interview history
+
+script/check_query_plans.py verifies that these queries use them.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_question_bank_type_difficulty", "question_bank", ["type", "difficulty", "id"])
+    op.create_index("ix_question_attempts_session_id_created_at", "question_attempts", ["session_id", "created_at"])
+    op.create_index("ix_interview_sessions_user_id_started_at", "interview_sessions", ["user_id", "started_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_interview_sessions_user_id_started_at", table_name="interview_sessions")
+    op.drop_index("ix_question_attempts_session_id_created_at", table_name="question_attempts")
+    op.drop_index("ix_question_bank_type_difficulty", table_name="question_bank")
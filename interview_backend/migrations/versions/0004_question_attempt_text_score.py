@@ -0,0 +1,31 @@
+"""question_attempts.question_text and question_attempts.score
+
+Attempts are now written for every stored answer. LLM questions have no
+question_bank row, so the attempt keeps the question text itself, and the
+per-answer evaluation score is stored next to its feedback.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("question_attempts") as batch:
+        batch.add_column(sa.Column("question_text", sa.String(), nullable=True))
+        batch.add_column(sa.Column("score", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("question_attempts") as batch:
+        batch.drop_column("score")
+        batch.drop_column("question_text")
@@ -0,0 +1,85 @@
+"""performance_rollups: per user x session_type x level score aggregates
+
+generate_feedback_node folds every completed session into its row, so
+/api/interview/stats never has to parse InterviewSession.state. Sessions
+completed before this revision are folded in once here (0006 then marks
+them as counted on the session row).
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from collections import defaultdict
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# the enum types already exist (0001)
+difficulty_level = sa.Enum("easy", "medium", "hard", name="difficultylevel").with_variant(
+    postgresql.ENUM("easy", "medium", "hard", name="difficultylevel", create_type=False), "postgresql"
+)
+session_type = sa.Enum("hr", "technical", name="sessiontype").with_variant(
+    postgresql.ENUM("hr", "technical", name="sessiontype", create_type=False), "postgresql"
+)
+
+
+def upgrade() -> None:
+    rollups = op.create_table(
+        "performance_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("session_type", session_type, nullable=False),
+        sa.Column("level", difficulty_level, nullable=False),
+        sa.Column("sessions", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("score_sq_sum", sa.Float(), nullable=False),
+        sa.Column("best_score", sa.Float(), nullable=True),
+        sa.Column("last_session_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint("user_id", "session_type", "level", name="uq_performance_rollups_user_type_level"),
+    )
+
+    interview_sessions = sa.table(
+        "interview_sessions",
+        sa.column("user_id", sa.Integer),
+        sa.column("session_type", sa.String),
+        sa.column("level", sa.String),
+        sa.column("state", sa.JSON),
+        sa.column("updated_at", sa.DateTime),
+    )
+    totals = defaultdict(lambda: {"sessions": 0, "score_sum": 0.0, "score_sq_sum": 0.0,
+                                  "best_score": None, "last_session_at": None})
+    result = op.get_bind().execution_options(yield_per=1000).execute(sa.select(
+        interview_sessions.c.user_id, interview_sessions.c.session_type, interview_sessions.c.level,
+        interview_sessions.c.state, interview_sessions.c.updated_at
+    ))
+    for user_id, type_, level, state, updated_at in result:
+        feedback = (state or {}).get("feedback")
+        if (state or {}).get("session_status") != "done" or not isinstance(feedback, dict):
+            continue
+        score = feedback.get("score")
+        if not isinstance(score, (int, float)):
+            continue
+        row = totals[(user_id, type_, level)]
+        row["sessions"] += 1
+        row["score_sum"] += score
+        row["score_sq_sum"] += score * score
+        row["best_score"] = score if row["best_score"] is None else max(row["best_score"], score)
+        if updated_at is not None and (row["last_session_at"] is None or updated_at > row["last_session_at"]):
+            row["last_session_at"] = updated_at
+
+    if totals:
+        op.bulk_insert(rollups, [
+            {"user_id": user_id, "session_type": type_, "level": level, **row}
+            for (user_id, type_, level), row in totals.items()
+        ])
+
+
+def downgrade() -> None:
+    op.drop_table("performance_rollups")
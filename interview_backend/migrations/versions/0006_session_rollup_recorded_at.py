@@ -0,0 +1,61 @@
+"""interview_sessions.rollup_recorded_at: server-side record of rollup folding
+
+generate_feedback_node claims a completed session by setting this column in
+the same transaction as its PerformanceRollup upsert, so a replayed final
+turn cannot count the session again. Sessions already in the rollups (folded
+in by the 0005 backfill or by the node since) are marked here; they are the
+completed sessions with a numeric score, the same selection 0005 used.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("interview_sessions") as batch:
+        batch.add_column(sa.Column("rollup_recorded_at", sa.DateTime(timezone=True), nullable=True))
+
+    interview_sessions = sa.table(
+        "interview_sessions",
+        sa.column("id", sa.Integer),
+        sa.column("state", sa.JSON),
+        sa.column("updated_at", sa.DateTime),
+        sa.column("rollup_recorded_at", sa.DateTime),
+    )
+    bind = op.get_bind()
+    now = datetime.now(timezone.utc)
+    counted = []
+    result = bind.execution_options(yield_per=1000).execute(sa.select(
+        interview_sessions.c.id, interview_sessions.c.state, interview_sessions.c.updated_at
+    ))
+    for row_id, state, updated_at in result:
+        feedback = (state or {}).get("feedback")
+        if (state or {}).get("session_status") != "done" or not isinstance(feedback, dict):
+            continue
+        if not isinstance(feedback.get("score"), (int, float)):
+            continue
+        counted.append({"row_id": row_id, "recorded_at": updated_at or now})
+
+    if counted:
+        bind.execute(
+            interview_sessions.update()
+            .where(interview_sessions.c.id == sa.bindparam("row_id"))
+            .values(rollup_recorded_at=sa.bindparam("recorded_at")),
+            counted
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("interview_sessions") as batch:
+        batch.drop_column("rollup_recorded_at")
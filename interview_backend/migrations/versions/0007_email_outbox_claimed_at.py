@@ -0,0 +1,41 @@
+"""email_outbox.claimed_at: lease on rows being delivered
+
+A worker stamps the rows it claims (pending -> sending). On startup a worker
+only requeues 'sending' rows whose lease has run out, so starting one app
+process no longer requeues mail another process is still sending. Rows
+already 'sending' get the migration time as their claim.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # init_db.adopt_unversioned() creates a missing email_outbox from the current model
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("email_outbox")}
+    if "claimed_at" not in columns:
+        with op.batch_alter_table("email_outbox") as batch:
+            batch.add_column(sa.Column("claimed_at", sa.DateTime(), nullable=True))
+
+    email_outbox = sa.table("email_outbox", sa.column("status", sa.String), sa.column("claimed_at", sa.DateTime))
+    op.execute(
+        email_outbox.update()
+        .where(email_outbox.c.status == "sending", email_outbox.c.claimed_at.is_(None))
+        .values(claimed_at=datetime.now(timezone.utc))
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("email_outbox") as batch:
+        batch.drop_column("claimed_at")
@@ -1,10 +1,11 @@
+from datetime import datetime
 from pydantic import BaseModel , Field
 from typing import Optional, Any, Dict, List
 from models.models import SessionType, DifficultyLevel, QuestionType
 from typing_extensions import Literal
 
-class InterviewModel(BaseModel):
-    """Main interview state model that gets passed between frontend and backend"""
+class InterviewState(BaseModel):
+    """Interview state as the frontend sees it: returned with every turn and sent back with the next answer"""
     session_id: Optional[str] = None
     user_id: Optional[int] = None
     session_type: Optional[SessionType] = None
@@ -20,20 +21,68 @@ class InterviewModel(BaseModel):
     current_question: Optional[str] = None
     feedback: Optional[Dict[str, Any]] = None
     latest_answer: Optional[str] = None
+    version: int = 0  # bumped by the server on every persisted turn
 
     class Config:
         use_enum_values = True
 
+class InterviewModel(InterviewState):
+    """
+    Main interview state model, as stored in InterviewSession.state. The fields
+    added here are server-only: they are never read from a request nor
+    returned in a response, so scores cannot be supplied by the client.
+    """
+    evaluations: List[Dict[str, Any]] = Field(default_factory=list)  # per-answer QuestionFeedback dicts
+    feedback_cache: Dict[str, Dict[str, Any]] = Field(default_factory=dict)  # feedback_key -> cached feedback results
+
 class UnifiedInterviewRequest(BaseModel):
     """
     Unified request model for the /interview endpoint.
     Handles both starting new interviews and continuing existing ones.
     """
-    # For starting: just send user_id, session_type, level in state
+    # For starting: just send session_type, level in state (the user comes from the access token)
     # For continuing: send the full state with latest_answer
-    state: InterviewModel
+    state: InterviewState
 
 class InterviewResponse(BaseModel):
     message: str  # <next question> or <final feedback>
     done: bool    # true if session is complete
-    state: InterviewModel  # updated InterviewModel
+    state: InterviewState  # updated state, without the server-only fields
+
+class InterviewTurnRequest(BaseModel):
+    """
+    Delta request for the /turn endpoint. The server keeps the full state.
+    """
+    # For starting: leave session_id empty and send session_type, level
+    # For continuing: send session_id, the version from the last response and latest_answer
+    # The user is the bearer of the access token in every case
+    session_id: Optional[str] = None
+    version: Optional[int] = None
+    latest_answer: Optional[str] = None
+    user_id: Optional[int] = None  # optional; must match the signed-in user if sent
+    session_type: Optional[SessionType] = None
+    level: Optional[DifficultyLevel] = None
+
+class InterviewTurnResponse(BaseModel):
+    session_id: str
+    version: int
+    message: str  # <next question> or <final feedback>
+    done: bool
+    question_index: int
+    total_questions: int
+    feedback: Optional[Dict[str, Any]] = None  # only set once done
+
+class PerformanceStats(BaseModel):
+    """Aggregate scores of completed sessions, from PerformanceRollup rows."""
+    session_type: Optional[SessionType] = None  # None for the overall totals
+    level: Optional[DifficultyLevel] = None
+    sessions: int = 0
+    average_score: Optional[float] = None
+    score_stddev: Optional[float] = None
+    best_score: Optional[float] = None
+    last_session_at: Optional[datetime] = None
+
+class UserStatsResponse(BaseModel):
+    user_id: int
+    overall: PerformanceStats
+    breakdown: List[PerformanceStats]  # one entry per session_type x level practised
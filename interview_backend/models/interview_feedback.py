@@ -18,3 +18,31 @@ class InterviewFeedback(BaseModel):
     )
 
 
+class AnswerEvaluation(BaseModel):
+    """Evaluation of a single answer, produced in the background while the interview runs."""
+    evaluation: str = Field(
+        ...,
+        description="One or two sentences assessing the answer"
+    )
+    score: float = Field(
+        ...,
+        ge=0,
+        le=10,
+        description="Score for this answer (0–10)"
+    )
+
+
+class FeedbackSummary(BaseModel):
+    """Session-level wrap-up written from the per-answer evaluations."""
+    feedback: str = Field(
+        ...,
+        description="Brief overall summary of the candidate's performance"
+    )
+    strengths: List[str] = Field(
+        ...,
+        description="2–4 strengths the candidate showed across their answers"
+    )
+    areas_for_improvement: List[str] = Field(
+        ...,
+        description="List of 3–5 specific bullet points suggesting how the candidate can improve"
+    )
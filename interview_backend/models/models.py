@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, DateTime, ForeignKey, JSON, Boolean , func
+from sqlalchemy import Column, Integer, String, Enum, DateTime, ForeignKey, JSON, Boolean , LargeBinary, Index, Float, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 import enum
 from datetime import datetime, timezone
@@ -31,10 +31,6 @@ class User(Base):
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     interviews = relationship("InterviewSession", back_populates="user")
 
-    def verify_password(self, plain_password):
-        from core.security import pwd_context
-        return pwd_context.verify(plain_password, self.password_hash)
-
 # Question Bank Table
 class QuestionBank(Base):
     __tablename__ = "question_bank"
@@ -42,8 +38,14 @@ class QuestionBank(Base):
     type = Column(Enum(QuestionType), nullable=False)  
     difficulty = Column(Enum(DifficultyLevel), nullable=False)
     question_data = Column(JSON, nullable=False)
+    content_hash = Column(String(64), unique=True, index=True, nullable=True)  # sha256 of the normalised question text
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
+    __table_args__ = (
+        # question selection filters on type + difficulty; id rides along in the index
+        Index("ix_question_bank_type_difficulty", "type", "difficulty", "id"),
+    )
+
 # Interview Session Table
 class InterviewSession(Base):
     __tablename__ = "interview_sessions"
@@ -57,19 +59,71 @@ class InterviewSession(Base):
     state = Column(JSON, nullable=True)   # stores InterviewModel.dict()
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    rollup_recorded_at = Column(DateTime(timezone=True), nullable=True)  # when the session was added to its PerformanceRollup
 
     user = relationship("User", back_populates="interviews")
     attempts = relationship("QuestionAttempt", back_populates="session")
 
+    __table_args__ = (
+        # per-user interview history, newest first
+        Index("ix_interview_sessions_user_id_started_at", "user_id", "started_at"),
+    )
+
 # Question Attempt Table
 class QuestionAttempt(Base):
     __tablename__ = "question_attempts"
     id = Column(Integer, primary_key=True)
     session_id = Column(Integer, ForeignKey("interview_sessions.id"), nullable=False)
     question_id = Column(Integer, ForeignKey("question_bank.id"), nullable=True)  # Allow null for LLM questions
+    question_text = Column(String, nullable=True)  # as asked; LLM questions have no question_id
     user_answer = Column(String)
     is_correct = Column(Boolean)
     feedback = Column(String)
+    score = Column(Float, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     session = relationship("InterviewSession", back_populates="attempts")
-    question = relationship("QuestionBank")
\ No newline at end of file
+    question = relationship("QuestionBank")
+
+    __table_args__ = (
+        # attempts of a session in answer order
+        Index("ix_question_attempts_session_id_created_at", "session_id", "created_at"),
+    )
+
+# Email Outbox Table
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+    id = Column(Integer, primary_key=True)
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(String, nullable=False)
+    attachment = Column(LargeBinary, nullable=True)
+    attachment_name = Column(String, nullable=True)
+    status = Column(String, nullable=False, default="pending")  # pending | sending | sent | failed
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String, nullable=True)
+    next_attempt_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    sent_at = Column(DateTime, nullable=True)
+    claimed_at = Column(DateTime, nullable=True)  # when a worker moved the row to 'sending'
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+# Per-user performance rollup, one row per user x session_type x level
+class PerformanceRollup(Base):
+    __tablename__ = "performance_rollups"
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    session_type = Column(Enum(SessionType), nullable=False)
+    level = Column(Enum(DifficultyLevel), nullable=False)
+    sessions = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0)
+    score_sq_sum = Column(Float, nullable=False, default=0)  # for the standard deviation
+    best_score = Column(Float, nullable=True)
+    last_session_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # upsert target; a user's dashboard reads one range of it
+        UniqueConstraint("user_id", "session_type", "level", name="uq_performance_rollups_user_type_level"),
+    )
@@ -1,11 +1,22 @@
 from typing import List, Dict
 from langchain_core.messages import SystemMessage, HumanMessage
-from models.interview_feedback import InterviewFeedback
+from models.interview_feedback import InterviewFeedback, FeedbackSummary
 from models.interview import InterviewModel
 from typing import List, Dict
 from langchain_core.messages import SystemMessage, HumanMessage
-from models.pdf_feedback import InterviewPDFFeedback
+from models.pdf_feedback import InterviewPDFFeedback, QuestionFeedback
 from langchain_core.output_parsers.pydantic import PydanticOutputParser
+from langgraph.config import get_stream_writer
+from core.logger import get_logger
+from core.metrics import ERRORS
+from services.ai.client import llm_clients
+from services.answer_evaluator import answer_evaluator, find_evaluation
+from services.feedback_cache import feedback_cache, feedback_key
+from crud.performance import record_completed_session
+import asyncio
+import time
+
+log = get_logger("nodes.feedback")
 
 
 # Prepare the parser for structured output into InterviewFeedback pydantic model
@@ -17,15 +28,94 @@ system_msg = SystemMessage(content=(
     "Given the following Q&A, provide structured feedback in JSON format."
 ))
 
+async def summarize_evaluations(experience: str, evaluations: List[dict], llm, on_partial=None) -> FeedbackSummary:
+    """
+    One short LLM call that writes the session wrap-up from the per-answer
+    scores and notes; the prompt does not carry the full answers.
+    """
+    if not llm:
+        raise RuntimeError("LLM is not initialized")
+
+    notes = "\n".join(
+        f"Q{i+1} ({item['score']}/10): {item['question']}\nNotes: {item['evaluation']}"
+        for i, item in enumerate(evaluations)
+    )
+    human_msg = HumanMessage(content=(
+        f"Experience Level: {experience}\n\n"
+        f"Per-question evaluations from the interview session:\n\n{notes}\n\n"
+        "Write a brief overall summary, 2 to 4 strengths and 3 to 5 areas for improvement."
+    ))
+    summary_system_msg = SystemMessage(content="You are an expert interviewer summarizing an interview.")
+    chain = llm.with_structured_output(FeedbackSummary)
+
+    if on_partial is not None and hasattr(chain, "astream"):
+        partials = []
+
+        async def consume():
+            async for partial in chain.astream([summary_system_msg, human_msg]):
+                partials.append(partial)
+                on_partial(partial.model_dump() if hasattr(partial, "model_dump") else partial)
+
+        await llm_clients.stream("feedback_summary_stream", consume)
+        summary = partials[-1] if partials else None
+    else:
+        summary = await llm_clients.invoke("feedback_summary", lambda: chain.ainvoke([summary_system_msg, human_msg]))
+    if isinstance(summary, dict):
+        summary = FeedbackSummary(**summary)
+    return summary
+
+
+def average_score(evaluations: List[dict]) -> float:
+    return sum(float(item["score"]) for item in evaluations) / len(evaluations)
+
+
+def evaluations_for(qa_list: List[Dict[str, str]], evaluations: List[dict]):
+    """Per-question evaluations in qa_list order, or None unless every pair has one."""
+    if not qa_list or not evaluations:
+        return None
+    ordered = [find_evaluation(evaluations, qa["question"], qa["answer"]) for qa in qa_list]
+    return ordered if all(ordered) else None
+
+
 # Async function to generate detailed feedback using LLM
-async def generate_unified_pdf_feedback(experience: str, qa_list: List[Dict[str, str]], llm) -> InterviewPDFFeedback:
+async def generate_unified_pdf_feedback(
+    experience: str, qa_list: List[Dict[str, str]], llm, evaluations: List[dict] = None, summary: dict = None
+) -> InterviewPDFFeedback:
     """
     Generates structured feedback from an LLM given experience level and Q&A pairs.
+    When every pair already has a per-answer evaluation, those become the
+    detailed_feedback and only the short summary is requested from the LLM,
+    or nothing at all if a cached FeedbackSummary dict is passed in.
     """
+    ordered = evaluations_for(qa_list, evaluations)
+    if ordered:
+        start_ts = time.time()
+        if summary is not None:
+            summary = FeedbackSummary(**summary)
+            llm_calls = 0
+        else:
+            summary = await summarize_evaluations(experience, ordered, llm)
+            llm_calls = 1
+        log.info(
+            "generate_pdf_feedback",
+            extra={"fields": {
+                "pairs": len(qa_list),
+                "reused": True,
+                "llm_calls": llm_calls,
+                "ms": round((time.time() - start_ts) * 1000, 1),
+            }}
+        )
+        return InterviewPDFFeedback(
+            overall_score=round(average_score(ordered), 1),
+            summary=summary.feedback,
+            strengths=summary.strengths,
+            improvements=summary.areas_for_improvement,
+            detailed_feedback=[QuestionFeedback(**item) for item in ordered]
+        )
+
     formatted_qa = "\n\n".join(
         [f"Q{i+1}: {item['question']}\nA{i+1}: {item['answer']}" for i, item in enumerate(qa_list)]
     )
-    print(f"🔍 Formatted Q&A preview:\n{formatted_qa[:500]}{'...' if len(formatted_qa) > 500 else ''}")
 
     human_msg_content = (
         f"Experience Level: {experience}\n\n"
@@ -47,46 +137,36 @@ async def generate_unified_pdf_feedback(experience: str, qa_list: List[Dict[str,
     )
 
     human_msg = HumanMessage(content=human_msg_content)
-    print(f"🔍 Human message length: {len(human_msg_content)} characters")
+    log.debug("PDF feedback prompt: %d Q&A pairs, %d characters", len(qa_list), len(human_msg_content))
 
     chain = llm.with_structured_output(InterviewPDFFeedback)
-    print(f"🔍 LLM chain prepared with structured output: {InterviewPDFFeedback}")
 
+    start_ts = time.time()
     try:
         if hasattr(chain, "ainvoke"):
-            print("🔄 Invoking LLM asynchronously...")
-            feedback = await chain.ainvoke([system_msg, human_msg])
+            make_call = lambda: chain.ainvoke([system_msg, human_msg])
         else:
-            print("⚠️ LLM async method 'ainvoke' not found, falling back to sync invoke")
-            feedback = chain.invoke([system_msg, human_msg])
-        print("✅ LLM invocation completed")
+            log.debug("LLM async method 'ainvoke' not found, falling back to sync invoke")
+            make_call = lambda: asyncio.to_thread(chain.invoke, [system_msg, human_msg])
+        feedback = await llm_clients.invoke("pdf_feedback", make_call)
     except Exception as e:
-        print(f"❌ Exception during LLM invocation: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Exception during PDF feedback LLM invocation: %s", e)
         raise e
 
-    print("📝 === GENERATE_UNIFIED_FEEDBACK END ===\n")
-    print(feedback)
-    print("")
-    print("")
-
-    print("")
-
+    log.info(
+        "generate_pdf_feedback",
+        extra={"fields": {"pairs": len(qa_list), "ms": round((time.time() - start_ts) * 1000, 1)}}
+    )
     return feedback
 
 
-async def generate_unified_feedback(experience: str, qa_list: List[Dict[str, str]], llm) -> InterviewFeedback:
-    print("\n📝 === GENERATE_UNIFIED_FEEDBACK START ===")
+async def generate_unified_feedback(experience: str, qa_list: List[Dict[str, str]], llm, on_partial=None) -> InterviewFeedback:
     if not llm:
         raise RuntimeError("LLM is not initialized")
-    print(f"🔍 Experience level: {experience}")
-    print(f"🔍 Number of Q&A pairs received: {len(qa_list)}")
 
     formatted_qa = "\n\n".join(
         [f"Q{i+1}: {item['question']}\nA{i+1}: {item['answer']}" for i, item in enumerate(qa_list)]
     )
-    print(f"🔍 Formatted Q&A preview:\n{formatted_qa[:500]}{'...' if len(formatted_qa) > 500 else ''}")
 
     system_msg = SystemMessage(content="You are an expert interviewer giving structured feedback.")
     human_msg_content = (
@@ -98,71 +178,139 @@ async def generate_unified_feedback(experience: str, qa_list: List[Dict[str, str
         "- 3 to 5 areas for improvement (bullet points)"
     )
     human_msg = HumanMessage(content=human_msg_content)
-    print(f"🔍 Human message length: {len(human_msg_content)} characters")
+    log.debug("Feedback prompt: level=%s, %d Q&A pairs, %d characters", experience, len(qa_list), len(human_msg_content))
 
     chain = llm.with_structured_output(InterviewFeedback)
-    print(f"🔍 LLM chain prepared with structured output: {InterviewFeedback}")
 
+    start_ts = time.time()
     try:
-        if hasattr(chain, "ainvoke"):
-            print("🔄 Invoking LLM asynchronously...")
-            feedback = await chain.ainvoke([system_msg, human_msg])
+        if on_partial is not None and hasattr(chain, "astream"):
+            partials = []
+
+            async def consume():
+                async for partial in chain.astream([system_msg, human_msg]):
+                    partials.append(partial)
+                    on_partial(partial.model_dump() if hasattr(partial, "model_dump") else partial)
+
+            await llm_clients.stream("feedback_stream", consume)
+            feedback = partials[-1] if partials else None
+            if isinstance(feedback, dict):
+                feedback = InterviewFeedback(**feedback)
         else:
-            print("🔄 Invoking LLM synchronously...")
-            feedback = chain.invoke([system_msg, human_msg])
-        print("✅ LLM invocation completed")
+            if hasattr(chain, "ainvoke"):
+                make_call = lambda: chain.ainvoke([system_msg, human_msg])
+            else:
+                make_call = lambda: asyncio.to_thread(chain.invoke, [system_msg, human_msg])
+            feedback = await llm_clients.invoke("feedback", make_call)
     except Exception as e:
-        print(f"❌ Exception during LLM invocation: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Exception during feedback LLM invocation: %s", e)
         raise e
 
-    print("📝 === GENERATE_UNIFIED_FEEDBACK END ===\n")
-    print("data from  feedback:")
-    print(feedback)
-
+    log.info(
+        "generate_feedback",
+        extra={"fields": {
+            "pairs": len(qa_list),
+            "streamed": on_partial is not None,
+            "ms": round((time.time() - start_ts) * 1000, 1),
+        }}
+    )
     return feedback
 
 
 async def generate_feedback_node(state: InterviewModel, config: dict = None) -> InterviewModel:
-    print("\n📝 === GENERATE_FEEDBACK NODE START ===")
     if config is None:
         config = {}
 
     llm = config.get("configurable", {}).get("llm")
-    print(f"🔍 LLM instance found: {'Yes' if llm else 'No'}")
     if not llm:
         raise RuntimeError("LLM instance missing in config")
 
-    print(f"🔍 Generating feedback for experience level: {state.level}")
-    print(f"🔍 Number of Q&A pairs: {len(state.q_a_pair)}")
+    # Streaming callers get partial feedback objects as the model fills them in
+    on_partial = None
+    if config.get("configurable", {}).get("stream"):
+        # the direct engine passes its own writer; under LangGraph use the graph's
+        writer = config["configurable"].get("writer") or get_stream_writer()
+        on_partial = lambda partial: writer({"event": "feedback", "data": partial})
 
     try:
-        feedback = await generate_unified_feedback(state.level, state.q_a_pair, llm)
-        print(f"✅ Feedback generated successfully:")
-        print(feedback)  
+        key = feedback_key(state.level, state.q_a_pair)
+        cached = feedback_cache.get(state, key)
+        summary = None
+        if cached and cached.get("feedback"):
+            # same level and transcript already evaluated (e.g. a replayed final turn)
+            feedback = InterviewFeedback(**cached["feedback"])
+            if on_partial is not None:
+                on_partial(cached["feedback"])
+        else:
+            feedback, summary = await _evaluate_session(state, llm, on_partial)
+            feedback_cache.put(
+                state, key,
+                feedback=feedback.model_dump() if hasattr(feedback, "model_dump") else feedback,
+                summary=summary.model_dump() if summary is not None else None,
+                evaluations=list(state.evaluations) if summary is not None else None
+            )
 
         # Attach feedback to state
         if hasattr(feedback, "model_dump"):
             state.feedback = feedback.model_dump()
-            print(f"🔍 Feedback model dumped to dict")
         elif hasattr(feedback, "dict"):
             state.feedback = feedback.dict()
-            print(f"🔍 Feedback converted to dict")
         else:
             state.feedback = feedback
-            print(f"🔍 Feedback attached as-is")
 
         state.session_status = "done"
         state.current_question = None
+        await _update_rollup(state, config.get("configurable", {}).get("db"))
 
     except Exception as e:
-        print(f"❌ Error generating feedback: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error generating feedback: %s", e)
+        ERRORS.labels(component="feedback", kind="generation_failed").inc()
         state.feedback = "Error generating feedback."
         state.session_status = "done"
         state.current_question = None
 
-    print("📝 === GENERATE_FEEDBACK NODE END ===\n")
     return state
+
+
+async def _update_rollup(state: InterviewModel, db) -> None:
+    """Fold the finished session into its owner's PerformanceRollup row, once per session (committed with the session)."""
+    score = state.feedback.get("score") if isinstance(state.feedback, dict) else None
+    if db is None or not state.session_id or score is None:
+        return
+    try:
+        await record_completed_session(db, state.session_id, state.session_type, state.level, score)
+    except Exception as e:
+        log.warning("Updating the performance rollup failed: %s", e)
+        ERRORS.labels(component="feedback", kind="rollup_failed").inc()
+
+
+async def _evaluate_session(state: InterviewModel, llm, on_partial):
+    """Final InterviewFeedback plus the FeedbackSummary it was built from (None on the full-transcript path)."""
+    # Answers were scored in the background as the interview ran; only the
+    # wrap-up is generated here. Falls back to the full-transcript call if
+    # any answer could not be evaluated.
+    evaluations = await answer_evaluator.complete(state, llm)
+    if state.q_a_pair and all(evaluations):
+        score = round(average_score(evaluations))
+        summary_partial = None
+        if on_partial is not None:
+            summary_partial = lambda partial: on_partial({"score": score, **partial})
+        start_ts = time.time()
+        summary = await summarize_evaluations(state.level, evaluations, llm, on_partial=summary_partial)
+        feedback = InterviewFeedback(
+            score=score,
+            feedback=summary.feedback,
+            areas_for_improvement=summary.areas_for_improvement
+        )
+        log.info(
+            "generate_feedback",
+            extra={"fields": {
+                "pairs": len(evaluations),
+                "aggregated": True,
+                "ms": round((time.time() - start_ts) * 1000, 1),
+            }}
+        )
+        return feedback, summary
+
+    feedback = await generate_unified_feedback(state.level, state.q_a_pair, llm, on_partial=on_partial)
+    return feedback, None
@@ -1,14 +1,23 @@
-from sqlalchemy.orm import Session
-from sqlalchemy.sql import func
-from sqlalchemy import cast, String
-from models.models import QuestionBank, QuestionType, SessionType
+from sqlalchemy.ext.asyncio import AsyncSession
+from langgraph.config import get_stream_writer
+from models.models import QuestionType, SessionType
 from models.interview import InterviewModel
 from services import ai_factory
+from services.question_index import question_index
+from services.question_prefetch import question_prefetcher
+from services.question_pool import llm_question_pool
+from services.answer_evaluator import answer_evaluator
+from services.attempt_recorder import attempt_recorder
+from core.logger import get_logger
+from core.metrics import QUESTIONS_SERVED, ERRORS
 import random
 import time
-import traceback
 import inspect
 
+log = get_logger("nodes.question")
+
+TECHNICAL_QUESTION_TYPES = [QuestionType.coding, QuestionType.sql, QuestionType.conceptual]
+
 
 async def ask_question(state: InterviewModel, config: dict = None):
     """
@@ -17,31 +26,56 @@ async def ask_question(state: InterviewModel, config: dict = None):
     """
     start_ts = time.time()
     try:
-        print(f"\n[AskQuestion] ❓ === ASK_QUESTION START ===")
-        print(f"[AskQuestion] session_type={state.session_type}, level={state.level}, index={state.current_question_index}/{state.total_questions}")
-
-        db: Session = config.get("configurable", {}).get("db") if config else None
+        db: AsyncSession = config.get("configurable", {}).get("db") if config else None
         if not db:
             raise ValueError("❌ Database session not provided in config")
 
-        if state.session_type == SessionType.hr:
-            state = await get_hr_question_from_state(state, db)
+        # Streaming callers get LLM tokens forwarded as they arrive
+        on_token = None
+        if config.get("configurable", {}).get("stream"):
+            # the direct engine passes its own writer; under LangGraph use the graph's
+            writer = config["configurable"].get("writer") or get_stream_writer()
+            on_token = lambda text: writer({"event": "token", "text": text})
+
+        prefetched = await question_prefetcher.take(state)
+        if prefetched:
+            log.debug("Using prefetched question (llm=%s)", prefetched.from_llm)
+            state = question_prefetcher.apply(state, prefetched)
         else:
-            state = await get_technical_question_from_state(state, db)
-
-        preview = (state.current_question or "None")[:120]
-        print(f"[AskQuestion] ✅ Selected question: {preview} (took {time.time() - start_ts:.2f}s)")
-        print(f"[AskQuestion] ❓ === ASK_QUESTION END ===\n")
+            state = await select_next_question(state, db, on_token=on_token)
+
+        # Start on question N+1 while the candidate answers question N
+        question_prefetcher.schedule(state, select_next_question)
+
+        log.info(
+            "ask_question",
+            extra={"fields": {
+                "session_type": state.session_type,
+                "level": state.level,
+                "index": state.current_question_index,
+                "total": state.total_questions,
+                "prefetched": bool(prefetched),
+                "ms": round((time.time() - start_ts) * 1000, 1),
+            }}
+        )
         return state
 
     except Exception as e:
-        print(f"[AskQuestion] ❌ Fatal error while fetching question: {e}")
-        traceback.print_exc()
+        log.exception("Fatal error while fetching question: %s", e)
+        ERRORS.labels(component="question", kind="fatal").inc()
         # Always fallback safely
         state.current_question = "Unexpected error. Please try again."
         return state
 
 
+async def select_next_question(state: InterviewModel, db: AsyncSession, on_token=None) -> InterviewModel:
+    # only questions served from the bank set an id
+    state.current_question_id = None
+    if state.session_type == SessionType.hr:
+        return await get_hr_question_from_state(state, db, on_token=on_token)
+    return await get_technical_question_from_state(state, db, on_token=on_token)
+
+
 async def _should_use_llm(state: InterviewModel, llm_probability: float) -> bool:
     """Strict quota check + probability check."""
     total_llm_allowed = int(state.total_questions * llm_probability) if state.total_questions else 0
@@ -55,103 +89,103 @@ async def _should_use_llm(state: InterviewModel, llm_probability: float) -> bool
     return remaining_llm > 0 and random.random() < llm_probability
 
 
-async def get_hr_question_from_state(state: InterviewModel, db: Session, llm_probability: float = 0.4):
+async def get_hr_question_from_state(state: InterviewModel, db: AsyncSession, llm_probability: float = 0.4, on_token=None):
     fallback = "Tell me about a time you overcame a workplace challenge."
     asked_texts = {qa["question"] for qa in (state.q_a_pair or [])}
     asked_ids = set(state.asked_question_ids or [])
 
     try:
         use_llm = await _should_use_llm(state, llm_probability)
-        print(f"[AskQuestion][HR] 🔀 Decision: use_llm={use_llm}")
+        log.debug("HR question decision: use_llm=%s", use_llm)
 
         if use_llm:
             try:
-                llm_fn = ai_factory.hr_ai.llm_generate_hr_question
-                question = await llm_fn(state.level, list(asked_texts)) if inspect.iscoroutinefunction(llm_fn) else llm_fn(state.level, list(asked_texts))
-                if inspect.isawaitable(question):
-                    question = await question
+                # warm pool first, live generation only on a miss
+                question = llm_question_pool.take(SessionType.hr, state.level, asked_texts | set(state.asked_llm_questions))
+                source = "llm_pool"
+                if not question:
+                    source = "llm"
+                    llm_fn = ai_factory.hr_ai.llm_generate_hr_question
+                    question = await llm_fn(state.level, list(asked_texts), on_token=on_token) if inspect.iscoroutinefunction(llm_fn) else llm_fn(state.level, list(asked_texts), on_token=on_token)
+                    if inspect.isawaitable(question):
+                        question = await question
                 if question and question not in asked_texts:
                     state.asked_llm_questions.append(question)
                     state.current_question = question
+                    QUESTIONS_SERVED.labels(session_type=SessionType.hr.value, source=source).inc()
                     return state
             except Exception as e:
-                print(f"[AskQuestion][HR] ⚠️ LLM failed: {e}")
-                traceback.print_exc()
-
-        # fallback to DB
-        db_question = (
-            db.query(QuestionBank)
-            .filter(
-                QuestionBank.type == QuestionType.hr,
-                QuestionBank.difficulty == state.level,
-                ~QuestionBank.id.in_(asked_ids) if asked_ids else True
-            )
-            .order_by(func.random())
-            .first()
-        )
+                log.warning("HR LLM question failed, using DB: %s", e, exc_info=True)
+                ERRORS.labels(component="question", kind="llm_fallback").inc()
+
+        # fallback to DB (served from the in-memory question index)
+        await question_index.amaybe_refresh(db)
+        db_question = question_index.sample([QuestionType.hr], state.level, asked_ids)
         if db_question:
-            q_text = db_question.question_data.get("question_text") or db_question.question_data.get("question")
-            state.current_question_id = db_question.id
-            state.asked_question_ids.append(db_question.id)
+            q_id, q_data = db_question
+            q_text = q_data.get("question_text") or q_data.get("question")
+            state.current_question_id = q_id
+            state.asked_question_ids.append(q_id)
             state.current_question = q_text
+            QUESTIONS_SERVED.labels(session_type=SessionType.hr.value, source="db").inc()
             return state
 
     except Exception as e:
-        print(f"[AskQuestion][HR] ❌ Unexpected error: {e}")
-        traceback.print_exc()
+        log.exception("Unexpected error selecting HR question: %s", e)
 
     # final fallback
     state.current_question = fallback
+    QUESTIONS_SERVED.labels(session_type=SessionType.hr.value, source="fallback").inc()
     return state
 
 
-async def get_technical_question_from_state(state: InterviewModel, db: Session, llm_probability: float = 0.4):
+async def get_technical_question_from_state(state: InterviewModel, db: AsyncSession, llm_probability: float = 0.4, on_token=None):
     fallback = "Explain the difference between a stack and a queue."
     asked_texts = {qa["question"] for qa in (state.q_a_pair or [])}
     asked_ids = set(state.asked_question_ids or [])
 
     try:
         use_llm = await _should_use_llm(state, llm_probability)
-        print(f"[AskQuestion][Tech] 🔀 Decision: use_llm={use_llm}")
+        log.debug("Technical question decision: use_llm=%s", use_llm)
 
         if use_llm:
             try:
-                llm_fn = ai_factory.tech_ai.llm_generate_technical_question
-                question = await llm_fn(state.level, list(asked_texts)) if inspect.iscoroutinefunction(llm_fn) else llm_fn(state.level, list(asked_texts))
-                if inspect.isawaitable(question):
-                    question = await question
+                # warm pool first, live generation only on a miss
+                question = llm_question_pool.take(SessionType.technical, state.level, asked_texts | set(state.asked_llm_questions))
+                source = "llm_pool"
+                if not question:
+                    source = "llm"
+                    llm_fn = ai_factory.tech_ai.llm_generate_technical_question
+                    question = await llm_fn(state.level, list(asked_texts), on_token=on_token) if inspect.iscoroutinefunction(llm_fn) else llm_fn(state.level, list(asked_texts), on_token=on_token)
+                    if inspect.isawaitable(question):
+                        question = await question
                 if question and question not in asked_texts:
                     state.asked_llm_questions.append(question)
                     state.current_question = question
+                    QUESTIONS_SERVED.labels(session_type=SessionType.technical.value, source=source).inc()
                     return state
             except Exception as e:
-                print(f"[AskQuestion][Tech] ⚠️ LLM failed: {e}")
-                traceback.print_exc()
-
-        # fallback to DB
-        db_question = (
-            db.query(QuestionBank)
-            .filter(
-                QuestionBank.type.in_([QuestionType.coding, QuestionType.sql, QuestionType.conceptual]),
-                QuestionBank.difficulty == state.level,
-                ~QuestionBank.id.in_(asked_ids) if asked_ids else True
-            )
-            .order_by(func.random())
-            .first()
-        )
+                log.warning("Technical LLM question failed, using DB: %s", e, exc_info=True)
+                ERRORS.labels(component="question", kind="llm_fallback").inc()
+
+        # fallback to DB (served from the in-memory question index)
+        await question_index.amaybe_refresh(db)
+        db_question = question_index.sample(TECHNICAL_QUESTION_TYPES, state.level, asked_ids)
         if db_question:
-            q_text = db_question.question_data.get("question_text") or db_question.question_data.get("question")
-            state.current_question_id = db_question.id
-            state.asked_question_ids.append(db_question.id)
+            q_id, q_data = db_question
+            q_text = q_data.get("question_text") or q_data.get("question")
+            state.current_question_id = q_id
+            state.asked_question_ids.append(q_id)
             state.current_question = q_text
+            QUESTIONS_SERVED.labels(session_type=SessionType.technical.value, source="db").inc()
             return state
 
     except Exception as e:
-        print(f"[AskQuestion][Tech] ❌ Unexpected error: {e}")
-        traceback.print_exc()
+        log.exception("Unexpected error selecting technical question: %s", e)
 
     # final fallback
     state.current_question = fallback
+    QUESTIONS_SERVED.labels(session_type=SessionType.technical.value, source="fallback").inc()
     return state
 
 
@@ -161,13 +195,7 @@ async def store_answer(state: InterviewModel, config: dict = None):
     Ensures question_id is tracked in asked_question_ids.
     """
     start_ts = time.time()
-    print(f"\n[AskQuestion] 💾 === STORE_ANSWER NODE START ===")
-    print(f"[AskQuestion] 🔍 latest_answer: {state.latest_answer}")
-    print(f"[AskQuestion] 🔍 current_question: {state.current_question}")
-    print(f"[AskQuestion] 🔍 current_question_id: {state.current_question_id}")
-    print(f"[AskQuestion] 🔍 current_question_index: {state.current_question_index}")
-    print(f"[AskQuestion] 🔍 q_a_pair BEFORE store: {state.q_a_pair}")
-    print(f"[AskQuestion] 🔍 asked_question_ids BEFORE store: {state.asked_question_ids}")
+    stored = False
 
     try:
         # Only store if there is an answer and question is not already stored
@@ -178,29 +206,36 @@ async def store_answer(state: InterviewModel, config: dict = None):
                     "answer": state.latest_answer
                 }
                 state.q_a_pair.append(new_qa_pair)
-                print(f"[AskQuestion] ✅ Stored Q&A pair. Total so far: {len(state.q_a_pair)}")
+                stored = True
+                # history is written behind, in batches, off the turn's path
+                attempt_recorder.record_answer(state)
+                # score it in the background while the candidate reads the next question
+                answer_evaluator.schedule(state)
             else:
-                print(f"[AskQuestion] ⚠️ Question already stored, skipping duplicate storage.")
+                log.debug("Question already stored, skipping duplicate storage")
         else:
-            print(f"[AskQuestion] ⚠️ Skipping store - missing current_question or latest_answer.")
+            log.debug("Skipping store - missing current_question or latest_answer")
 
         # IMPORTANT: track current_question_id in asked_question_ids if present
         if getattr(state, "current_question_id", None) is not None:
             if state.current_question_id not in (state.asked_question_ids or []):
                 state.asked_question_ids.append(state.current_question_id)
-                print(f"[AskQuestion] 🔁 Added current_question_id to asked_question_ids: {state.current_question_id}")
-            else:
-                print(f"[AskQuestion] 🔁 current_question_id already present in asked_question_ids: {state.current_question_id}")
+
+        answer_evaluator.collect(state)
 
         state.current_question_index += 1
-        elapsed = time.time() - start_ts
-        print(f"[AskQuestion] 🔄 Incremented index to: {state.current_question_index} (took {elapsed:.3f}s)")
-        print(f"[AskQuestion] 💾 === STORE_ANSWER NODE END ===")
-        print(f"[AskQuestion] 🔍 q_a_pair AFTER store: {state.q_a_pair}")
-        print(f"[AskQuestion] 🔍 asked_question_ids AFTER store: {state.asked_question_ids}")
+        log.info(
+            "store_answer",
+            extra={"fields": {
+                "stored": stored,
+                "question_id": state.current_question_id,
+                "answered": len(state.q_a_pair),
+                "index": state.current_question_index,
+                "ms": round((time.time() - start_ts) * 1000, 1),
+            }}
+        )
 
     except Exception as e:
-        print(f"[AskQuestion] ❌ [Store Answer Error]: {e}")
-        traceback.print_exc()
+        log.exception("Store answer error: %s", e)
 
     return state
@@ -3,23 +3,18 @@ from langchain_core.runnables import RunnableLambda
 from models.models import SessionType, DifficultyLevel
 from models.interview import InterviewModel
 from core.config import settings
+from core.logger import get_logger
 import random
 
+log = get_logger("nodes.session")
+
 async def initialize_session(state, config: dict = None):
     """
     Initialize the interview session with total questions and reset q_a_pair.
     """
     try:
-        print(f"\n")
-        print(f"🔍 Input state - session_type: {state.session_type}")
-        print(f"🔍 Input state - level: {state.level}")
-        print(f"🔍 Input state - q_a_pair length: {len(state.q_a_pair)}")
-        
-    
         total_questions = random.randint(settings.MIN_QUESTIONS_PER_SESSION, settings.MAX_QUESTIONS_PER_SESSION)
         
-        print(f"🟢 Setting total_questions: {total_questions}")
-        
         # Reset q_a_pair for new session
         state.q_a_pair = []
         state.asked_question_ids = []
@@ -27,16 +22,16 @@ async def initialize_session(state, config: dict = None):
         state.current_question_index = 0
         state.total_questions = total_questions
         state.session_status = "not_done"
-        
-        print(f"🟢 Reset q_a_pair length: {len(state.q_a_pair)}")
-        print(f"🟢 === INITIALIZE_SESSION NODE END ===")
+
+        log.info(
+            "initialize_session",
+            extra={"fields": {"session_type": state.session_type, "level": state.level, "total": total_questions}}
+        )
         
         return state
         
     except Exception as e:
-        print(f"❌ [Initialize Session Error]: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Initialize session error: %s", e)
         return state
 
 
@@ -50,15 +45,15 @@ async def check_if_done(state, config: dict = None):
             total_questions = state.get('total_questions', 0)
             session_status = "done" if current_index >= total_questions else "not_done"
             state['session_status'] = session_status
-            print(f"🔍 Check if done: current={current_index}, total={total_questions}, status={session_status}")
+            log.debug("Check if done: current=%s total=%s status=%s", current_index, total_questions, session_status)
             return state  
         else:
             session_status = "done" if state.current_question_index >= state.total_questions else "not_done"
             state.session_status = session_status
-            print(f"🔍 Check if done: current={state.current_question_index}, total={state.total_questions}, status={session_status}")
+            log.debug("Check if done: current=%s total=%s status=%s", state.current_question_index, state.total_questions, session_status)
             return state
     except Exception as e:
-        print(f"[Check Done Error]: {e}")
+        log.exception("Check done error: %s", e)
         if isinstance(state, dict):
             state['session_status'] = "not_done"
             return state 
@@ -0,0 +1,136 @@
+"""
+Concurrent-writer test for the database engine settings.
+
+Starts many writer tasks, each on its own AsyncSession. Every writer persists
+its interview state once per turn through SessionService.save_state (a select
+then an insert or update, and a commit), which is the write pattern of every
+interview turn. The database is a migrated temporary SQLite file. The report
+gives committed writes per second, latency percentiles and the number of
+failed writes ("database is locked").
+
+It then checks the result and exits with status 1 unless every write
+committed, every writer's stored state holds all of its turns, and the
+connections really run in the requested journal mode. The second example
+(the old defaults) is expected to fail that check.
+
+    python script/bench_db_writers.py --writers 50 --turns 40
+    python script/bench_db_writers.py --journal-mode DELETE --synchronous FULL --busy-timeout-ms 0
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def configure_environment(args, tmp: str) -> None:
+    """Settings are read at import time, so this runs before any app module is imported."""
+    os.environ.update({
+        "DATABASE_URL": f"sqlite:///{os.path.join(tmp, 'writers.db')}",
+        "SQLITE_JOURNAL_MODE": args.journal_mode,
+        "SQLITE_SYNCHRONOUS": args.synchronous,
+        "SQLITE_BUSY_TIMEOUT_MS": str(args.busy_timeout_ms),
+        "DB_POOL_SIZE": str(args.pool_size),
+        "DB_MAX_OVERFLOW": str(args.max_overflow),
+        "LOG_LEVEL": "WARNING",
+    })
+
+
+async def writer(index: int, args, latencies: list, errors: list) -> None:
+    from sqlalchemy.exc import OperationalError
+    from database import AsyncSessionLocal
+    from models.interview import InterviewModel
+    from services.session_service import SessionService
+
+    state = InterviewModel(session_id=f"writer-{index}", user_id=1, session_type="hr", level="easy")
+    for turn in range(args.turns):
+        state.q_a_pair.append({"question": f"Question {turn}?", "answer": "An answer " * 20})
+        state.current_question_index = turn + 1
+        start = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            try:
+                await SessionService(db).save_state(state)
+                latencies.append(time.perf_counter() - start)
+            except OperationalError as e:
+                await db.rollback()
+                errors.append(str(e.orig))
+
+
+async def verify(args, errors: list) -> list:
+    """Problems found after the run; empty when the engine settings held up."""
+    from sqlalchemy import select, text
+    from database import AsyncSessionLocal
+    from models.models import InterviewSession
+
+    problems = []
+    if errors:
+        problems.append(f"{len(errors)} of {args.writers * args.turns} writes failed")
+    async with AsyncSessionLocal() as db:
+        journal_mode = (await db.execute(text("PRAGMA journal_mode"))).scalar()
+        if journal_mode.upper() != args.journal_mode.upper():
+            problems.append(f"journal_mode is {journal_mode}, expected {args.journal_mode}")
+        stored = dict((await db.execute(select(InterviewSession.session_id, InterviewSession.state))).all())
+    incomplete = [
+        index for index in range(args.writers)
+        if len((stored.get(f"writer-{index}") or {}).get("q_a_pair", [])) != args.turns
+    ]
+    if incomplete:
+        problems.append(f"{len(incomplete)} writers did not persist all {args.turns} turns")
+    return problems
+
+
+async def run(args) -> bool:
+    from database import async_engine
+
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(writer(i, args, latencies, errors) for i in range(args.writers)))
+    elapsed = time.perf_counter() - start
+    problems = await verify(args, errors)
+    await async_engine.dispose()
+
+    latencies.sort()
+    pct = lambda p: latencies[min(int(len(latencies) * p / 100), len(latencies) - 1)] * 1000 if latencies else 0.0
+    print(f"journal_mode={args.journal_mode} synchronous={args.synchronous} "
+          f"busy_timeout={args.busy_timeout_ms}ms pool={args.pool_size}+{args.max_overflow}")
+    print(f"writers={args.writers} turns={args.turns} committed={len(latencies)} failed={len(errors)} "
+          f"in {elapsed:.2f}s -> {len(latencies) / elapsed:,.0f} writes/s")
+    print(f"latency p50 {pct(50):.1f}ms  p95 {pct(95):.1f}ms  p99 {pct(99):.1f}ms")
+    for message in sorted(set(errors))[:3]:
+        print(f"  error: {message} (x{errors.count(message)})")
+    for problem in problems:
+        print(f"❌ {problem}")
+    if not problems:
+        print("✅ all writes committed")
+    return not problems
+
+
+def main(args) -> bool:
+    with tempfile.TemporaryDirectory() as tmp:
+        configure_environment(args, tmp)
+        from script.init_db import migrate
+        from database import SessionLocal, engine
+        from models.models import User, DifficultyLevel
+
+        migrate()
+        with SessionLocal() as db:
+            db.add(User(id=1, name="Writer", email="writer@example.com", password_hash="x", level=DifficultyLevel.easy))
+            db.commit()
+        engine.dispose()
+        return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=40)
+    parser.add_argument("--journal-mode", default="WAL")
+    parser.add_argument("--synchronous", default="NORMAL")
+    parser.add_argument("--busy-timeout-ms", type=int, default=5000)
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--max-overflow", type=int, default=10)
+    sys.exit(0 if main(parser.parse_args()) else 1)
@@ -0,0 +1,91 @@
+"""
+Benchmark per-turn CPU and allocation cost of the interview engine modes.
+
+Runs complete interviews through InterviewEngine.run_step in "direct"
+(transition table) and "langgraph" (compiled graph + astream) mode against
+a seeded temporary SQLite database and a zero-latency fake LLM, with
+prefetching and the LLM question pool off so only the engine is measured.
+
+    python script/bench_engine.py --interviews 200
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.update({
+    "LLM_PROVIDER": "fake",
+    "LLM_FAKE_LATENCY_MS": "0",
+    "QUESTION_PREFETCH_ENABLED": "false",
+    "LLM_POOL_ENABLED": "false",
+    "LOG_LEVEL": "WARNING",
+})
+
+ANSWER = "I would clarify the requirements first, then compare two designs and their trade-offs."
+
+
+async def run_interviews(engine, count: int, measure_alloc: bool):
+    from database import AsyncSessionLocal
+    from models.interview import InterviewModel
+
+    cpu = 0.0
+    turns = 0
+    peak_bytes = 0
+    async with AsyncSessionLocal() as db:
+        for i in range(count):
+            state = InterviewModel(user_id=1, session_type="hr" if i % 2 else "technical", level="easy")
+            first_call = True
+            while True:
+                if measure_alloc:
+                    tracemalloc.reset_peak()
+                    baseline = tracemalloc.get_traced_memory()[0]
+                start = time.process_time()
+                state = await engine.run_step(state, db=db, first_call=first_call)
+                cpu += time.process_time() - start
+                if measure_alloc:
+                    peak_bytes += tracemalloc.get_traced_memory()[1] - baseline
+                turns += 1
+                first_call = False
+                if state.session_status == "done":
+                    break
+                state.latest_answer = ANSWER
+    return cpu, turns, peak_bytes
+
+
+async def main(args):
+    from graph import InterviewEngine
+    from services.question_index import question_index
+    from database import AsyncSessionLocal, async_engine
+
+    async with AsyncSessionLocal() as db:
+        await question_index.arefresh(db)
+
+    print(f"{'mode':<10} {'turns':>6} {'CPU µs/turn':>12} {'peak alloc KiB/turn':>20}")
+    for mode in ("langgraph", "direct"):
+        engine = InterviewEngine(mode=mode)
+        await run_interviews(engine, 5, measure_alloc=False)  # warm-up
+        cpu, turns, _ = await run_interviews(engine, args.interviews, measure_alloc=False)
+
+        tracemalloc.start()
+        _, alloc_turns, peak = await run_interviews(engine, max(args.interviews // 10, 1), measure_alloc=True)
+        tracemalloc.stop()
+        print(f"{mode:<10} {turns:>6} {cpu / turns * 1e6:>12.1f} {peak / alloc_turns / 1024:>20.1f}")
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=200)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        # database.py uses a relative sqlite path, so the seeded DB lives in tmp
+        os.chdir(tmp)
+        from script.load_test import seed_database
+        seed_database(1)
+        asyncio.run(main(args))
@@ -0,0 +1,88 @@
+"""
+Benchmark the per-turn cost of trace logging in store_answer.
+
+Compares the old print() tracing (which dumped the whole q_a_pair twice per
+turn) with the queued logger, for growing session lengths. Output goes to
+os.devnull so only the tracing work itself is measured.
+
+    python script/bench_logging_overhead.py --turns 2000
+"""
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import sys
+import time
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.logger import logger, console_handler, stop_logging
+from models.interview import InterviewModel
+from nodes.question_nodes import store_answer
+
+ANSWER = "I would start by clarifying requirements, then sketch the data model. " * 4
+
+
+def _state(answered: int) -> InterviewModel:
+    return InterviewModel(
+        session_type="technical",
+        level="medium",
+        total_questions=answered + 1,
+        current_question_index=answered,
+        current_question=f"Question {answered}?",
+        current_question_id=answered,
+        latest_answer=ANSWER,
+        q_a_pair=[{"question": f"Question {i}?", "answer": ANSWER} for i in range(answered)],
+        asked_question_ids=list(range(answered)),
+    )
+
+
+def legacy_trace(state: InterviewModel) -> None:
+    """The print() tracing store_answer used to do on every turn."""
+    print(f"\n[AskQuestion] 💾 === STORE_ANSWER NODE START ===")
+    print(f"[AskQuestion] 🔍 latest_answer: {state.latest_answer}")
+    print(f"[AskQuestion] 🔍 current_question: {state.current_question}")
+    print(f"[AskQuestion] 🔍 current_question_id: {state.current_question_id}")
+    print(f"[AskQuestion] 🔍 current_question_index: {state.current_question_index}")
+    print(f"[AskQuestion] 🔍 q_a_pair BEFORE store: {state.q_a_pair}")
+    print(f"[AskQuestion] 🔍 asked_question_ids BEFORE store: {state.asked_question_ids}")
+    print(f"[AskQuestion] ✅ Stored Q&A pair. Total so far: {len(state.q_a_pair)}")
+    print(f"[AskQuestion] 🔁 Added current_question_id to asked_question_ids: {state.current_question_id}")
+    print(f"[AskQuestion] 🔄 Incremented index to: {state.current_question_index}")
+    print(f"[AskQuestion] 💾 === STORE_ANSWER NODE END ===")
+    print(f"[AskQuestion] 🔍 q_a_pair AFTER store: {state.q_a_pair}")
+    print(f"[AskQuestion] 🔍 asked_question_ids AFTER store: {state.asked_question_ids}")
+
+
+async def bench_store_answer(answered: int, turns: int, legacy: bool) -> float:
+    states = [_state(answered) for _ in range(turns)]
+    start = time.perf_counter()
+    for state in states:
+        if legacy:
+            legacy_trace(state)
+        await store_answer(state)
+    return (time.perf_counter() - start) / turns * 1e6
+
+
+def main(args):
+    with open(os.devnull, "w") as sink:
+        console_handler.setStream(sink)
+        print(f"{'answered':>8} {'print (µs/turn)':>16} {'logger (µs/turn)':>17}")
+        for answered in (5, 10, 50):
+            # the legacy run keeps the new logger quiet so only print() is counted
+            logger.setLevel(logging.WARNING)
+            with contextlib.redirect_stdout(sink):
+                legacy = asyncio.run(bench_store_answer(answered, args.turns, legacy=True))
+            logger.setLevel(args.level)
+            current = asyncio.run(bench_store_answer(answered, args.turns, legacy=False))
+            print(f"{answered:>8} {legacy:>16.1f} {current:>17.1f}")
+        stop_logging()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--level", default="INFO", help="logger level for the new tracing run")
+    main(parser.parse_args())
@@ -0,0 +1,61 @@
+"""
+Benchmark password verification cost per hashing setting.
+
+For every setting it reports single-thread logins/second (= logins per second
+per core) and the throughput of the PasswordHasher thread pool, so the
+BCRYPT_ROUNDS / PASSWORD_SCHEMES choice can be sized against expected bursts.
+
+    python script/bench_password_hashing.py --logins 64 --workers 4
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.security import build_pwd_context
+from core.password_hashing import PasswordHasher
+
+PASSWORD = "Sup3r$ecret"
+
+SETTINGS = [
+    ("bcrypt rounds=10", dict(schemes=["bcrypt"], bcrypt_rounds=10)),
+    ("bcrypt rounds=12", dict(schemes=["bcrypt"], bcrypt_rounds=12)),
+    ("bcrypt rounds=13", dict(schemes=["bcrypt"], bcrypt_rounds=13)),
+    ("argon2 t=2 m=19MiB", dict(schemes=["argon2"], argon2_time_cost=2, argon2_memory_cost=19456, argon2_parallelism=1)),
+    ("argon2 t=3 m=64MiB", dict(schemes=["argon2"], argon2_time_cost=3, argon2_memory_cost=65536, argon2_parallelism=1)),
+]
+
+
+def bench_single(context, hashed: str, logins: int) -> float:
+    start = time.perf_counter()
+    for _ in range(logins):
+        context.verify(PASSWORD, hashed)
+    return logins / (time.perf_counter() - start)
+
+
+async def bench_pool(context, hashed: str, logins: int, workers: int) -> float:
+    hasher = PasswordHasher(context, max_workers=workers, max_queue=logins)
+    start = time.perf_counter()
+    await asyncio.gather(*(hasher.verify_and_update(PASSWORD, hashed) for _ in range(logins)))
+    return logins / (time.perf_counter() - start)
+
+
+def main(args):
+    print(f"{'setting':<22} {'logins/s/core':>14} {f'pool x{args.workers} logins/s':>20}")
+    for label, options in SETTINGS:
+        context = build_pwd_context(**options)
+        hashed = context.hash(PASSWORD)
+        per_core = bench_single(context, hashed, max(args.logins // 4, 4))
+        pooled = asyncio.run(bench_pool(context, hashed, args.logins, args.workers))
+        print(f"{label:<22} {per_core:>14.1f} {pooled:>20.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    main(parser.parse_args())
@@ -0,0 +1,175 @@
+"""
+Benchmark response serialization and bytes on the wire for interview payloads.
+
+Builds the InterviewResponse of a finished interview (Q&A pairs and
+feedback; the per-answer evaluations and feedback cache of the session stay
+server-side and are left out of the response) at several session lengths,
+answers alternating between prose and code. For
+each size it times what a request pays after the handler returns:
+
+- encode: pydantic dump (as FastAPI does for response_model) plus the body
+  encoder: stdlib json (Starlette JSONResponse), orjson or msgpack (CompactResponse)
+- gzip / br: compressing that body at the levels CompressionMiddleware uses
+
+    python script/bench_serialization.py
+    python script/bench_serialization.py --sizes 5 10 50 --gzip-level 6 --brotli-quality 5
+"""
+import argparse
+import gzip
+import os
+import random
+import statistics
+import sys
+import time
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import brotli
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from core.responses import CompactResponse, JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, wire_format
+from models.interview import InterviewModel, InterviewResponse
+from services.feedback_cache import feedback_key
+
+PROSE = (
+    "In my last role I owned the migration of our billing service to an event-driven design. "
+    "I started by mapping every consumer of the old synchronous API, then introduced an outbox "
+    "table so writes and events stayed consistent. The hardest part was backfilling two years "
+    "of invoices without double-charging anyone; we ran both paths in shadow mode for a week, "
+    "diffed the results nightly and only cut over once the diff stayed empty for three days. "
+)
+CODE = '''def lru_cache(capacity):
+    """Doubly linked list plus hash map: O(1) get and put."""
+    class Node:
+        __slots__ = ("key", "value", "prev", "next")
+        def __init__(self, key=None, value=None):
+            self.key, self.value, self.prev, self.next = key, value, None, None
+    head, tail, index = Node(), Node(), {}
+    head.next, tail.prev = tail, head
+    def unlink(node):
+        node.prev.next, node.next.prev = node.next, node.prev
+    def push_front(node):
+        node.next, node.prev = head.next, head
+        head.next.prev = node
+        head.next = node
+    def get(key):
+        node = index.get(key)
+        if node is None:
+            return None
+        unlink(node)
+        push_front(node)
+        return node.value
+    def put(key, value):
+        if key in index:
+            unlink(index.pop(key))
+        elif len(index) >= capacity:
+            lru = tail.prev
+            unlink(lru)
+            del index[lru.key]
+        node = Node(key, value)
+        index[key] = node
+        push_front(node)
+    return get, put
+'''
+
+
+def answer_text(rng: random.Random, code: bool) -> str:
+    """
+    An answer of the same length and vocabulary as CODE or PROSE, in a random
+    word order: every answer differs, as real ones do, so compression ratios
+    are not inflated by repeated text.
+    """
+    source = CODE if code else PROSE
+    words = source.split()
+    text = " ".join(rng.choice(words) for _ in range(len(words)))
+    if code:
+        words = text.split(" ")
+        text = "\n".join(" ".join(words[i:i + 6]) for i in range(0, len(words), 6))
+    return text
+
+
+def finished_interview(questions: int, seed: int = 1) -> InterviewResponse:
+    rng = random.Random(seed)
+    q_a_pair = [
+        {"question": f"Question {i + 1}: walk me through how you would approach problem {i + 1}?",
+         "answer": answer_text(rng, code=bool(i % 2))}
+        for i in range(questions)
+    ]
+    evaluations = [
+        {"question": qa["question"], "answer": qa["answer"],
+         "evaluation": "Clear structure and a correct approach; quantify the impact next time.", "score": 7.0}
+        for qa in q_a_pair
+    ]
+    feedback = {
+        "score": 7,
+        "feedback": "Solid answers overall with clear reasoning and working code.",
+        "areas_for_improvement": ["Quantify impact", "Discuss trade-offs earlier", "Test edge cases"],
+    }
+    state = InterviewModel(
+        session_id="3f9c2a4e-5b7d-4e1a-9c3b-2d8f6a1e7b90",
+        user_id=1,
+        session_type="technical",
+        level="medium",
+        current_question_index=questions,
+        total_questions=questions,
+        q_a_pair=q_a_pair,
+        asked_question_ids=list(range(1, questions // 2 + 1)),
+        asked_llm_questions=[qa["question"] for qa in q_a_pair[questions // 2:]],
+        session_status="done",
+        feedback=feedback,
+        evaluations=evaluations,
+        feedback_cache={feedback_key("medium", q_a_pair): {
+            "feedback": feedback, "summary": None, "evaluations": evaluations
+        }},
+        version=questions + 1,
+    )
+    return InterviewResponse(message=feedback["feedback"], done=True, state=state)
+
+
+def timed(fn, repeat: int):
+    """Median seconds per call and the last result."""
+    samples, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+
+def main(args) -> None:
+    adapter = TypeAdapter(InterviewResponse)
+
+    def encoder(response_class, media_type):
+        def encode():
+            with wire_format(media_type):
+                return response_class(adapter.dump_python(response, mode="json")).body
+        return encode
+
+    encoders = {
+        "json (stdlib)": encoder(JSONResponse, JSON_MEDIA_TYPE),
+        "orjson": encoder(CompactResponse, JSON_MEDIA_TYPE),
+        "msgpack": encoder(CompactResponse, MSGPACK_MEDIA_TYPE),
+    }
+    print(f"gzip level {args.gzip_level}, brotli quality {args.brotli_quality}, median of {args.repeat} runs\n")
+    print(f"{'questions':>9} {'format':<14} {'encode us':>10} {'bytes':>9} "
+          f"{'gzip bytes':>11} {'gzip us':>9} {'br bytes':>9} {'br us':>8}")
+    for size in args.sizes:
+        response = finished_interview(size)
+        for name, encode in encoders.items():
+            encode_s, body = timed(encode, args.repeat)
+            gzip_s, gzipped = timed(lambda: gzip.compress(body, compresslevel=args.gzip_level), args.repeat)
+            br_s, brotlied = timed(lambda: brotli.compress(body, quality=args.brotli_quality), args.repeat)
+            print(f"{size:>9} {name:<14} {encode_s * 1e6:>10.1f} {len(body):>9,} "
+                  f"{len(gzipped):>11,} {gzip_s * 1e6:>9.1f} {len(brotlied):>9,} {br_s * 1e6:>8.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 10, 50], help="questions per session")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--gzip-level", type=int, default=6)
+    parser.add_argument("--brotli-quality", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,120 @@
+"""
+Benchmark the email outbox against a local SMTP stand-in (aiosmtpd).
+
+Compares one SMTP connection per message (the old send path) with the
+pooled OutboxWorker and reports throughput in messages per second.
+
+    python script/bench_smtp_outbox.py --messages 500 --pool-size 3
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+os.environ.setdefault("SMTP_FROM", "bench@example.com")
+
+import aiosmtplib
+from aiosmtpd.controller import Controller
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from core.email_sender import build_email_message
+from core.mail_outbox import SMTPConnectionPool, OutboxWorker
+from models.models import EmailOutbox
+
+PDF_BYTES = b"%PDF-1.4\n" + b"0" * 50_000  # roughly the size of a feedback report
+
+
+class CountingHandler:
+    """
+    Accepts everything. connect_latency is added to EHLO to stand in for the
+    round trips a real relay costs per connection (TCP, STARTTLS, AUTH).
+    """
+
+    def __init__(self, connect_latency: float = 0.0):
+        self.received = 0
+        self.connect_latency = connect_latency
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        session.host_name = hostname
+        await asyncio.sleep(self.connect_latency)
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 OK"
+
+
+async def bench_per_message(host: str, port: int, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        msg = build_email_message(f"user{i}@example.com", "Report", "body", PDF_BYTES, "report.pdf")
+        await aiosmtplib.send(msg, hostname=host, port=port, start_tls=False)
+    return time.perf_counter() - start
+
+
+async def bench_outbox(host: str, port: int, count: int, pool_size: int, batch_size: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/outbox.db")
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(EmailOutbox.__table__.create)
+        worker = OutboxWorker(
+            pool=SMTPConnectionPool(host, port, "", "", start_tls=False, size=pool_size),
+            session_factory=session_factory,
+            batch_size=batch_size,
+        )
+        await worker.prepare()
+
+        async with session_factory() as db:
+            db.add_all([
+                EmailOutbox(
+                    to_email=f"user{i}@example.com",
+                    subject="Report",
+                    body="body",
+                    attachment=PDF_BYTES,
+                    attachment_name="report.pdf"
+                )
+                for i in range(count)
+            ])
+            await db.commit()
+
+        start = time.perf_counter()
+        while await worker.run_once():
+            pass
+        elapsed = time.perf_counter() - start
+
+        await worker.pool.close()
+        await engine.dispose()
+        print(f"   outbox: sent={worker.sent} retried={worker.retried} failed={worker.failed} "
+              f"smtp_connects={worker.pool.connects}")
+        return elapsed
+
+
+async def main(args):
+    handler = CountingHandler(connect_latency=args.connect_latency_ms / 1000)
+    controller = Controller(handler, hostname="127.0.0.1", port=args.port)
+    controller.start()
+    try:
+        per_message = await bench_per_message("127.0.0.1", args.port, args.messages)
+        print(f"📧 connection per message: {args.messages / per_message:8.1f} msg/s ({per_message:.2f}s)")
+
+        pooled = await bench_outbox("127.0.0.1", args.port, args.messages, args.pool_size, args.batch_size)
+        print(f"📧 pooled outbox worker:   {args.messages / pooled:8.1f} msg/s ({pooled:.2f}s)")
+        print(f"✅ SMTP stand-in received {handler.received} messages")
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--pool-size", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--connect-latency-ms", type=float, default=50,
+                        help="simulated per-connection handshake cost of a remote relay")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,151 @@
+"""
+Query-plan check for the hot query patterns.
+
+Builds a temporary SQLite database with the Alembic migrations, seeds it with
+a benchmark-sized data set, runs ANALYZE and asks SQLite for the plan of
+every query in HOT_QUERIES. The check fails (exit code 1) if any of them
+needs a full table scan.
+
+    python script/check_query_plans.py
+    python script/check_query_plans.py --revision 0002   # plans before the composite indexes
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, insert, select
+
+from models.models import (
+    User, QuestionBank, InterviewSession, QuestionAttempt, EmailOutbox, PerformanceRollup,
+    QuestionType, DifficultyLevel, SessionType
+)
+from script.import_questions import import_records
+from script.init_db import migrate
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# name -> statement, shaped like the queries the app issues
+HOT_QUERIES = {
+    "question selection (type, difficulty)": select(QuestionBank.id).where(
+        QuestionBank.type.in_([QuestionType.coding, QuestionType.sql, QuestionType.conceptual]),
+        QuestionBank.difficulty == DifficultyLevel.medium
+    ),
+    "question import dedupe (content_hash)": select(QuestionBank.id).where(QuestionBank.content_hash == "0" * 64),
+    "login (users.email)": select(User).where(User.email == "candidate42@example.com"),
+    "session load (session_id)": select(InterviewSession).where(InterviewSession.session_id == "session-42"),
+    "user history (user_id, started_at)": select(InterviewSession.id, InterviewSession.started_at)
+        .where(InterviewSession.user_id == 42)
+        .order_by(InterviewSession.started_at.desc())
+        .limit(20),
+    "session attempts (session_id, created_at)": select(QuestionAttempt)
+        .where(QuestionAttempt.session_id == 42)
+        .order_by(QuestionAttempt.created_at),
+    "user stats (performance_rollups.user_id)": select(PerformanceRollup).where(PerformanceRollup.user_id == 42),
+    "outbox due (status, next_attempt_at)": select(EmailOutbox.id)
+        .where(EmailOutbox.status == "pending", EmailOutbox.next_attempt_at <= NOW)
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(50),
+}
+
+
+def seed(engine, args) -> None:
+    rng = random.Random(args.seed)
+    types = list(QuestionType)
+    levels = list(DifficultyLevel)
+    import_records(engine, (
+        (f"synthetic:{i}", {
+            "type": rng.choice(types),
+            "difficulty": rng.choice(levels),
+            "question_text": f"Synthetic benchmark question {i}?",
+        })
+        for i in range(args.questions)
+    ), out=None)
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"id": i, "name": f"Candidate {i}", "email": f"candidate{i}@example.com",
+             "password_hash": "x", "level": rng.choice(levels)}
+            for i in range(1, args.users + 1)
+        ])
+        conn.execute(insert(InterviewSession), [
+            {"id": i, "session_id": f"session-{i}", "user_id": rng.randint(1, args.users),
+             "session_type": rng.choice(list(SessionType)), "level": rng.choice(levels),
+             "total_questions": 8, "started_at": NOW - timedelta(minutes=i)}
+            for i in range(1, args.sessions + 1)
+        ])
+        conn.execute(insert(QuestionAttempt), [
+            {"session_id": rng.randint(1, args.sessions), "question_id": rng.randint(1, args.questions),
+             "user_answer": "answer", "created_at": NOW - timedelta(seconds=i)}
+            for i in range(args.attempts)
+        ])
+        conn.execute(insert(PerformanceRollup), [
+            {"user_id": user_id, "session_type": session_type, "level": level, "sessions": 3,
+             "score_sum": 18.0, "score_sq_sum": 110.0, "best_score": 7.0, "last_session_at": NOW}
+            for user_id in range(1, args.users + 1)
+            for session_type in SessionType
+            for level in levels
+            if rng.random() < 0.5
+        ])
+        conn.execute(insert(EmailOutbox), [
+            {"to_email": f"candidate{i}@example.com", "subject": "Feedback", "body": "",
+             "status": "sent" if i % 20 else "pending", "next_attempt_at": NOW - timedelta(seconds=i)}
+            for i in range(args.outbox)
+        ])
+        conn.exec_driver_sql("ANALYZE")
+
+
+def query_plan(engine, stmt) -> list:
+    """SQLite's EXPLAIN QUERY PLAN details for stmt, with parameters bound exactly as the app binds them."""
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        return "EXPLAIN QUERY PLAN " + statement, parameters
+
+    with engine.connect() as conn:
+        event.listen(conn, "before_cursor_execute", explain, retval=True)
+        try:
+            return [row[-1] for row in conn.execute(stmt)]
+        finally:
+            event.remove(conn, "before_cursor_execute", explain)
+
+
+def is_full_scan(detail: str) -> bool:
+    # "SCAN t" reads the whole table; "SCAN t USING [COVERING] INDEX" still walks a whole index
+    return detail.startswith("SCAN ")
+
+
+def main(args) -> int:
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'plans.db')}"
+        migrate(url, args.revision)
+        engine = create_engine(url)
+        seed(engine, args)
+
+        for name, stmt in HOT_QUERIES.items():
+            plan = query_plan(engine, stmt)
+            scans = [detail for detail in plan if is_full_scan(detail)]
+            failures += bool(scans)
+            print(f"{'FAIL' if scans else 'ok':<5} {name}")
+            for detail in plan:
+                print(f"        {detail}")
+        engine.dispose()
+
+    print(f"\n{len(HOT_QUERIES) - failures}/{len(HOT_QUERIES)} hot queries use an index")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--revision", default="head", help="migrate the benchmark database to this revision")
+    parser.add_argument("--questions", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--sessions", type=int, default=20000)
+    parser.add_argument("--attempts", type=int, default=100000)
+    parser.add_argument("--outbox", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,208 @@
+"""
+Streaming, idempotent question-bank importer.
+
+Reads NDJSON or CSV from files or stdin, one question per line/row, and
+inserts them in batches of multi-row INSERT statements. Duplicates are
+skipped by the unique QuestionBank.content_hash column (sha256 of the
+normalised question text), so the existing table is never read into memory
+and re-running an import only adds what is new.
+
+NDJSON rows are either the seed format
+    {"type": "hr", "difficulty": "easy", "question_data": {"question_text": ..., ...}}
+or flat
+    {"type": "hr", "difficulty": "easy", "question_text": ..., "solution": ..., "hints": [...], "test_cases": [...]}
+CSV needs the columns type, difficulty, question_text; optional solution,
+hints ("|"-separated) and test_cases (JSON).
+
+    python script/import_questions.py bank.ndjson more.csv.gz --batch-size 5000
+    cat bank.ndjson | python script/import_questions.py - --format ndjson
+"""
+import argparse
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, Optional
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert
+
+from models.models import QuestionBank, QuestionType, DifficultyLevel
+
+QUESTION_DATA_FIELDS = ("question_text", "test_cases", "solution", "hints")
+
+
+def content_hash(question_text: str) -> str:
+    """sha256 of the question text with case and whitespace normalised."""
+    normalised = " ".join(question_text.split()).casefold()
+    return hashlib.sha256(normalised.encode("utf-8")).hexdigest()
+
+
+def _open(path: str):
+    if path == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def _format_of(path: str, fmt: str) -> str:
+    if fmt != "auto":
+        return fmt
+    name = path[:-3] if path.endswith(".gz") else path
+    return "csv" if name.endswith(".csv") else "ndjson"
+
+
+def read_rows(path: str, fmt: str = "auto") -> Iterator[tuple]:
+    """Yield (location, raw row) pairs from one NDJSON or CSV source without loading it whole."""
+    fmt = _format_of(path, fmt)
+    with _open(path) as handle:
+        if fmt == "csv":
+            for line_no, row in enumerate(csv.DictReader(handle), start=2):
+                hints = row.get("hints") or ""
+                row["hints"] = [hint.strip() for hint in hints.split("|") if hint.strip()]
+                yield f"{path}:{line_no}", row
+        else:
+            # lines are parsed in to_record so one bad line is reported, not fatal
+            for line_no, line in enumerate(handle, start=1):
+                if line.strip():
+                    yield f"{path}:{line_no}", line
+
+
+def to_record(raw) -> dict:
+    """Validate one raw row (dict or NDJSON line) into QuestionBank insert parameters; raises ValueError when invalid."""
+    if isinstance(raw, str):
+        raw = json.loads(raw)
+    if not isinstance(raw, dict):
+        raise ValueError("expected a JSON object")
+    question_data = raw.get("question_data")
+    if not isinstance(question_data, dict):
+        question_data = {field: raw[field] for field in QUESTION_DATA_FIELDS if field in raw}
+    if isinstance(question_data.get("test_cases"), str):
+        question_data["test_cases"] = json.loads(question_data["test_cases"]) if question_data["test_cases"] else []
+    question_text = (question_data.get("question_text") or "").strip()
+    if not question_text:
+        raise ValueError("missing question_text")
+    question_data = {"test_cases": [], "solution": "N/A", "hints": [], **question_data, "question_text": question_text}
+
+    def enum_member(enum_cls, value):
+        if isinstance(value, enum_cls):
+            return value
+        try:
+            return enum_cls(str(value).strip().lower())
+        except ValueError:
+            raise ValueError(f"invalid {enum_cls.__name__} '{value}'")
+
+    return {
+        "type": enum_member(QuestionType, raw.get("type")),
+        "difficulty": enum_member(DifficultyLevel, raw.get("difficulty")),
+        "question_data": question_data,
+        "content_hash": content_hash(question_text),
+    }
+
+
+def _insert_ignoring_duplicates(dialect: str):
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        return dialect_insert(QuestionBank).on_conflict_do_nothing(index_elements=["content_hash"])
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        return dialect_insert(QuestionBank).on_conflict_do_nothing(index_elements=["content_hash"])
+    if dialect == "mysql":
+        return insert(QuestionBank).prefix_with("IGNORE")
+    raise ValueError(f"Bulk import does not support the '{dialect}' dialect")
+
+
+class ImportStats:
+    def __init__(self):
+        self.read = 0
+        self.inserted = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.started = time.perf_counter()
+
+    def line(self) -> str:
+        elapsed = time.perf_counter() - self.started
+        rate = self.read / elapsed if elapsed else 0.0
+        return (f"read={self.read} inserted={self.inserted} duplicates={self.duplicates} "
+                f"invalid={self.invalid} elapsed={elapsed:.1f}s rate={rate:,.0f} rows/s")
+
+
+def import_records(engine, rows: Iterable[tuple], batch_size: int = 5000,
+                   progress_seconds: float = 2.0, out=sys.stderr) -> ImportStats:
+    """
+    Insert (location, raw row) rows in batches, one transaction per batch so an
+    interrupted import keeps what it loaded. Prints progress to out every
+    progress_seconds (never if out is None).
+    """
+    stmt = _insert_ignoring_duplicates(engine.dialect.name)
+    stats = ImportStats()
+    last_report = time.perf_counter()
+    batch = {}
+
+    def flush():
+        if not batch:
+            return
+        created_at = datetime.now(timezone.utc)
+        params = [{**record, "created_at": created_at} for record in batch.values()]
+        with engine.begin() as conn:
+            inserted = conn.execute(stmt, params).rowcount
+        stats.inserted += inserted
+        stats.duplicates += len(params) - inserted
+        batch.clear()
+
+    for location, raw in rows:
+        stats.read += 1
+        try:
+            record = to_record(raw)
+        except (ValueError, TypeError, AttributeError) as e:
+            stats.invalid += 1
+            if out is not None:
+                print(f"skipping {location}: {e}", file=out)
+            continue
+        if record["content_hash"] in batch:
+            stats.duplicates += 1
+            continue
+        batch[record["content_hash"]] = record
+        if len(batch) >= batch_size:
+            flush()
+            if out is not None and time.perf_counter() - last_report >= progress_seconds:
+                print(stats.line(), file=out)
+                last_report = time.perf_counter()
+    flush()
+    return stats
+
+
+def _all_rows(paths, fmt):
+    for path in paths:
+        yield from read_rows(path, fmt)
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", default=["-"], help="NDJSON/CSV files (optionally .gz); - for stdin")
+    parser.add_argument("--format", choices=["auto", "ndjson", "csv"], default="auto",
+                        help="auto picks csv for *.csv[.gz] and ndjson otherwise (stdin: ndjson)")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--progress-seconds", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    from database import engine
+    from script.init_db import adopt_unversioned, migrate
+
+    # content_hash and its unique index come from migration 0002
+    adopt_unversioned()
+    migrate()
+    stats = import_records(engine, _all_rows(args.paths, args.format), args.batch_size, args.progress_seconds)
+    print(f"✅ done: {stats.line()}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,68 @@
+import argparse
 import sys
 import os
 
 # Add root directory to PYTHONPATH
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database import Base, engine
-from models.models import User, QuestionBank
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
 
-def initialize_database():
-    print("Dropping all tables...")
-    Base.metadata.drop_all(bind=engine)
-    print("Creating all tables...")
-    print("Creating all tables...")
-    Base.metadata.create_all(bind=engine)
+from database import Base, engine, DATABASE_URL
+from models.models import User, QuestionBank, EmailOutbox
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
+
+def alembic_config(url: str = None) -> Config:
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "migrations"))
+    config.set_main_option("sqlalchemy.url", url or DATABASE_URL)
+    # run in-process: keep the application's logging setup
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def migrate(url: str = None, revision: str = "head") -> None:
+    """Bring the schema up to revision with the Alembic migrations in migrations/."""
+    command.upgrade(alembic_config(url), revision)
+
+
+def adopt_unversioned() -> None:
+    """
+    Stamp a database created by the old create_all() setup with the revision
+    its schema matches, so the migrations after it can be applied.
+    """
+    inspector = inspect(engine)
+    tables = inspector.get_table_names()
+    if "alembic_version" in tables or "question_bank" not in tables:
+        return
+    if "email_outbox" not in tables:
+        # part of the baseline, but databases older than the outbox never had it:
+        # the outbox worker used to create it at startup
+        print("Creating email_outbox, missing from the baseline schema")
+        EmailOutbox.__table__.create(bind=engine)
+    columns = {column["name"] for column in inspector.get_columns("question_bank")}
+    revision = "0002" if "content_hash" in columns else "0001"
+    print(f"Existing schema without migration history, stamping revision {revision}")
+    command.stamp(alembic_config(), revision)
+
+
+def initialize_database(drop: bool = False):
+    if drop:
+        print("Dropping all tables...")
+        Base.metadata.drop_all(bind=engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DROP TABLE IF EXISTS alembic_version")
+    else:
+        adopt_unversioned()
+    print("Applying migrations...")
+    migrate()
     print("✅ Database initialized successfully.")
 
+
 if __name__ == "__main__":
-    initialize_database()
+    parser = argparse.ArgumentParser(description="Create or upgrade the database schema.")
+    parser.add_argument("--drop", action="store_true", help="drop every table first (destroys all data)")
+    initialize_database(drop=parser.parse_args().drop)
@@ -0,0 +1,223 @@
+"""
+Concurrent-candidate load generator for the interview API.
+
+Runs fully offline: the app is served in-process over httpx's ASGI transport,
+the LLM is the fake provider, the database is a freshly seeded SQLite file in
+a temporary directory and feedback emails go to a local SMTP stand-in.
+
+Each simulated candidate logs in, runs a complete HR or technical interview
+through /api/interview/interview and requests the feedback email. The report
+gives throughput and p50/p95/p99 latency per turn type:
+
+    login, start, middle (answer -> next question), final (answer -> feedback),
+    feedback_email
+
+    python script/load_test.py --candidates 50 --profile linear --ramp-seconds 10 --think-ms 500
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PASSWORD = "Load$Test123"
+ANSWER = (
+    "First I would clarify the requirements and constraints, then outline a simple approach, "
+    "discuss its trade-offs and finally describe how I would test and monitor it."
+)
+TURN_TYPES = ["login", "start", "middle", "final", "feedback_email"]
+
+
+def configure_environment(args) -> None:
+    """Settings are read at import time, so this runs before any app module is imported."""
+    os.environ.update({
+        "LLM_PROVIDER": "fake",
+        "LLM_FAKE_LATENCY_MS": str(args.llm_latency_ms),
+        "LLM_FAKE_FAILURE_RATE": str(args.llm_failure_rate),
+        "LLM_FAKE_SEED": str(args.seed),
+        "SMTP_SERVER": "127.0.0.1",
+        "SMTP_PORT": str(args.smtp_port),
+        "SMTP_USER": "",
+        "SMTP_FROM": "loadtest@example.com",
+        "SMTP_STARTTLS": "false",
+        "LOG_LEVEL": os.environ.get("LOG_LEVEL", "WARNING"),
+    })
+
+
+def seed_database(candidates: int) -> None:
+    from database import Base, engine, SessionLocal
+    from core.security import pwd_context
+    from models.models import User, QuestionBank, DifficultyLevel
+    from script.seed_question import questions
+
+    Base.metadata.create_all(bind=engine)
+    password_hash = pwd_context.hash(PASSWORD)
+    with SessionLocal() as db:
+        db.add_all([
+            QuestionBank(type=q["type"], difficulty=q["difficulty"], question_data=q["question_data"])
+            for q in questions
+        ])
+        db.add_all([
+            User(
+                id=i + 1,
+                name=f"Candidate {i + 1}",
+                email=f"candidate{i + 1}@example.com",
+                password_hash=password_hash,
+                level=DifficultyLevel.easy
+            )
+            for i in range(candidates)
+        ])
+        db.commit()
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    async def timed(self, turn_type: str, request):
+        start = time.perf_counter()
+        response = await request
+        self.latencies[turn_type].append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            self.errors[turn_type] += 1
+        return response
+
+
+def start_offsets(args) -> list:
+    """Start time of every candidate, in seconds from the beginning of the run."""
+    n = args.candidates
+    if args.profile == "constant" or n == 1:
+        return [0.0] * n
+    if args.profile == "linear":
+        return [args.ramp_seconds * i / (n - 1) for i in range(n)]
+    # step: add step_size candidates every step_seconds
+    return [(i // args.step_size) * args.step_seconds for i in range(n)]
+
+
+async def think(rng: random.Random, mean_ms: float) -> None:
+    if mean_ms > 0:
+        await asyncio.sleep(rng.expovariate(1000 / mean_ms))
+
+
+async def run_candidate(client, recorder: Recorder, user_id: int, offset: float, args) -> bool:
+    rng = random.Random(args.seed * 100003 + user_id)
+    await asyncio.sleep(offset)
+
+    response = await recorder.timed("login", client.post("/api/auth/login", json={
+        "email": f"candidate{user_id}@example.com", "password": PASSWORD
+    }))
+    if response.status_code != 200:
+        return False
+    token = response.json()["data"]["access_token"]
+    auth = {"Authorization": f"Bearer {token}"}
+
+    session_type = "hr" if rng.random() < args.hr_ratio else "technical"
+    response = await recorder.timed("start", client.post("/api/interview/interview", json={
+        "state": {"session_type": session_type, "level": "easy"}
+    }, headers=auth))
+    if response.status_code != 200:
+        return False
+    body = response.json()
+
+    while not body["done"]:
+        await think(rng, args.think_ms)
+        state = body["state"]
+        state["latest_answer"] = ANSWER
+        final = state["current_question_index"] + 1 >= state["total_questions"]
+        response = await recorder.timed("final" if final else "middle", client.post(
+            "/api/interview/interview", json={"state": state}, headers=auth
+        ))
+        if response.status_code != 200:
+            return False
+        body = response.json()
+
+    await think(rng, args.think_ms)
+    response = await recorder.timed("feedback_email", client.post(
+        "/api/interview/send_feedback_email",
+        json=body["state"],
+        headers=auth
+    ))
+    return response.status_code == 200
+
+
+def percentile(ordered: list, pct: float) -> float:
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+def report(recorder: Recorder, completed: int, args, elapsed: float) -> None:
+    total = sum(len(v) for v in recorder.latencies.values())
+    print(f"\ncandidates={args.candidates} completed={completed} profile={args.profile} "
+          f"think={args.think_ms}ms llm={args.llm_latency_ms}ms")
+    print(f"duration {elapsed:.2f}s  throughput {total / elapsed:.1f} req/s, "
+          f"{completed / elapsed:.2f} interviews/s\n")
+    print(f"{'turn':<15} {'count':>6} {'errors':>6} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for turn_type in TURN_TYPES:
+        ordered = sorted(recorder.latencies.get(turn_type, []))
+        if not ordered:
+            continue
+        print(f"{turn_type:<15} {len(ordered):>6} {recorder.errors[turn_type]:>6} "
+              f"{statistics.fmean(ordered) * 1000:>9.1f} {percentile(ordered, 50) * 1000:>9.1f} "
+              f"{percentile(ordered, 95) * 1000:>9.1f} {percentile(ordered, 99) * 1000:>9.1f}")
+
+
+async def run(args) -> None:
+    import httpx
+    from aiosmtpd.controller import Controller
+    import main
+
+    class AcceptAll:
+        async def handle_DATA(self, server, session, envelope):
+            return "250 OK"
+
+    smtp = Controller(AcceptAll(), hostname="127.0.0.1", port=args.smtp_port)
+    smtp.start()
+    try:
+        async with main.app.router.lifespan_context(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+                recorder = Recorder()
+                start = time.perf_counter()
+                results = await asyncio.gather(*(
+                    run_candidate(client, recorder, i + 1, offset, args)
+                    for i, offset in enumerate(start_offsets(args))
+                ), return_exceptions=True)
+                elapsed = time.perf_counter() - start
+        failures = [r for r in results if isinstance(r, Exception)]
+        for error in failures[:3]:
+            print(f"candidate failed: {error!r}")
+        report(recorder, sum(1 for r in results if r is True), args, elapsed)
+    finally:
+        smtp.stop()
+
+
+def main_cli(args) -> None:
+    configure_environment(args)
+    with tempfile.TemporaryDirectory() as tmp:
+        # database.py uses a relative sqlite path, so the seeded DB lives in tmp
+        os.chdir(tmp)
+        seed_database(args.candidates)
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=20)
+    parser.add_argument("--hr-ratio", type=float, default=0.5, help="share of HR (vs technical) interviews")
+    parser.add_argument("--think-ms", type=float, default=0, help="mean think time between answers (exponential)")
+    parser.add_argument("--profile", choices=["constant", "linear", "step"], default="constant")
+    parser.add_argument("--ramp-seconds", type=float, default=10, help="linear profile: time to start all candidates")
+    parser.add_argument("--step-size", type=int, default=10, help="step profile: candidates added per step")
+    parser.add_argument("--step-seconds", type=float, default=5, help="step profile: seconds between steps")
+    parser.add_argument("--llm-latency-ms", type=float, default=300)
+    parser.add_argument("--llm-failure-rate", type=float, default=0.0)
+    parser.add_argument("--smtp-port", type=int, default=8026)
+    parser.add_argument("--seed", type=int, default=1)
+    main_cli(parser.parse_args())
@@ -1,22 +1,17 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from datetime import datetime, timezone
-
 import sys
 import os
 
 # Add the project root directory to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
+from database import engine
 from models.models import Base, QuestionBank, QuestionType, DifficultyLevel
+from script.import_questions import import_records
+from script.init_db import adopt_unversioned, migrate
 
 
 
 
-# Database setup
-DATABASE_URL = "sqlite:///interview.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # List of questions: 10 per type (hr, coding, sql, conceptual) per difficulty (easy, medium, hard)
 questions = [
@@ -1386,33 +1381,11 @@ questions = [
 ]
 
 def insert_questions():
-    db: Session = SessionLocal()
-    try:
-        # Check for existing questions to avoid duplicates
-        existing_questions = db.query(QuestionBank).all()
-        existing_texts = {q.question_data["question_text"] for q in existing_questions}
-
-        inserted_count = 0
-        for q in questions:
-            if q["question_data"]["question_text"] not in existing_texts:
-                db.add(QuestionBank(
-                    type=q["type"],
-                    difficulty=q["difficulty"],
-                    question_data=q["question_data"],
-                    created_at=datetime.now(timezone.utc)
-                ))
-                inserted_count += 1
-            else:
-                print(f"Skipping duplicate question: {q['question_data']['question_text']}")
-
-        db.commit()
-        print(f"✅ Successfully inserted {inserted_count} questions.")
-    except Exception as e:
-        db.rollback()
-        print(f"❌ Error inserting questions: {str(e)}")
-        raise
-    finally:
-        db.close()
+    # Batched insert that skips questions already in the bank by content hash
+    stats = import_records(engine, ((f"questions[{i}]", q) for i, q in enumerate(questions)))
+    print(f"✅ Successfully inserted {stats.inserted} questions ({stats.duplicates} already present).")
 
 if __name__ == "__main__":
-    insert_questions()
\ No newline at end of file
+    adopt_unversioned()
+    migrate()
+    insert_questions()
@@ -1,58 +1,77 @@
 # services/ai/base.py
-from langchain_google_genai import ChatGoogleGenerativeAI
+from typing import Callable, Optional
 from langchain_core.messages import HumanMessage
-from core.config import settings
 from utils.response import standardize_response
+from core.logger import get_logger
+from core.metrics import ERRORS
+from services.ai.client import LLMClientRegistry, llm_clients
+
+log = get_logger("llm")
 
 class LLMBase:
-    def __init__(self):
-        self.llm = None
-        self.init_error = None
-        try:
-            if settings.GOOGLE_API_KEY:
-                self.llm = ChatGoogleGenerativeAI(
-                    model="gemini-1.5-flash",
-                    google_api_key=settings.GOOGLE_API_KEY,
-                    temperature=0.7,
-                    max_tokens=1000
-                )
-            else:
-                self.init_error = "Missing Google API Key"
-        except Exception as e:
-            self.init_error = str(e)
+    """Base for AI services; every instance talks through the shared client in llm_clients."""
+
+    def __init__(self, clients: LLMClientRegistry = llm_clients):
+        self.clients = clients
+
+    @property
+    def llm(self):
+        return self.clients.llm
+
+    @property
+    def init_error(self):
+        return self.clients.init_error
 
     def is_ready(self) -> bool:
         return self.llm is not None
 
-    async def ask_text(self, prompt: HumanMessage) -> str | None:
+    async def ask_text(self, prompt: HumanMessage, on_token: Optional[Callable[[str], None]] = None) -> str | None:
         """
         INTERNAL helper: returns plain text (or None on error).
+        With on_token the response is streamed and every chunk is passed to it as it arrives.
         """
         if not self.llm:
-            print("[LLMBase.ask_text] LLM not ready:", self.init_error)
+            log.warning("LLM not ready: %s", self.init_error)
+            ERRORS.labels(component="llm", kind="not_ready").inc()
             return None
+        if on_token is not None:
+            return await self._stream_text(prompt, on_token)
         try:
-            print("[⏳ Waiting for LLM response in ask_text()]")
-            resp = await self.llm.ainvoke([prompt])
-            print("[LLM response received]")
-            print("RAW:", resp)  # resp is usually an AIMessage with .content
+            resp = await self.clients.invoke("ask_text", lambda: self.llm.ainvoke([prompt]))
+            log.debug("LLM raw response: %r", resp)  # resp is usually an AIMessage with .content
 
             # Prefer .content if present
             if hasattr(resp, "content") and resp.content:
                 out = str(resp.content).strip()
-                print("[ask_text] Extracted content:", out)
                 return out
 
             # Fallbacks for other shapes (rare)
             try:
                 out = str(resp).strip()
-                print("[ask_text] Fallback str(resp):", out)
                 return out
             except Exception:
                 return None
 
         except Exception as e:
-            print(f"[ask_text] LLM Error: {e}")
+            log.error("ask_text LLM error: %r", e)
+            return None
+
+    async def _stream_text(self, prompt: HumanMessage, on_token: Callable[[str], None]) -> str | None:
+        chunks = []
+
+        async def consume():
+            async for chunk in self.llm.astream([prompt]):
+                text = getattr(chunk, "content", None)
+                if text:
+                    chunks.append(str(text))
+                    on_token(str(text))
+
+        try:
+            await self.clients.stream("ask_text_stream", consume)
+            out = "".join(chunks).strip()
+            return out or None
+        except Exception as e:
+            log.error("ask_text LLM stream error: %r", e)
             return None
 
     # Optional: keep API response wrapper for HTTP routes
@@ -67,14 +86,14 @@ class LLMBase:
                 status_code=503
             )
         try:
-            resp = await self.llm.ainvoke([prompt])
+            resp = await self.clients.invoke("ask_api", lambda: self.llm.ainvoke([prompt]))
             return standardize_response(
                 success=True,
                 message="LLM response received.",
                 data={"content": getattr(resp, "content", None)}
             )
         except Exception as e:
-            print(f"[ask_api] LLM Error: {e}")
+            log.error("ask_api LLM error: %s", e)
             return standardize_response(
                 success=False,
                 message="Something went wrong while processing your request. Please try again later.",
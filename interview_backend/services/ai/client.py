@@ -0,0 +1,273 @@
+# services/ai/client.py
+import asyncio
+import random
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set, TypeVar
+
+from core.config import settings
+from core.logger import get_logger
+from core.metrics import observe, LLM_CALL_SECONDS, LLM_ATTEMPTS, LLM_HEDGE_WINS, ERRORS
+from services.ai.providers import build_chat_model
+
+log = get_logger("llm")
+
+T = TypeVar("T")
+
+# set for tasks started inside LLMClientRegistry.background()
+_background_work: ContextVar[bool] = ContextVar("llm_background_work", default=False)
+
+
+class LLMClientRegistry:
+    """
+    Owns the one chat model client shared by every AI service, the interview
+    graph and the feedback endpoints, so its HTTP/gRPC channel and keep-alive
+    connections are set up once per process instead of once per request.
+    The model comes from the named provider in services/ai/providers.py.
+
+    slot() caps how many model calls are in flight at once; callers beyond
+    max_concurrency wait for a free slot instead of opening more sockets.
+    Work nobody is waiting on (answer scoring, prefetch, pool refills) runs
+    under background() and may hold at most background_concurrency of those
+    slots, so request-path calls always have the rest.
+
+    invoke() adds a per-attempt deadline and jittered retries of transient
+    failures (timeouts, dropped connections, 429 and 5xx). With hedging on,
+    an attempt still running hedge_percentile latency after it got its slot
+    gets a duplicate request, if a slot is free for it; whichever answers
+    first wins and the other is cancelled.
+    """
+
+    def __init__(self, provider: str, max_concurrency: int, background_concurrency: int = 4,
+                 timeout: float = 20, stream_timeout: float = 60,
+                 max_retries: int = 2, retry_base: float = 0.5, hedge: bool = False,
+                 hedge_percentile: float = 95, hedge_min_samples: int = 20):
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.background_concurrency = max(1, min(background_concurrency, max_concurrency - 1))
+        self.timeout = timeout
+        self.stream_timeout = stream_timeout
+        self.max_retries = max_retries
+        self.retry_base = retry_base
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self._latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=200))
+        self._llm = None
+        self._started = False
+        self.init_error: Optional[str] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._background_slots: Optional[asyncio.Semaphore] = None
+        self._background_in_flight = 0
+        self._background_queued: Set[asyncio.Task] = set()
+        self._in_flight = 0
+        self._waiting = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+
+    def _build(self):
+        try:
+            return build_chat_model(self.provider)
+        except Exception as e:
+            self.init_error = str(e)
+            log.error("LLM client init failed (provider=%s): %s", self.provider, e)
+            return None
+
+    def start(self) -> None:
+        """Create the shared client; called from the app lifespan, lazily by scripts."""
+        if self._started:
+            return
+        self._started = True
+        self._llm = self._build()
+
+    @property
+    def llm(self):
+        if not self._started:
+            self.start()
+        return self._llm
+
+    def is_ready(self) -> bool:
+        return self.llm is not None
+
+    @contextmanager
+    def background(self):
+        """Tasks created inside the block make their model calls as background work."""
+        token = _background_work.set(True)
+        try:
+            yield
+        finally:
+            _background_work.reset(token)
+
+    def queued_in_background(self, task: asyncio.Task) -> bool:
+        """
+        True while a background task waits for its background slot. A request
+        that needs its result should cancel it and make the call itself rather
+        than wait behind other background work.
+        """
+        return task in self._background_queued
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one of the max_concurrency model-call slots for the duration of the block."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._background_slots = asyncio.Semaphore(self.background_concurrency)
+        background = _background_work.get()
+        self._waiting += 1
+        try:
+            if background:
+                task = asyncio.current_task()
+                self._background_queued.add(task)
+                try:
+                    await self._background_slots.acquire()
+                finally:
+                    self._background_queued.discard(task)
+            try:
+                await self._slots.acquire()
+            except BaseException:
+                if background:
+                    self._background_slots.release()
+                raise
+        finally:
+            self._waiting -= 1
+        self._in_flight += 1
+        self._background_in_flight += background
+        self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._background_in_flight -= background
+            self.calls += 1
+            self._slots.release()
+            if background:
+                self._background_slots.release()
+
+    def _backoff(self, attempt: int) -> float:
+        return self.retry_base * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
+    @staticmethod
+    def _transient(error: Exception) -> bool:
+        """Worth retrying: anything else (bad request, auth, unparseable output) fails the same way again."""
+        if isinstance(error, (asyncio.TimeoutError, ConnectionError)):
+            return True
+        status = getattr(error, "status_code", None) or getattr(error, "code", None)
+        return isinstance(status, int) and (status in (408, 429) or 500 <= status < 600)
+
+    def _hedge_delay(self, call: str) -> Optional[float]:
+        """Latency percentile of recent successful attempts, or None while hedging is off or warming up."""
+        samples = self._latencies[call]
+        if not self.hedge or len(samples) < self.hedge_min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(int(len(ordered) * self.hedge_percentile / 100), len(ordered) - 1)]
+
+    async def _once(self, call: str, make_call: Callable[[], Awaitable[T]], kind: str,
+                    holding: Optional[asyncio.Event] = None) -> T:
+        LLM_ATTEMPTS.labels(call=call, kind=kind).inc()
+        async with self.slot():
+            if holding is not None:
+                holding.set()
+            started = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(make_call(), self.timeout)
+            except asyncio.TimeoutError:
+                ERRORS.labels(component="llm", kind="timeout").inc()
+                raise
+            self._latencies[call].append(time.perf_counter() - started)
+            return result
+
+    async def _attempt(self, call: str, make_call: Callable[[], Awaitable[T]], kind: str) -> T:
+        delay = self._hedge_delay(call)
+        if delay is None or _background_work.get():
+            return await self._once(call, make_call, kind)
+
+        holding = asyncio.Event()
+        primary = asyncio.ensure_future(self._once(call, make_call, kind, holding))
+        pending = {primary}
+        try:
+            # the delay is a model latency: time spent queued for a slot does not count
+            slot_wait = asyncio.ensure_future(holding.wait())
+            await asyncio.wait({primary, slot_wait}, return_when=asyncio.FIRST_COMPLETED)
+            slot_wait.cancel()
+            if not primary.done():
+                await asyncio.wait(pending, timeout=delay)
+            if primary.done():
+                return primary.result()
+            if self._slots.locked():
+                # every slot is busy: a duplicate would only queue behind them
+                return await primary
+
+            hedged = asyncio.ensure_future(self._once(call, make_call, "hedge"))
+            pending.add(hedged)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        LLM_HEDGE_WINS.labels(call=call, winner="hedge" if task is hedged else "primary").inc()
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def invoke(self, call: str, make_call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run make_call() (a fresh model request per call) with the deadline,
+        retry and hedging policy. call names the call site for metrics.
+        """
+        with observe(LLM_CALL_SECONDS, call=call):
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    await asyncio.sleep(self._backoff(attempt))
+                try:
+                    return await self._attempt(call, make_call, "retry" if attempt else "primary")
+                except Exception as e:
+                    if attempt == self.max_retries or not self._transient(e):
+                        raise
+                    log.warning("LLM %s attempt %d failed, retrying: %r", call, attempt + 1, e)
+
+    async def stream(self, call: str, consume: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a streaming consumer under the stream deadline. Tokens may already
+        have reached the client, so streams are neither retried nor hedged.
+        """
+        LLM_ATTEMPTS.labels(call=call, kind="primary").inc()
+        async with self.slot():
+            with observe(LLM_CALL_SECONDS, call=call):
+                try:
+                    return await asyncio.wait_for(consume(), self.stream_timeout)
+                except asyncio.TimeoutError:
+                    ERRORS.labels(component="llm", kind="timeout").inc()
+                    raise
+
+    def stats(self) -> dict:
+        return {
+            "provider": self.provider,
+            "ready": self._llm is not None,
+            "max_concurrency": self.max_concurrency,
+            "background_concurrency": self.background_concurrency,
+            "in_flight": self._in_flight,
+            "background_in_flight": self._background_in_flight,
+            "waiting": self._waiting,
+            "peak_in_flight": self.peak_in_flight,
+            "calls": self.calls,
+        }
+
+
+llm_clients = LLMClientRegistry(
+    provider=settings.LLM_PROVIDER,
+    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+    background_concurrency=settings.LLM_BACKGROUND_CONCURRENCY,
+    timeout=settings.LLM_TIMEOUT_SECONDS,
+    stream_timeout=settings.LLM_STREAM_TIMEOUT_SECONDS,
+    max_retries=settings.LLM_MAX_RETRIES,
+    retry_base=settings.LLM_RETRY_BASE_SECONDS,
+    hedge=settings.LLM_HEDGE_ENABLED,
+    hedge_percentile=settings.LLM_HEDGE_PERCENTILE,
+    hedge_min_samples=settings.LLM_HEDGE_MIN_SAMPLES
+)
@@ -0,0 +1,198 @@
+# services/ai/fake_llm.py
+import asyncio
+import random
+import re
+from typing import Any, AsyncIterator, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableLambda
+
+from models.interview_feedback import InterviewFeedback, AnswerEvaluation, FeedbackSummary
+from models.pdf_feedback import InterviewPDFFeedback, QuestionFeedback
+
+HR_TOPICS = [
+    "a conflict with a teammate", "a missed deadline", "leading a project without formal authority",
+    "receiving critical feedback", "a decision you made with incomplete information",
+    "persuading a skeptical stakeholder", "mentoring a new colleague", "a project that failed",
+    "juggling competing priorities", "adapting to a sudden change in scope",
+]
+HR_TEMPLATES = [
+    "Tell me about {topic}. What did you do and what was the outcome?",
+    "Describe {topic}. How did you handle it?",
+    "Walk me through {topic} and what you learned from it.",
+]
+TECH_TOPICS = [
+    "a rate limiter for a public API", "cache invalidation in a read-heavy service",
+    "the difference between optimistic and pessimistic locking", "indexing a table for range queries",
+    "detecting a cycle in a linked list", "idempotent retries for payment requests",
+    "paginating a large result set efficiently", "a LRU cache with O(1) operations",
+    "choosing between SQL and NoSQL storage", "debugging a memory leak in a long-running process",
+]
+TECH_TEMPLATES = [
+    "How would you design {topic}?",
+    "Explain {topic} and the trade-offs involved.",
+    "Walk me through how you would implement {topic}.",
+]
+QA_PATTERN = re.compile(r"Q\d+: (.*?)\nA\d+: (.*?)(?=\n\nQ\d+: |\n\n[A-Z][^\n]*:|\Z)", re.S)
+ANSWER_PATTERN = re.compile(r"^Answer: (.*?)(?=\n\n|\Z)", re.S | re.M)
+EVALUATED_PATTERN = re.compile(r"^Q\d+ \(([\d.]+)/10\)", re.M)
+
+# schemas with_structured_output() has canned answers for
+STRUCTURED_SCHEMAS = (AnswerEvaluation, FeedbackSummary, InterviewFeedback, InterviewPDFFeedback)
+
+
+def _unsupported(schema) -> str:
+    supported = ", ".join(model.__name__ for model in STRUCTURED_SCHEMAS)
+    return f"Fake LLM has no canned output for {getattr(schema, '__name__', schema)!r} (supported: {supported})"
+
+
+class FakeLLMUnavailable(RuntimeError):
+    """Injected failure; carries a 503 so the client retries it like a real provider outage."""
+    status_code = 503
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Offline stand-in for the Gemini chat model, for load tests and benchmarks.
+
+    Returns plausible interview questions and schema-valid InterviewFeedback,
+    InterviewPDFFeedback, AnswerEvaluation and FeedbackSummary objects. Each call sleeps for a log-normal latency
+    around latency_ms and fails with probability failure_rate. All randomness
+    comes from one generator seeded with seed, so a run is reproducible.
+    """
+
+    latency_ms: float = 300.0
+    latency_sigma: float = 0.5
+    failure_rate: float = 0.0
+    seed: int = 0
+    rng: Any = None
+    counter: int = 0
+
+    def model_post_init(self, __context: Any) -> None:
+        self.rng = random.Random(self.seed)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-interview"
+
+    # ---- behaviour ---------------------------------------------------------
+
+    def _latency(self) -> float:
+        if self.latency_ms <= 0:
+            return 0.0
+        return self.latency_ms / 1000 * self.rng.lognormvariate(0, self.latency_sigma)
+
+    def _maybe_fail(self) -> None:
+        if self.failure_rate and self.rng.random() < self.failure_rate:
+            raise FakeLLMUnavailable("Fake LLM: injected failure")
+
+    def _question(self, prompt: str) -> str:
+        self.counter += 1
+        if "HR interviewer" in prompt:
+            topics, templates = HR_TOPICS, HR_TEMPLATES
+        else:
+            topics, templates = TECH_TOPICS, TECH_TEMPLATES
+        topic = topics[self.rng.randrange(len(topics))]
+        question = templates[self.rng.randrange(len(templates))].format(topic=topic)
+        # numbered so repeated calls never collide with already-asked questions
+        return f"{question} (#{self.counter})"
+
+    def _score(self, answer: str) -> int:
+        words = len(answer.split())
+        return max(1, min(10, 3 + words // 15 + self.rng.randint(-1, 1)))
+
+    def _feedback(self, schema, prompt: str):
+        if schema is AnswerEvaluation:
+            match = ANSWER_PATTERN.search(prompt)
+            score = self._score(match.group(1) if match else "")
+            return AnswerEvaluation(
+                evaluation="Solid answer." if score >= 6 else "Needs more depth and concrete detail.",
+                score=score,
+            )
+        if schema is FeedbackSummary:
+            scores = [float(score) for score in EVALUATED_PATTERN.findall(prompt)] or [5]
+            return FeedbackSummary(
+                feedback=f"Answered {len(scores)} questions with an average quality of {sum(scores) / len(scores):.1f}/10.",
+                strengths=["Clear communication", "Relevant examples"],
+                areas_for_improvement=[
+                    "Structure answers with a clear situation, action and result",
+                    "Quantify the impact of your work",
+                    "Discuss trade-offs before settling on a solution",
+                ],
+            )
+        pairs = QA_PATTERN.findall(prompt)
+        scores = [self._score(answer) for _, answer in pairs] or [5]
+        average = sum(scores) / len(scores)
+        improvements = [
+            "Structure answers with a clear situation, action and result",
+            "Quantify the impact of your work",
+            "Discuss trade-offs before settling on a solution",
+        ]
+        if schema is InterviewFeedback:
+            return InterviewFeedback(
+                score=round(average),
+                feedback=f"Answered {len(pairs)} questions with an average quality of {average:.1f}/10.",
+                areas_for_improvement=improvements,
+            )
+        if schema is InterviewPDFFeedback:
+            return InterviewPDFFeedback(
+                overall_score=round(average, 1),
+                summary=f"The candidate answered {len(pairs)} questions with an average score of {average:.1f}.",
+                strengths=["Clear communication", "Relevant examples", "Good grasp of fundamentals"],
+                improvements=improvements,
+                detailed_feedback=[
+                    QuestionFeedback(
+                        question=question.strip(),
+                        answer=answer.strip(),
+                        evaluation="Solid answer." if score >= 6 else "Needs more depth and concrete detail.",
+                        score=score,
+                    )
+                    for (question, answer), score in zip(pairs, scores)
+                ],
+            )
+        raise ValueError(_unsupported(schema))
+
+    # ---- chat model API ----------------------------------------------------
+
+    @staticmethod
+    def _prompt(messages: List[BaseMessage]) -> str:
+        return "\n".join(str(message.content) for message in messages)
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        self._maybe_fail()
+        text = self._question(self._prompt(messages))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        await asyncio.sleep(self._latency())
+        return self._generate(messages, stop=stop, **kwargs)
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        latency = self._latency()
+        self._maybe_fail()
+        words = self._question(self._prompt(messages)).split(" ")
+        for i, word in enumerate(words):
+            await asyncio.sleep(latency / len(words))
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word if i == 0 else " " + word))
+
+    def with_structured_output(self, schema, **kwargs: Any):
+        if schema not in STRUCTURED_SCHEMAS:
+            raise ValueError(_unsupported(schema))
+
+        async def respond(messages: List[BaseMessage]):
+            await asyncio.sleep(self._latency())
+            self._maybe_fail()
+            return self._feedback(schema, self._prompt(messages))
+
+        def respond_sync(messages: List[BaseMessage]):
+            self._maybe_fail()
+            return self._feedback(schema, self._prompt(messages))
+
+        return RunnableLambda(respond_sync, afunc=respond)
@@ -0,0 +1,44 @@
+# services/ai/providers.py
+from typing import Callable, Dict
+
+from core.config import settings
+
+
+def _gemini():
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    if not settings.GOOGLE_API_KEY:
+        raise ValueError("Missing Google API Key")
+    return ChatGoogleGenerativeAI(
+        model=settings.LLM_MODEL,
+        google_api_key=settings.GOOGLE_API_KEY,
+        temperature=settings.LLM_TEMPERATURE,
+        max_tokens=settings.LLM_MAX_TOKENS
+    )
+
+
+def _fake():
+    from services.ai.fake_llm import FakeChatModel
+
+    return FakeChatModel(
+        latency_ms=settings.LLM_FAKE_LATENCY_MS,
+        latency_sigma=settings.LLM_FAKE_LATENCY_SIGMA,
+        failure_rate=settings.LLM_FAKE_FAILURE_RATE,
+        seed=settings.LLM_FAKE_SEED
+    )
+
+
+# LLM_PROVIDER -> factory returning a LangChain chat model
+PROVIDERS: Dict[str, Callable] = {
+    "gemini": _gemini,
+    "fake": _fake,
+}
+
+
+def build_chat_model(provider: str):
+    """Build the chat model for a provider name; raises ValueError for unknown providers or bad config."""
+    try:
+        factory = PROVIDERS[provider]
+    except KeyError:
+        raise ValueError(f"Unknown LLM provider '{provider}' (expected one of: {', '.join(PROVIDERS)})")
+    return factory()
@@ -1,12 +1,14 @@
 # services/ai/hr.py (unchanged behavior, but uses ask_text)
-from typing import List
+from typing import Callable, List, Optional
 from langchain_core.messages import HumanMessage
 from langchain_core.prompts import PromptTemplate
 from services.ai.base import LLMBase
 
 class HRInterviewService(LLMBase):
 
-    async def llm_generate_hr_question(self, experience: str, previous: List[str]) -> str:
+    async def llm_generate_hr_question(
+        self, experience: str, previous: List[str], on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
         template = PromptTemplate(
             input_variables=["experience", "previous_questions"],
             template="""
@@ -28,7 +30,7 @@ class HRInterviewService(LLMBase):
         )
 
    
-        text = await self.ask_text(HumanMessage(content=prompt))
+        text = await self.ask_text(HumanMessage(content=prompt), on_token=on_token)
 
         if isinstance(text, str) and text.strip():
             q = text.strip()
@@ -43,7 +45,9 @@ class HRInterviewService(LLMBase):
     
 class TechInterviewService(LLMBase):
 
-    async def llm_generate_technical_question(self, level: str, previous: List[str]) -> str:
+    async def llm_generate_technical_question(
+        self, level: str, previous: List[str], on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
         """
         Generate one unique technical interview question.
         """
@@ -67,16 +71,11 @@ class TechInterviewService(LLMBase):
             previous_questions=", ".join(previous) if previous else "None"
         )
 
-        text = await self.ask_text(HumanMessage(content=prompt))
-
-        print(repr(text))
+        text = await self.ask_text(HumanMessage(content=prompt), on_token=on_token)
 
         if isinstance(text, str):
             cleaned = text.strip()
             if cleaned:
-
-                print(cleaned)
-
                 return cleaned
 
     
@@ -0,0 +1,169 @@
+# services/answer_evaluator.py
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from core.config import settings
+from core.logger import get_logger
+from core.metrics import ERRORS
+from models.interview import InterviewModel
+from models.interview_feedback import AnswerEvaluation
+from services.attempt_recorder import attempt_recorder
+from services.ai.client import llm_clients
+
+log = get_logger("answer_evaluator")
+
+system_msg = SystemMessage(content="You are an expert interviewer scoring one answer at a time.")
+
+
+async def evaluate_answer(level: str, question: str, answer: str, llm=None) -> dict:
+    """Score one answer; returns a QuestionFeedback-shaped dict."""
+    llm = llm or llm_clients.llm
+    if not llm:
+        raise RuntimeError("LLM is not initialized")
+
+    human_msg = HumanMessage(content=(
+        f"Experience Level: {level}\n\n"
+        f"Question: {question}\n"
+        f"Answer: {answer}\n\n"
+        "Assess this answer for the given experience level. Return a short evaluation "
+        "(one or two sentences) and a score from 0 to 10."
+    ))
+    chain = llm.with_structured_output(AnswerEvaluation)
+    result = await llm_clients.invoke("answer_eval", lambda: chain.ainvoke([system_msg, human_msg]))
+    if isinstance(result, dict):
+        result = AnswerEvaluation(**result)
+    return {"question": question, "answer": answer, "evaluation": result.evaluation, "score": result.score}
+
+
+def find_evaluation(evaluations: List[dict], question: str, answer: str) -> Optional[dict]:
+    for item in evaluations or []:
+        if item.get("question") == question and item.get("answer") == answer:
+            return item
+    return None
+
+
+@dataclass
+class _PendingEvaluation:
+    task: asyncio.Task
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class AnswerEvaluator:
+    """
+    Evaluates each answer in the background as soon as store_answer records it,
+    so the final feedback step only has to aggregate per-question results.
+
+    Finished results are folded into state.evaluations on the next turn and
+    persisted with the session. complete() waits for whatever is still in flight
+    and evaluates anything that was never scheduled (another worker, a restart).
+    """
+
+    def __init__(self, ttl_seconds: float, enabled: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        # (session_id, question, answer) -> in-flight evaluation
+        self._pending: Dict[Tuple[str, str, str], _PendingEvaluation] = {}
+        self._last_sweep = time.monotonic()
+        self.background = 0
+        self.inline = 0
+
+    def schedule(self, state: InterviewModel) -> None:
+        """Start evaluating the most recently stored answer."""
+        if not self.enabled or not state.session_id or not state.q_a_pair or not llm_clients.is_ready():
+            return
+        qa = state.q_a_pair[-1]
+        key = (state.session_id, qa["question"], qa["answer"])
+        if key in self._pending or find_evaluation(state.evaluations, qa["question"], qa["answer"]):
+            return
+
+        self._sweep()
+        with llm_clients.background():
+            task = asyncio.create_task(self._evaluate(state.session_id, state.level, qa))
+        self._pending[key] = _PendingEvaluation(task=task)
+        self.background += 1
+
+    def collect(self, state: InterviewModel) -> None:
+        """Move finished background evaluations for this session into state.evaluations."""
+        if not state.session_id:
+            return
+        for qa in state.q_a_pair:
+            key = (state.session_id, qa["question"], qa["answer"])
+            pending = self._pending.get(key)
+            if pending is None or not pending.task.done():
+                continue
+            del self._pending[key]
+            if pending.task.cancelled() or pending.task.exception() is not None:
+                continue
+            if not find_evaluation(state.evaluations, qa["question"], qa["answer"]):
+                state.evaluations.append(pending.task.result())
+
+    @staticmethod
+    async def _evaluate(session_id: Optional[str], level: str, qa: dict, llm=None) -> dict:
+        result = await evaluate_answer(level, qa["question"], qa["answer"], llm)
+        attempt_recorder.record_evaluation(session_id, result)
+        return result
+
+    async def _resolve(self, state: InterviewModel, qa: dict, llm) -> Optional[dict]:
+        existing = find_evaluation(state.evaluations, qa["question"], qa["answer"])
+        if existing:
+            return existing
+        pending = self._pending.pop((state.session_id, qa["question"], qa["answer"]), None) if state.session_id else None
+        if pending is not None and llm_clients.queued_in_background(pending.task):
+            # still waiting for a background slot; scoring it here is quicker
+            pending.task.cancel()
+            pending = None
+        try:
+            if pending is not None:
+                try:
+                    return await pending.task
+                except (Exception, asyncio.CancelledError) as e:
+                    log.warning("Background evaluation failed, retrying inline: %r", e)
+            self.inline += 1
+            return await self._evaluate(state.session_id, state.level, qa, llm)
+        except Exception as e:
+            log.warning("Answer evaluation failed: %s", e)
+            ERRORS.labels(component="feedback", kind="answer_eval_failed").inc()
+            return None
+
+    async def complete(self, state: InterviewModel, llm=None) -> List[Optional[dict]]:
+        """
+        Evaluations for every Q&A pair in order (None where evaluation failed).
+        state.evaluations is updated with everything that succeeded.
+        """
+        results = await asyncio.gather(*(self._resolve(state, qa, llm) for qa in state.q_a_pair))
+        state.evaluations = [item for item in results if item is not None]
+        return list(results)
+
+    def _sweep(self) -> None:
+        """Drop evaluations of sessions that were abandoned mid-interview."""
+        now = time.monotonic()
+        if now - self._last_sweep < 60:
+            return
+        self._last_sweep = now
+        expired = [key for key, item in self._pending.items() if now - item.created_at > self.ttl_seconds]
+        for key in expired:
+            self._pending.pop(key).task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "background": self.background,
+            "inline": self.inline,
+        }
+
+    async def shutdown(self) -> None:
+        tasks = [item.task for item in self._pending.values()]
+        self._pending.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+answer_evaluator = AnswerEvaluator(
+    ttl_seconds=settings.SESSION_TIMEOUT_MINUTES * 60,
+    enabled=settings.ANSWER_EVAL_ENABLED,
+)
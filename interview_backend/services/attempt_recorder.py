@@ -0,0 +1,245 @@
+# services/attempt_recorder.py
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, bindparam, insert, select, update
+
+from core.config import settings
+from core.logger import get_logger
+from core.metrics import ERRORS
+from database import AsyncSessionLocal
+from models.interview import InterviewModel
+from models.models import InterviewSession, QuestionAttempt
+
+log = get_logger("attempt_recorder")
+
+# (session_id string, question text, answer text) identifies one attempt
+AttemptKey = Tuple[str, str, str]
+# (attempt, evaluation dict, time.monotonic() when it arrived)
+LateEvaluation = Tuple[AttemptKey, dict, float]
+
+_set_evaluation = (
+    update(QuestionAttempt.__table__)
+    .where(and_(
+        QuestionAttempt.__table__.c.session_id == bindparam("session_pk"),
+        QuestionAttempt.__table__.c.question_text == bindparam("q_text"),
+        QuestionAttempt.__table__.c.user_answer == bindparam("a_text"),
+    ))
+    .values(feedback=bindparam("feedback"), score=bindparam("score"))
+)
+
+
+class AttemptRecorder:
+    """
+    Write-behind log of answers into question_attempts.
+
+    store_answer only appends to an in-process buffer, so an interview turn
+    never waits on this write. A background task flushes the buffer as one
+    multi-row INSERT when it holds batch_size rows or every flush_interval
+    seconds, and once more on shutdown.
+
+    Evaluations usually finish while their answer is still buffered and are
+    merged into the pending row; those that arrive after the row was written
+    are applied as one batched UPDATE per flush. Rows and evaluations whose
+    interview_sessions row is not committed yet wait for a later flush, for up
+    to max_wait_seconds. If the database stays
+    unavailable the buffer keeps at most max_buffered rows, dropping the oldest.
+    """
+
+    def __init__(self, session_factory=AsyncSessionLocal, batch_size: int = 200,
+                 flush_interval: float = 2.0, max_buffered: int = 10000,
+                 max_wait_seconds: float = 1800, enabled: bool = True):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.max_wait_seconds = max_wait_seconds
+        self.enabled = enabled
+        self._rows: Dict[AttemptKey, dict] = {}
+        self._evaluations: Deque[LateEvaluation] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock = asyncio.Lock()
+        self.written = 0
+        self.updated = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.last_flush_ms = 0.0
+
+    def record_answer(self, state: InterviewModel) -> None:
+        """Buffer the attempt for the most recently stored answer."""
+        if not self.enabled or not state.session_id or not state.q_a_pair:
+            return
+        qa = state.q_a_pair[-1]
+        key = (state.session_id, qa["question"], qa["answer"])
+        if key in self._rows:
+            return
+        self._rows[key] = {
+            "question_id": state.current_question_id,
+            "question_text": qa["question"],
+            "user_answer": qa["answer"],
+            "feedback": None,
+            "score": None,
+            "created_at": datetime.now(timezone.utc),
+        }
+        self._trim()
+        self._maybe_wake()
+
+    def record_evaluation(self, session_id: Optional[str], evaluation: dict) -> None:
+        """Attach a per-answer evaluation (QuestionFeedback dict) to its attempt."""
+        if not self.enabled or not session_id:
+            return
+        key = (session_id, evaluation["question"], evaluation["answer"])
+        row = self._rows.get(key)
+        if row is not None:
+            row["feedback"] = evaluation.get("evaluation")
+            row["score"] = evaluation.get("score")
+            return
+        self._evaluations.append((key, evaluation, time.monotonic()))
+        self._trim()
+        self._maybe_wake()
+
+    def _buffered(self) -> int:
+        return len(self._rows) + len(self._evaluations)
+
+    def _trim(self) -> None:
+        while self._buffered() > self.max_buffered:
+            if self._evaluations:
+                self._evaluations.popleft()
+            else:
+                self._rows.pop(next(iter(self._rows)))
+            self.dropped += 1
+            ERRORS.labels(component="attempts", kind="dropped").inc()
+
+    def _maybe_wake(self) -> None:
+        if self._wakeup is not None and self._buffered() >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Write everything buffered; returns the number of attempts inserted."""
+        async with self._flush_lock:
+            if not self._rows and not self._evaluations:
+                return 0
+            start = time.perf_counter()
+            rows, self._rows = self._rows, {}
+            evaluations, self._evaluations = self._evaluations, deque()
+            try:
+                inserted, waiting, waiting_evaluations = await self._write(rows, evaluations)
+            except Exception as e:
+                log.warning("Flushing %d attempts failed, keeping them buffered: %s", len(rows), e)
+                ERRORS.labels(component="attempts", kind="flush_failed").inc()
+                # put them back in front of anything recorded meanwhile
+                self._rows = {**rows, **self._rows}
+                self._evaluations.extendleft(reversed(evaluations))
+                self._trim()
+                return 0
+            self._rows = {**waiting, **self._rows}
+            self._evaluations.extendleft(reversed(waiting_evaluations))
+            self._trim()
+            self.flushes += 1
+            self.last_flush_ms = round((time.perf_counter() - start) * 1000, 1)
+            return inserted
+
+    async def _write(self, rows: Dict[AttemptKey, dict], evaluations: Deque[LateEvaluation]
+                     ) -> Tuple[int, Dict[AttemptKey, dict], List[LateEvaluation]]:
+        # evaluations that arrived while their row was being written, or waiting for its session
+        late = []
+        for key, evaluation, received_at in evaluations:
+            if key in rows:
+                rows[key].update(feedback=evaluation.get("evaluation"), score=evaluation.get("score"))
+            else:
+                late.append((key, evaluation, received_at))
+
+        session_ids = {key[0] for key in rows} | {key[0] for key, _, _ in late}
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(InterviewSession.session_id, InterviewSession.id)
+                .where(InterviewSession.session_id.in_(session_ids))
+            )
+            session_pks = dict(result.all())
+
+            params, waiting = [], {}
+            for key, row in rows.items():
+                session_pk = session_pks.get(key[0])
+                if session_pk is None:
+                    # session row not committed yet; give it until the session would expire
+                    if (datetime.now(timezone.utc) - row["created_at"]).total_seconds() < self.max_wait_seconds:
+                        waiting[key] = row
+                    else:
+                        self.dropped += 1
+                        ERRORS.labels(component="attempts", kind="dropped").inc()
+                    continue
+                params.append({**row, "session_id": session_pk})
+            if params:
+                await db.execute(insert(QuestionAttempt), params)
+
+            updates, waiting_evaluations = [], []
+            for key, evaluation, received_at in late:
+                session_pk = session_pks.get(key[0])
+                if session_pk is None:
+                    if time.monotonic() - received_at < self.max_wait_seconds:
+                        waiting_evaluations.append((key, evaluation, received_at))
+                    else:
+                        self.dropped += 1
+                        ERRORS.labels(component="attempts", kind="dropped").inc()
+                    continue
+                updates.append({"session_pk": session_pk, "q_text": key[1], "a_text": key[2],
+                                "feedback": evaluation.get("evaluation"), "score": evaluation.get("score")})
+            if updates:
+                conn = await db.connection()
+                await conn.execute(_set_evaluation, updates)
+            await db.commit()
+
+        self.written += len(params)
+        self.updated += len(updates)
+        return len(params), waiting, waiting_evaluations
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                # shielded: stop() cancels this loop, never a write in progress
+                await asyncio.shield(self.flush())
+            except Exception as e:
+                log.exception("Attempt recorder error: %s", e)
+
+    def start(self) -> None:
+        if self._task is not None or not self.enabled:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            self._wakeup = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "buffered": self._buffered(),
+            "written": self.written,
+            "evaluations_updated": self.updated,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+
+attempt_recorder = AttemptRecorder(
+    batch_size=settings.ATTEMPT_BATCH_SIZE,
+    flush_interval=settings.ATTEMPT_FLUSH_SECONDS,
+    max_buffered=settings.ATTEMPT_MAX_BUFFERED,
+    max_wait_seconds=settings.SESSION_TIMEOUT_MINUTES * 60,
+    enabled=settings.ATTEMPT_LOG_ENABLED,
+)
@@ -0,0 +1,69 @@
+# services/feedback_cache.py
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+from cachetools import TTLCache
+
+from core.config import settings
+from models.interview import InterviewModel
+
+
+def feedback_key(level: Optional[str], qa_list: List[Dict[str, str]]) -> str:
+    """Content address of a finished interview: sha256 over the level and the Q&A pairs."""
+    payload = json.dumps(
+        [level or "", [[qa.get("question", "N/A"), qa.get("answer", "N/A")] for qa in qa_list]],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FeedbackCache:
+    """
+    Feedback results keyed by feedback_key(level, q_a_pair).
+
+    An entry is {"feedback": InterviewFeedback dict, "summary": FeedbackSummary
+    dict, "evaluations": per-answer QuestionFeedback dicts}, any of them None
+    until some step has produced it. It is stored in
+    state.feedback_cache, a server-only field persisted with the session (a
+    client can neither supply nor read it), and in a bounded in-process copy
+    for callers that only hold the Q&A. Because the key
+    covers the whole transcript, a changed answer can never hit a stale entry.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, state: InterviewModel, key: str) -> Optional[dict]:
+        entry = state.feedback_cache.get(key) or self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, state: InterviewModel, key: str, **fields) -> dict:
+        """Merge fields into the entry for key; entries for older transcripts are dropped from state."""
+        entry = {"feedback": None, "summary": None, "evaluations": None, **(state.feedback_cache.get(key) or self._cache.get(key) or {})}
+        entry.update({name: value for name, value in fields.items() if value is not None})
+        state.feedback_cache = {key: entry}
+        self._cache[key] = entry
+        return entry
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+feedback_cache = FeedbackCache(
+    maxsize=settings.FEEDBACK_CACHE_MAX_SIZE,
+    ttl=settings.FEEDBACK_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,142 @@
+# services/question_index.py
+import random
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.logger import get_logger
+from models.models import QuestionBank, QuestionType, DifficultyLevel
+
+log = get_logger("question_index")
+
+# (question_id, decoded question_data)
+IndexedQuestion = Tuple[int, dict]
+BucketKey = Tuple[QuestionType, DifficultyLevel]
+
+
+class QuestionIndex:
+    """
+    Process-wide, in-memory view of the question bank.
+
+    Questions are grouped by (QuestionType, DifficultyLevel) so picking the next
+    question is a random index into a list instead of an ORDER BY random() scan.
+    The whole snapshot is swapped atomically on refresh, so readers never lock.
+    """
+
+    def __init__(self, refresh_interval: float = 60.0, max_attempts: int = 8):
+        self.refresh_interval = refresh_interval
+        self.max_attempts = max_attempts
+        self._buckets: Dict[BucketKey, List[IndexedQuestion]] = {}
+        self._signature: Optional[Tuple[int, int]] = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._signature is not None
+
+    def size(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    @staticmethod
+    def _signature_query():
+        return select(func.count(QuestionBank.id), func.max(QuestionBank.id))
+
+    @staticmethod
+    def _rows_query():
+        return select(QuestionBank.id, QuestionBank.type, QuestionBank.difficulty, QuestionBank.question_data)
+
+    @staticmethod
+    def _normalize(signature) -> Tuple[int, int]:
+        # max(id) is NULL on an empty table
+        count, max_id = signature
+        return int(count or 0), int(max_id or 0)
+
+    def _load(self, signature, rows) -> None:
+        buckets: Dict[BucketKey, List[IndexedQuestion]] = {}
+        for q_id, q_type, difficulty, data in rows:
+            buckets.setdefault((QuestionType(q_type), DifficultyLevel(difficulty)), []).append((q_id, data or {}))
+
+        self._buckets = buckets
+        self._signature = self._normalize(signature)
+        self._last_check = time.monotonic()
+        log.info("QuestionIndex loaded %d questions in %d buckets", self._signature[0], len(buckets))
+
+    def _check_due(self) -> bool:
+        now = time.monotonic()
+        if now - self._last_check < self.refresh_interval:
+            return False
+        self._last_check = now
+        return True
+
+    def refresh(self, db: Session) -> None:
+        """Rebuild the snapshot from the database."""
+        with self._lock:
+            signature = db.execute(self._signature_query()).one()
+            self._load(signature, db.execute(self._rows_query()).all())
+
+    async def arefresh(self, db: AsyncSession) -> None:
+        """Async variant of refresh() for request handlers and graph nodes."""
+        signature = (await db.execute(self._signature_query())).one()
+        rows = (await db.execute(self._rows_query())).all()
+        with self._lock:
+            self._load(signature, rows)
+
+    def maybe_refresh(self, db: Session) -> None:
+        """
+        Cheap staleness check: at most once per refresh_interval compare the
+        row count / max id with the snapshot and reload only if they changed.
+        """
+        if not self.loaded:
+            self.refresh(db)
+        elif self._check_due() and self._normalize(db.execute(self._signature_query()).one()) != self._signature:
+            self.refresh(db)
+
+    async def amaybe_refresh(self, db: AsyncSession) -> None:
+        """Async variant of maybe_refresh()."""
+        if not self.loaded:
+            await self.arefresh(db)
+        elif self._check_due():
+            signature = self._normalize((await db.execute(self._signature_query())).one())
+            if signature != self._signature:
+                await self.arefresh(db)
+
+    def sample(
+        self,
+        types: Iterable[QuestionType],
+        level,
+        exclude_ids: Optional[Set[int]] = None,
+    ) -> Optional[IndexedQuestion]:
+        """
+        Pick a random question of the given types and level that is not in
+        exclude_ids. Expected O(1): the asked set of a session is tiny compared
+        to a bucket, so a few random probes almost always hit. Falls back to a
+        linear filter only when the candidates are nearly exhausted.
+        """
+        exclude_ids = exclude_ids or set()
+        level = DifficultyLevel(level)
+        buckets = [self._buckets.get((QuestionType(t), level), []) for t in types]
+        total = sum(len(bucket) for bucket in buckets)
+        if total == 0:
+            return None
+
+        for _ in range(self.max_attempts):
+            pos = random.randrange(total)
+            for bucket in buckets:
+                if pos < len(bucket):
+                    candidate = bucket[pos]
+                    break
+                pos -= len(bucket)
+            if candidate[0] not in exclude_ids:
+                return candidate
+
+        remaining = [q for bucket in buckets for q in bucket if q[0] not in exclude_ids]
+        return random.choice(remaining) if remaining else None
+
+
+question_index = QuestionIndex(refresh_interval=settings.QUESTION_INDEX_REFRESH_SECONDS)
@@ -0,0 +1,149 @@
+# services/question_pool.py
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Set, Tuple
+
+from core.config import settings
+from core.logger import get_logger
+from models.models import SessionType, DifficultyLevel
+from services.ai.client import llm_clients
+from services import ai_factory
+
+log = get_logger("question_pool")
+
+PoolKey = Tuple[SessionType, DifficultyLevel]
+
+
+class LLMQuestionPool:
+    """
+    Bounded pool of pre-generated LLM questions per (SessionType, DifficultyLevel).
+
+    A background refiller tops a pool up to high_watermark whenever it drops
+    below low_watermark. Questions older than max_age seconds are evicted so
+    candidates keep getting fresh ones. take() never calls the model itself:
+    on a miss the caller falls back to a live generation.
+    """
+
+    def __init__(self, low_watermark: int, high_watermark: int, max_age: float, enabled: bool = True):
+        self.low_watermark = low_watermark
+        self.high_watermark = max(high_watermark, low_watermark)
+        self.max_age = max_age
+        self.enabled = enabled
+        self._pools: Dict[PoolKey, Deque[Tuple[str, float]]] = {
+            (session_type, level): deque()
+            for session_type in SessionType
+            for level in DifficultyLevel
+        }
+        self._refills: Dict[PoolKey, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.generated = 0
+
+    @staticmethod
+    def _generator(session_type: SessionType):
+        if session_type == SessionType.hr:
+            return ai_factory.hr_ai, ai_factory.hr_ai.llm_generate_hr_question
+        return ai_factory.tech_ai, ai_factory.tech_ai.llm_generate_technical_question
+
+    def _evict_stale(self, pool: Deque[Tuple[str, float]]) -> None:
+        cutoff = time.monotonic() - self.max_age
+        while pool and pool[0][1] < cutoff:
+            pool.popleft()
+            self.evicted += 1
+
+    def take(self, session_type, level, exclude: Iterable[str] = ()) -> Optional[str]:
+        """Pop the oldest fresh question that this session has not seen yet."""
+        if not self.enabled:
+            return None
+
+        key = (SessionType(session_type), DifficultyLevel(level))
+        pool = self._pools[key]
+        self._evict_stale(pool)
+
+        exclude: Set[str] = set(exclude)
+        question = None
+        for i, (text, _) in enumerate(pool):
+            if text not in exclude:
+                question = text
+                del pool[i]
+                break
+
+        if question is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        if len(pool) < self.low_watermark:
+            self._schedule_refill(key)
+        return question
+
+    def _schedule_refill(self, key: PoolKey) -> None:
+        running = self._refills.get(key)
+        if running is not None and not running.done():
+            return
+        try:
+            with llm_clients.background():
+                self._refills[key] = asyncio.get_running_loop().create_task(self._refill(key))
+        except RuntimeError:
+            # no running loop (scripts / sync callers): nothing to schedule on
+            pass
+
+    async def _refill(self, key: PoolKey) -> None:
+        session_type, level = key
+        service, generate = self._generator(session_type)
+        if not service.is_ready():
+            return
+
+        pool = self._pools[key]
+        while True:
+            self._evict_stale(pool)
+            if len(pool) >= self.high_watermark:
+                return
+
+            pooled = [text for text, _ in pool]
+            try:
+                question = await generate(level.value, pooled)
+            except Exception as e:
+                log.warning("LLM pool refill failed for %s/%s: %s", session_type.value, level.value, e)
+                return
+
+            if not question or question in pooled:
+                # the model is repeating itself; try again on the next refill
+                return
+            pool.append((question, time.monotonic()))
+            self.generated += 1
+
+    def start(self) -> None:
+        """Fill every pool in the background, e.g. at application startup."""
+        if not self.enabled:
+            return
+        for key in self._pools:
+            self._schedule_refill(key)
+
+    async def stop(self) -> None:
+        tasks = list(self._refills.values())
+        self._refills.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "generated": self.generated,
+            "evicted": self.evicted,
+            "sizes": {f"{t.value}/{l.value}": len(pool) for (t, l), pool in self._pools.items()},
+        }
+
+
+llm_question_pool = LLMQuestionPool(
+    low_watermark=settings.LLM_POOL_LOW_WATERMARK,
+    high_watermark=settings.LLM_POOL_HIGH_WATERMARK,
+    max_age=settings.LLM_POOL_MAX_AGE_SECONDS,
+    enabled=settings.LLM_POOL_ENABLED,
+)
@@ -0,0 +1,166 @@
+# services/question_prefetch.py
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Optional
+
+from core.config import settings
+from core.logger import get_logger
+from database import AsyncSessionLocal
+from models.interview import InterviewModel
+from services.ai.client import llm_clients
+
+log = get_logger("question_prefetch")
+
+# (state, db) -> state with the next question selected
+QuestionSelector = Callable[[InterviewModel, object], Awaitable[InterviewModel]]
+
+
+@dataclass
+class PrefetchedQuestion:
+    question: str
+    question_id: Optional[int] = None
+    from_llm: bool = False
+
+
+@dataclass
+class _PrefetchEntry:
+    task: asyncio.Task
+    for_index: int        # current_question_index the question is meant for
+    after_question: str   # question the candidate is answering meanwhile
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class QuestionPrefetcher:
+    """
+    Speculatively selects question N+1 while the candidate is answering question N.
+
+    The selection only depends on which questions were already asked, never on the
+    answer text, so it can run on a copy of the state with a placeholder answer.
+    Entries are keyed by session_id and only used if the session is still exactly
+    where the prefetch assumed it would be; anything else falls back to a live fetch.
+    """
+
+    def __init__(self, ttl_seconds: float, enabled: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._entries: Dict[str, _PrefetchEntry] = {}
+        self._last_sweep = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+
+    def schedule(self, state: InterviewModel, select_next: QuestionSelector) -> None:
+        """Start producing the question that follows state.current_question."""
+        if not self.enabled or not state.session_id or not state.current_question:
+            return
+        # the next pass ends the interview, nothing to prefetch
+        if state.current_question_index + 1 >= state.total_questions:
+            self.cancel(state.session_id)
+            return
+
+        self._sweep()
+        self.cancel(state.session_id)
+
+        speculative = state.model_copy(deep=True)
+        speculative.q_a_pair.append({"question": state.current_question, "answer": ""})
+        speculative.current_question_index += 1
+
+        with llm_clients.background():
+            task = asyncio.create_task(self._produce(speculative, select_next))
+        self._entries[state.session_id] = _PrefetchEntry(
+            task=task,
+            for_index=speculative.current_question_index,
+            after_question=state.current_question,
+        )
+
+    async def _produce(self, speculative: InterviewModel, select_next: QuestionSelector) -> Optional[PrefetchedQuestion]:
+        llm_count = len(speculative.asked_llm_questions)
+        ids_count = len(speculative.asked_question_ids)
+        async with AsyncSessionLocal() as db:
+            result = await select_next(speculative, db)
+
+        if not result.current_question:
+            return None
+        return PrefetchedQuestion(
+            question=result.current_question,
+            question_id=result.current_question_id if len(result.asked_question_ids) > ids_count else None,
+            from_llm=len(result.asked_llm_questions) > llm_count,
+        )
+
+    async def take(self, state: InterviewModel) -> Optional[PrefetchedQuestion]:
+        """
+        Pop the prefetched question for this session if it still matches the state,
+        waiting for it when it is still in flight (that is never slower than
+        starting the same work from scratch). One still queued for a background
+        LLM slot is dropped so the caller fetches the question itself.
+        """
+        entry = self._entries.pop(state.session_id, None) if state.session_id else None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if (
+            entry.for_index != state.current_question_index
+            or entry.after_question != state.current_question
+            or llm_clients.queued_in_background(entry.task)
+        ):
+            entry.task.cancel()
+            self.misses += 1
+            return None
+
+        try:
+            prefetched = await entry.task
+        except Exception as e:
+            log.warning("Prefetch for session %s failed: %s", state.session_id, e)
+            prefetched = None
+
+        asked_texts = {qa["question"] for qa in (state.q_a_pair or [])}
+        if (
+            prefetched is None
+            or prefetched.question in asked_texts
+            or (prefetched.question_id is not None and prefetched.question_id in state.asked_question_ids)
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return prefetched
+
+    @staticmethod
+    def apply(state: InterviewModel, prefetched: PrefetchedQuestion) -> InterviewModel:
+        """Apply a prefetched question exactly like the live selection would."""
+        state.current_question_id = prefetched.question_id
+        if prefetched.from_llm:
+            state.asked_llm_questions.append(prefetched.question)
+        elif prefetched.question_id is not None:
+            state.asked_question_ids.append(prefetched.question_id)
+        state.current_question = prefetched.question
+        return state
+
+    def cancel(self, session_id: str) -> None:
+        entry = self._entries.pop(session_id, None)
+        if entry is not None:
+            entry.task.cancel()
+
+    def _sweep(self) -> None:
+        """Cancel prefetches of sessions that were abandoned mid-interview."""
+        now = time.monotonic()
+        if now - self._last_sweep < 60:
+            return
+        self._last_sweep = now
+        expired = [sid for sid, entry in self._entries.items() if now - entry.created_at > self.ttl_seconds]
+        for session_id in expired:
+            self.cancel(session_id)
+
+    async def shutdown(self) -> None:
+        tasks = [entry.task for entry in self._entries.values()]
+        self._entries.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+question_prefetcher = QuestionPrefetcher(
+    ttl_seconds=settings.SESSION_TIMEOUT_MINUTES * 60,
+    enabled=settings.QUESTION_PREFETCH_ENABLED,
+)
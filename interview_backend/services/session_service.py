@@ -1,50 +1,66 @@
 # services/session_service.py
-from sqlalchemy.orm import Session
+import asyncio
+import weakref
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.models import InterviewSession
 from models.models import QuestionAttempt
 from models.interview import InterviewModel
 from datetime import datetime, timezone
 from typing import Optional, Any
 
+# One lock per live session so two turns for the same session never interleave
+_session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def session_lock(session_id: str) -> asyncio.Lock:
+    lock = _session_locks.get(session_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _session_locks[session_id] = lock
+    return lock
+
+
+def active_session_count() -> int:
+    """Sessions with a turn in progress in this process (a lock only lives while a turn holds it)."""
+    return len(_session_locks)
+
+
 class SessionService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_session_by_id(self, session_id: str) -> Optional[InterviewSession]:
-        return self.db.query(InterviewSession).filter(InterviewSession.session_id == session_id).first()        
-
-    # def create_session(
-    #     self,
-    #     session_id: str,
-    #     user_id: int,
-    #     session_type,
-    #     level,
-    #     total_questions: int = 0,
-    #     state: Optional[dict] = None
-    # ) -> InterviewSession:
-    #     session = InterviewSession(
-    #         session_id=session_id,
-    #         user_id=user_id,
-    #         session_type=session_type,
-    #         level=level,
-    #         total_questions=total_questions,
-    #         state=state or {}
-    #     )
-    #     self.db.add(session)
-    #     self.db.commit()
-    #     self.db.refresh(session)
-    #     return session
+    async def get_session_by_id(self, session_id: str) -> Optional[InterviewSession]:
+        result = await self.db.execute(select(InterviewSession).where(InterviewSession.session_id == session_id))
+        return result.scalars().first()
 
+    async def load_state(self, session_id: str) -> Optional[InterviewModel]:
+        obj = await self.get_session_by_id(session_id)
+        if obj is None or not obj.state:
+            return None
+        return InterviewModel(**obj.state)
 
+    async def save_state(self, state: InterviewModel) -> InterviewSession:
+        """
+        Persist the full interview state for state.session_id,
+        creating the session row on the first turn. Turns on an existing
+        session run on load_state() under session_lock(), never on a
+        client's copy of the state.
+        """
+        obj = await self.get_session_by_id(state.session_id)
+        if obj is None:
+            obj = InterviewSession(
+                session_id=state.session_id,
+                user_id=state.user_id,
+                session_type=state.session_type,
+                level=state.level,
+            )
+            self.db.add(obj)
 
-    # def update_session_state(self, session_id: str, state: InterviewModel) -> InterviewSession:
-    #     obj = self.get_session_by_id(session_id)
-    #     if obj:
-    #         obj.state = state.dict()
-    #         self.db.commit()
-    #         self.db.refresh(obj)
-    #         return obj
-    #     raise ValueError("Session not found")
+        obj.total_questions = state.total_questions
+        obj.state = state.model_dump(mode="json")
+        await self.db.commit()
+        return obj
 
     # def store_question_attempt(
     #     self,
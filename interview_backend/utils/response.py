@@ -1,4 +1,5 @@
 from fastapi.responses import JSONResponse
+from core.responses import CompactResponse
 from typing import Any, Optional
 from pydantic import BaseModel
 
@@ -25,7 +26,7 @@ def standardize_response(
     if isinstance(data, BaseModel): 
         data = data.model_dump()
 
-    return JSONResponse(
+    return CompactResponse(
         status_code=status_code,
         content={
             "success": success,
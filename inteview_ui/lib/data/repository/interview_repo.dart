@@ -28,7 +28,7 @@ class InterviewRepoImpl implements IInterviewRepository {
       print("📦 Request Body: $requestBody");
 
       // Call API
-      final response = await _apiClient.post(ApiEndpoints.interview, requestBody);
+      final response = await _apiClient.post(ApiEndpoints.interview, requestBody, requiresAuth: true);
 
       print("📥 [InterviewRepo] Raw Response: $response");
 